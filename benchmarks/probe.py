@@ -0,0 +1,111 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Runs one of the RDBMS Diff entry points in the current process and collects metrics about
+its execution. The probe is started as a separate process by the benchmark runner, so that
+each measurement starts with a fresh interpreter (i.e. the peak memory of one entry point
+is not affected by another entry point). The numbers of statements and fetched rows are taken
+from the query statistics collected by the comparison tools themselves.
+
+Optionally, the number of SQL statements executed during the given phase is checked against a
+budget (max. number of statements per table and per database, see QueryStatisticsSnapshot).
+
+Usage: python -m benchmarks.probe [--statement-budget <phase>:<table count>:<max. statements per table>]
+       <metrics-file> <entry-point-module> [entry point arguments...]
+"""
+
+from importlib import import_module
+from json import dump
+from resource import (
+    RUSAGE_SELF,
+    getrusage,
+)
+from sys import argv
+from time import perf_counter
+from typing import (
+    Any,
+    Optional,
+)
+
+
+def _total_counters() -> Any:
+    """
+    Returns the counters collected by the instrumentation of the database engines (see
+    rdbmsdiff.foundation.QueryStatistics), summed up for all phases and both databases.
+    """
+    from rdbmsdiff.foundation import (
+        QueryCounters,
+        get_query_statistics,
+    )
+
+    result = QueryCounters()
+    for counters in get_query_statistics().snapshot().counters.values():
+        result += counters
+    return result
+
+
+def _check_statement_budget(budget: str) -> Optional[str]:
+    """
+    Returns the description of the violation of the given budget, or None if the budget is kept.
+    """
+    from rdbmsdiff.foundation import (
+        Phase,
+        QueryBudgetExceededError,
+        get_query_statistics,
+    )
+
+    phase, table_count, max_statements_per_table = budget.split(":")
+    try:
+        get_query_statistics().snapshot().assert_statement_budget(Phase(phase), int(table_count), float(max_statements_per_table))
+    except QueryBudgetExceededError as e:
+        return str(e)
+    return None
+
+
+def main() -> None:
+    statement_budget = None
+    if argv[1] == "--statement-budget":
+        statement_budget = argv[2]
+        del argv[1:3]
+    metrics_file = argv[1]
+    module_name = argv[2]
+    del argv[1:3]
+    argv[0] = module_name
+
+    start_time = perf_counter()
+    module = import_module(module_name)
+    module.main()
+    duration_sec = perf_counter() - start_time
+    statement_budget_violation = _check_statement_budget(statement_budget) if statement_budget else None
+    counters = _total_counters()
+
+    with open(metrics_file, "w") as file:
+        dump({
+            "main_duration_sec": duration_sec,
+            "query_count": counters.statement_count,
+            # the rows fetched by the reflection of the meta-information are not counted
+            "rows_transferred": counters.row_count,
+            # Linux reports kilobytes (macOS reports bytes)
+            "peak_memory_kb": getrusage(RUSAGE_SELF).ru_maxrss,
+            "statement_budget_violation": statement_budget_violation,
+        }, file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,378 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    RawTextHelpFormatter,
+)
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from datetime import datetime
+from json import (
+    dump,
+    load,
+)
+from os import (
+    environ,
+    makedirs,
+)
+from os.path import (
+    abspath,
+    join,
+)
+from subprocess import run
+from sys import (
+    executable,
+    exit,
+)
+from tempfile import mkdtemp
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .synthetic_data import (
+    SyntheticSchemaProperties,
+    generate_database,
+)
+
+
+_ENTRY_POINTS = {
+    "schema": "rdbmsdiff.schema.main",
+    "data": "rdbmsdiff.data.main",
+    "recordcount": "rdbmsdiff.recordcount.main",
+}
+
+# the phase (see rdbmsdiff.foundation.Phase) whose statements are subject to the statement budget
+_BUDGETED_PHASES = {
+    "schema": "Reflection",
+    "data": "Validation",
+    "recordcount": "Counting",
+}
+
+# metrics that are deterministic for a given synthetic schema, any increase is a regression
+_EXACT_METRICS = ("query_count", "rows_transferred")
+
+# metrics subject to noise, an increase is only a regression if it exceeds the tolerance
+_NOISY_METRICS = ("wall_time_sec", "peak_memory_kb", "startup_wall_time_sec", "startup_import_ms")
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    entry_point: str
+    exit_code: int
+    wall_time_sec: float
+    main_duration_sec: float
+    query_count: int
+    rows_transferred: int
+    peak_memory_kb: int
+    startup_wall_time_sec: float
+    startup_import_ms: float
+    statement_budget_violation: Optional[str] = None
+
+
+def create_cmd_line_args_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="RDBMS Diff Benchmark", formatter_class=RawTextHelpFormatter, epilog=epilog())
+
+    parser.add_argument(
+        "-b", "--backend",
+        dest="backend",
+        choices=["sqlite", "postgresql", "mariadb"],
+        default="sqlite",
+        help="the database engine hosting the synthetic databases (default: sqlite)"
+    )
+    parser.add_argument(
+        "--source-url",
+        dest="source_url",
+        default=None,
+        help="URL of the source database (mandatory unless the backend is sqlite)"
+    )
+    parser.add_argument(
+        "--target-url",
+        dest="target_url",
+        default=None,
+        help="URL of the target database (mandatory unless the backend is sqlite)"
+    )
+    parser.add_argument(
+        "--schema",
+        dest="schema",
+        default=None,
+        help="the schema the synthetic tables are to be created in (mandatory unless the backend is sqlite)"
+    )
+    parser.add_argument("--tables", dest="table_count", type=int, default=10, help="number of tables (default: 10)")
+    parser.add_argument("--columns", dest="column_count", type=int, default=9, help="number of columns per table, excluding the PK (default: 9)")
+    parser.add_argument("--rows", dest="row_count", type=int, default=1000, help="number of rows per table (default: 1000)")
+    parser.add_argument(
+        "--discrepancy-rate",
+        dest="discrepancy_rate",
+        type=float,
+        default=0.01,
+        help="fraction of target rows with a modified column value (default: 0.01)"
+    )
+    parser.add_argument(
+        "--missing-rows",
+        dest="missing_row_count",
+        type=int,
+        default=1,
+        help="number of rows per table missing in the target database (default: 1)"
+    )
+    parser.add_argument(
+        "--schema-drift",
+        dest="schema_drift",
+        default=False,
+        action="store_true",
+        help="if specified, one column is missing in the target database"
+    )
+    parser.add_argument("--seed", dest="seed", type=int, default=42, help="seed of the data generator (default: 42)")
+    parser.add_argument(
+        "-e", "--entry-points",
+        dest="entry_points",
+        default=",".join(_ENTRY_POINTS.keys()),
+        help="comma separated list of entry points to be benchmarked (default: schema,data,recordcount)"
+    )
+    parser.add_argument(
+        "--skip-generation",
+        dest="skip_generation",
+        default=False,
+        action="store_true",
+        help="if specified, the synthetic databases are expected to exist already"
+    )
+    parser.add_argument(
+        "-w", "--work-dir",
+        dest="work_dir",
+        default=None,
+        help="directory for the SQLite databases, configuration and reports (default: new temporary directory)"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        dest="output_file",
+        default=None,
+        help="optional name of a JSON file the results are to be written to"
+    )
+    parser.add_argument(
+        "--baseline",
+        dest="baseline_file",
+        default=None,
+        help="optional JSON file with results of a previous run the current results are to be compared with"
+    )
+    parser.add_argument(
+        "--tolerance",
+        dest="tolerance",
+        type=float,
+        default=0.2,
+        help="tolerated relative increase of duration and memory compared to the baseline (default: 0.2)"
+    )
+    parser.add_argument(
+        "--statement-budget",
+        dest="statement_budget",
+        type=float,
+        default=None,
+        help="optional max. number of SQL statements per table and per database executed by the main phase\n"
+             "of each comparison tool (validation, counting, reflection of the schema comparison)"
+    )
+
+    return parser
+
+
+def epilog() -> str:
+    return """
+Generates two synthetic databases (source and target, the target with injected discrepancies),
+runs the selected comparison tools against them and measures their end-to-end duration, number
+of SQL statements, number of rows fetched and peak memory. In addition, the startup of each tool
+(the display of the help) is measured, including the import time reported by -X importtime. The exit code is 1 if a regression
+compared to the baseline has been detected, or if a comparison tool has exceeded the statement budget.
+
+For PostgreSQL and MariaDB, the URLs can contain the ${password} placeholder, the passwords are
+read from the environment variables RDBMS_DIFF_SOURCE_DB_PASSWORD and RDBMS_DIFF_TARGET_DB_PASSWORD.
+
+Example:
+python -m benchmarks.run --tables 50 --rows 10000 -o results.json --baseline baseline.json
+"""
+
+
+def parse_cmd_line_args() -> Namespace:
+    parser = create_cmd_line_args_parser()
+    params = parser.parse_args()
+    if params.backend != "sqlite" and not (params.source_url and params.target_url and params.schema):
+        parser.error(f"--source-url, --target-url and --schema are mandatory for the {params.backend} backend")
+    return params
+
+
+def _database_urls(params: Namespace, work_dir: str) -> Tuple[str, str, str]:
+    if params.backend == "sqlite":
+        return f"sqlite:///{join(work_dir, 'source.db')}", f"sqlite:///{join(work_dir, 'target.db')}", "main"
+    return params.source_url, params.target_url, params.schema
+
+
+def _write_config(work_dir: str, source_url: str, target_url: str, schema: str) -> str:
+    filename = join(work_dir, "benchmark.ini")
+    with open(filename, "w") as file:
+        file.write(f"[DB.Source]\nURL = {source_url}\nSchema = {schema}\n\n")
+        file.write(f"[DB.Target]\nURL = {target_url}\nSchema = {schema}\n")
+    return filename
+
+
+def _entry_point_args(entry_point: str, config_file: str, work_dir: str) -> List[str]:
+    if entry_point == "schema":
+        return [config_file, join(work_dir, "schema-diff.json")]
+    if entry_point == "data":
+        return [config_file, join(work_dir, "data-diff.txt")]
+    return [config_file]
+
+
+def _measure_startup(entry_point: str) -> Tuple[float, float]:
+    """
+    Measures the startup of the given entry point, i.e. the time needed to display the help.
+    Returns the wall time (in seconds), and the overall import time (in milliseconds) reported
+    by the -X importtime option of the interpreter.
+    """
+    command = [executable, "-X", "importtime", "-m", _ENTRY_POINTS[entry_point], "-h"]
+    start_time = perf_counter()
+    completed_process = run(command, capture_output=True, text=True)
+    wall_time_sec = perf_counter() - start_time
+    # each line looks like "import time:  <self [us]> | <cumulative [us]> | <module>"
+    import_time_us = 0
+    for line in completed_process.stderr.splitlines():
+        if line.startswith("import time:"):
+            self_time = line[len("import time:"):].split("|")[0].strip()
+            if self_time.isdigit():
+                import_time_us += int(self_time)
+    return wall_time_sec, import_time_us / 1000
+
+
+def _run_entry_point(entry_point: str, config_file: str, work_dir: str, table_count: int, statement_budget: Optional[float]) -> BenchmarkResult:
+    metrics_file = join(work_dir, f"{entry_point}-metrics.json")
+    command = [executable, "-m", "benchmarks.probe"]
+    if statement_budget is not None:
+        command += ["--statement-budget", f"{_BUDGETED_PHASES[entry_point]}:{table_count}:{statement_budget}"]
+    command += [metrics_file, _ENTRY_POINTS[entry_point]]
+    command += _entry_point_args(entry_point, config_file, work_dir)
+    with open(join(work_dir, f"{entry_point}-output.txt"), "w") as output:
+        start_time = perf_counter()
+        completed_process = run(command, stdout=output, stderr=output)
+        wall_time_sec = perf_counter() - start_time
+    with open(metrics_file) as file:
+        metrics = load(file)
+    startup_wall_time_sec, startup_import_ms = _measure_startup(entry_point)
+    return BenchmarkResult(
+        entry_point=entry_point,
+        exit_code=completed_process.returncode,
+        wall_time_sec=wall_time_sec,
+        main_duration_sec=metrics["main_duration_sec"],
+        query_count=metrics["query_count"],
+        rows_transferred=metrics["rows_transferred"],
+        peak_memory_kb=metrics["peak_memory_kb"],
+        startup_wall_time_sec=startup_wall_time_sec,
+        startup_import_ms=startup_import_ms,
+        statement_budget_violation=metrics.get("statement_budget_violation"),
+    )
+
+
+def find_regressions(results: Sequence[Dict[str, Any]], baseline: Sequence[Dict[str, Any]], tolerance: float) -> Tuple[str, ...]:
+    baseline_by_entry_point = {result["entry_point"]: result for result in baseline}
+    regressions = []
+    for result in results:
+        baseline_result = baseline_by_entry_point.get(result["entry_point"])
+        if baseline_result is None:
+            continue
+        for metric in _EXACT_METRICS + _NOISY_METRICS:
+            if metric not in baseline_result or metric not in result:
+                continue
+            allowed = baseline_result[metric] * (1 + tolerance) if metric in _NOISY_METRICS else baseline_result[metric]
+            if result[metric] > allowed:
+                regressions.append(f"{result['entry_point']}: {metric} increased from {baseline_result[metric]} to {result[metric]}")
+    return tuple(regressions)
+
+
+def print_results(results: Sequence[BenchmarkResult]) -> None:
+    print()
+    print(f"{'Entry point':<12} {'Exit':>4} {'Wall time [s]':>14} {'Queries':>9} {'Rows':>10} {'Peak mem [KB]':>14} {'Startup [s]':>12} {'Imports [ms]':>13}")
+    for result in results:
+        print(f"{result.entry_point:<12} {result.exit_code:>4} {result.wall_time_sec:>14.3f} {result.query_count:>9} {result.rows_transferred:>10} {result.peak_memory_kb:>14} {result.startup_wall_time_sec:>12.3f} {result.startup_import_ms:>13.1f}")
+
+
+def main() -> None:
+    params = parse_cmd_line_args()
+    work_dir = abspath(params.work_dir) if params.work_dir else mkdtemp(prefix="rdbmsdiff-benchmark-")
+    makedirs(work_dir, exist_ok=True)
+    source_url, target_url, schema = _database_urls(params, work_dir)
+    if params.backend == "sqlite":
+        # the comparison tools insist on passwords, even if the URLs do not use them
+        environ.setdefault("RDBMS_DIFF_SOURCE_DB_PASSWORD", "N/A")
+        environ.setdefault("RDBMS_DIFF_TARGET_DB_PASSWORD", "N/A")
+
+    properties = SyntheticSchemaProperties(
+        table_count=params.table_count,
+        column_count=params.column_count,
+        row_count=params.row_count,
+        discrepancy_rate=params.discrepancy_rate,
+        missing_row_count=params.missing_row_count,
+        schema_drift=params.schema_drift,
+        seed=params.seed,
+    )
+    if not params.skip_generation:
+        print(f"Generating synthetic databases in {work_dir}...")
+        generate_database(source_url.replace("${password}", environ.get("RDBMS_DIFF_SOURCE_DB_PASSWORD", "")), schema if params.backend != "sqlite" else None, properties, is_target=False)
+        generate_database(target_url.replace("${password}", environ.get("RDBMS_DIFF_TARGET_DB_PASSWORD", "")), schema if params.backend != "sqlite" else None, properties, is_target=True)
+
+    config_file = _write_config(work_dir, source_url, target_url, schema)
+    results = []
+    for entry_point in params.entry_points.split(","):
+        entry_point = entry_point.strip()
+        print(f"Running {entry_point}...")
+        results.append(_run_entry_point(entry_point, config_file, work_dir, params.table_count, params.statement_budget))
+    print_results(results)
+    budget_violations = [f"{result.entry_point}: {result.statement_budget_violation}" for result in results if result.statement_budget_violation]
+    for budget_violation in budget_violations:
+        print(f"STATEMENT BUDGET EXCEEDED: {budget_violation}")
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "backend": params.backend,
+        "properties": asdict(properties),
+        "results": [asdict(result) for result in results],
+    }
+    if params.output_file:
+        with open(params.output_file, "w") as file:
+            dump(report, file, indent=4)
+        print(f"Results written to {params.output_file}")
+
+    if params.baseline_file:
+        with open(params.baseline_file) as file:
+            baseline = load(file)
+        regressions = find_regressions(report["results"], baseline["results"], params.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            exit(1)
+        print("No regression compared to the baseline")
+
+    if budget_violations:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+)
+from decimal import Decimal
+from random import Random
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    create_engine,
+)
+from sqlalchemy.sql.sqltypes import (
+    BIGINT,
+    BOOLEAN,
+    DATE,
+    FLOAT,
+    INTEGER,
+    NUMERIC,
+    TEXT,
+    TIMESTAMP,
+    VARCHAR,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticSchemaProperties:
+    table_count: int
+    column_count: int
+    row_count: int
+    discrepancy_rate: float
+    missing_row_count: int
+    schema_drift: bool
+    seed: int
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnTemplate:
+    name_prefix: str
+    datatype_factory: Callable[[], Any]
+    value_factory: Callable[[Random, int], Any]
+    modify: Callable[[Any], Any]
+
+
+_BASE_TIMESTAMP = datetime(2020, 1, 1)
+
+_COLUMN_TEMPLATES = (
+    _ColumnTemplate("int_col", INTEGER, lambda r, i: r.randint(-1_000_000, 1_000_000), lambda v: v + 1),
+    _ColumnTemplate("varchar_col", lambda: VARCHAR(64), lambda r, i: f"value-{r.randint(0, 10 ** 9)}", lambda v: v + "x"),
+    _ColumnTemplate("numeric_col", lambda: NUMERIC(12, 2), lambda r, i: Decimal(r.randint(0, 10 ** 9)) / 100, lambda v: v + 1),
+    _ColumnTemplate("bool_col", BOOLEAN, lambda r, i: r.random() < 0.5, lambda v: not v),
+    _ColumnTemplate("timestamp_col", TIMESTAMP, lambda r, i: _BASE_TIMESTAMP + timedelta(seconds=r.randint(0, 10 ** 8)), lambda v: v + timedelta(seconds=1)),
+    _ColumnTemplate("bigint_col", BIGINT, lambda r, i: r.randint(0, 2 ** 62), lambda v: v - 1),
+    _ColumnTemplate("float_col", FLOAT, lambda r, i: r.random() * 1000, lambda v: v * 2 + 1),
+    _ColumnTemplate("date_col", DATE, lambda r, i: date(2000, 1, 1) + timedelta(days=r.randint(0, 10_000)), lambda v: v + timedelta(days=1)),
+    _ColumnTemplate("text_col", TEXT, lambda r, i: f"text-{i}-" + "lorem ipsum " * r.randint(1, 20), lambda v: v.upper()),
+)
+
+_INSERT_BATCH_SIZE = 5000
+
+
+def _column_templates(properties: SyntheticSchemaProperties) -> Tuple[_ColumnTemplate, ...]:
+    return tuple(_COLUMN_TEMPLATES[index % len(_COLUMN_TEMPLATES)] for index in range(properties.column_count))
+
+
+def _drops_last_column(properties: SyntheticSchemaProperties, table_index: int, is_target: bool) -> bool:
+    # with schema drift enabled, the last column of the first table is missing in the target database
+    return is_target and properties.schema_drift and table_index == 0
+
+
+def _create_table(meta_data: MetaData, table_index: int, templates: Tuple[_ColumnTemplate, ...], drop_last_column: bool) -> Table:
+    columns = [Column("id", INTEGER, primary_key=True, autoincrement=False)]
+    for column_index, template in enumerate(templates):
+        if drop_last_column and column_index == len(templates) - 1:
+            continue
+        columns.append(Column(f"{template.name_prefix}_{column_index}", template.datatype_factory(), nullable=True))
+    return Table(f"bench_table_{table_index:04}", meta_data, *columns)
+
+
+def _generate_rows(properties: SyntheticSchemaProperties, table_index: int, templates: Tuple[_ColumnTemplate, ...]) -> List[Dict[str, Any]]:
+    random = Random(properties.seed + table_index)
+    rows = []
+    for row_id in range(1, properties.row_count + 1):
+        row = {"id": row_id}
+        for column_index, template in enumerate(templates):
+            # roughly every 20th value is NULL so that the null value validators have some work to do
+            row[f"{template.name_prefix}_{column_index}"] = None if random.random() < 0.05 else template.value_factory(random, row_id)
+        rows.append(row)
+    return rows
+
+
+def _inject_discrepancies(properties: SyntheticSchemaProperties, table_index: int, templates: Tuple[_ColumnTemplate, ...], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    random = Random(-(properties.seed + table_index))
+    if properties.missing_row_count > 0 and rows:
+        missing_ids = set(random.sample(range(1, len(rows) + 1), min(properties.missing_row_count, len(rows))))
+        rows = [row for row in rows if row["id"] not in missing_ids]
+    if not templates:
+        return rows
+    for row in rows:
+        if random.random() >= properties.discrepancy_rate:
+            continue
+        column_index = random.randrange(len(templates))
+        name = f"{templates[column_index].name_prefix}_{column_index}"
+        if row[name] is not None:
+            row[name] = templates[column_index].modify(row[name])
+    return rows
+
+
+def generate_database(url: str, schema: Optional[str], properties: SyntheticSchemaProperties, is_target: bool) -> None:
+    """
+    Creates the synthetic tables in the given database and fills them with data. The data is
+    deterministic (given by the seed), so the source and the target database only differ by
+    the discrepancies injected to the target database.
+    """
+    engine = create_engine(url)
+    meta_data = MetaData(schema=schema)
+    templates = _column_templates(properties)
+    tables = []
+    for table_index in range(properties.table_count):
+        tables.append(_create_table(meta_data, table_index, templates, _drops_last_column(properties, table_index, is_target)))
+    meta_data.drop_all(engine)
+    meta_data.create_all(engine)
+
+    with engine.begin() as connection:
+        for table_index, table in enumerate(tables):
+            rows = _generate_rows(properties, table_index, templates)
+            if is_target:
+                rows = _inject_discrepancies(properties, table_index, templates, rows)
+            if _drops_last_column(properties, table_index, is_target):
+                dropped_column = f"{templates[-1].name_prefix}_{len(templates) - 1}"
+                for row in rows:
+                    del row[dropped_column]
+            for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+                connection.execute(table.insert(), rows[start:start + _INSERT_BATCH_SIZE])
+    engine.dispose()
@@ -0,0 +1,120 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from dataclasses import replace
+from typing import (
+    Dict,
+    Sequence,
+    Tuple,
+)
+
+from rich.console import Console
+from rich.padding import Padding
+
+from rdbmsdiff.data.comparison import (
+    create_summary_table as create_data_summary_table,
+    validate,
+)
+from rdbmsdiff.foundation import (
+    Configuration,
+    DBSchema,
+    create_query_statistics_table,
+    get_query_statistics,
+    read_db_meta_data,
+)
+from rdbmsdiff.recordcount.comparison import (
+    ComparisonResult,
+    RecordCountComparison,
+    create_comparison_results_table,
+)
+from rdbmsdiff.schema.diff import DBSchemaDiff
+from rdbmsdiff.schema.report import write_report
+from rdbmsdiff.schema.summary import create_summary_table as create_schema_summary_table
+
+
+def prune_tables(source_db_meta_data: DBSchema, target_db_meta_data: DBSchema, record_counts: Sequence[ComparisonResult]) -> Tuple[DBSchema, Dict[str, str]]:
+    """
+    Uses the outcome of the schema and record count comparison in order to reduce the work of the
+    data comparison. Columns missing in the target database, and columns whose data types cannot be
+    reconciled (e.g. string vs. integer) are not validated. Tables without any comparable column,
+    and tables which are empty in both databases are not validated at all. Returns the meta-
+    information of the source database reduced accordingly, and the reasons for the skipped tables.
+    """
+    target_tables = {table.name: table for table in target_db_meta_data.tables}
+    empty_tables = {result.table for result in record_counts if result.source_record_count == 0 and result.target_record_count == 0}
+    pruned_tables = []
+    skipped_tables = {}
+    for table in source_db_meta_data.tables:
+        target_table = target_tables.get(table.name)
+        if target_table is None:
+            # reported as missing table by the data comparison
+            pruned_tables.append(table)
+            continue
+        if table.name in empty_tables:
+            skipped_tables[table.name] = "empty in both databases"
+            continue
+        target_columns = target_table.columns_as_dict
+        comparable_columns = tuple(
+            column for column in table.columns
+            if column.name in target_columns and column.type_category is target_columns[column.name].type_category
+        )
+        if not comparable_columns:
+            skipped_tables[table.name] = "no comparable columns"
+            continue
+        pruned_tables.append(replace(table, columns=comparable_columns))
+    return replace(source_db_meta_data, tables=tuple(pruned_tables)), skipped_tables
+
+
+def compare_all(config: Configuration, schema_diff_report: str, data_report: str, drill_down: bool, console: Console) -> Console:
+    """
+    Runs the schema comparison, the record count comparison and the data comparison, and returns
+    a console with the recorded summary of all comparisons.
+    """
+    # the meta-information is read just once, and it is shared by all comparisons
+    source_db_meta_data = read_db_meta_data(config.source_db_config)
+    target_db_meta_data = read_db_meta_data(config.target_db_config)
+
+    schema_diff = DBSchemaDiff(source_schema=source_db_meta_data, target_schema=target_db_meta_data)
+    write_report(schema_diff, schema_diff_report)
+
+    table_names = (
+        {table.name for table in source_db_meta_data.tables},
+        {table.name for table in target_db_meta_data.tables},
+    )
+    record_count_comparison = RecordCountComparison(config, console, drill_down, table_names)
+    record_count_comparison.run()
+
+    # the data comparison is not started if the record count comparison has been interrupted
+    data_statistics = None
+    if not record_count_comparison.interrupted:
+        pruned_source_db_meta_data, skipped_tables = prune_tables(source_db_meta_data, target_db_meta_data, record_count_comparison.results)
+        for table_name, reason in sorted(skipped_tables.items()):
+            console.print(f"{table_name} skipped by data comparison ({reason})")
+        data_statistics = validate(config, pruned_source_db_meta_data, target_db_meta_data, data_report)
+
+    summary_console = Console(record=True, highlight=False)
+    summary_console.print()
+    summary_console.print(Padding(create_schema_summary_table(schema_diff), (1, 2)))
+    summary_console.print(Padding(create_comparison_results_table(record_count_comparison.results, record_count_comparison.interrupted), (0, 2, 1, 2)))
+    if data_statistics is not None:
+        summary_console.print(Padding(create_data_summary_table(data_statistics), (0, 2, 1, 2)))
+    summary_console.print(Padding(create_query_statistics_table(get_query_statistics().snapshot()), (0, 2)))
+    summary_console.print()
+    summary_console.print(f"Source DB: [cyan]{config.source_db_config.url_without_password}[/], schema [cyan]{config.source_db_config.schema}[/]")
+    summary_console.print(f"Target DB: [cyan]{config.target_db_config.url_without_password}[/], schema [cyan]{config.target_db_config.schema}[/]")
+    return summary_console
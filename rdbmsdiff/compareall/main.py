@@ -0,0 +1,110 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    RawTextHelpFormatter,
+)
+
+from rdbmsdiff.foundation import (
+    ReadConfigurationError,
+    epilog,
+    handle_configuration_error,
+    handle_general_error,
+    print_banner,
+    read_config,
+)
+
+
+def create_cmd_line_args_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="RDBMS Schema, Record Count and Data Comparison Tool", formatter_class=RawTextHelpFormatter, epilog=epilog())
+
+    # positional mandatory arguments
+    parser.add_argument(
+        "config_file",
+        help="the name of the configuration file containing the connection strings and usernames"
+    )
+    parser.add_argument(
+        "schema_diff_report",
+        help="the name of the output JSON file the detailed outcome of the schema comparison is to be written to"
+    )
+    parser.add_argument(
+        "data_report",
+        help="the name of the output text file the outcome of the data comparison is to be written to"
+    )
+
+    # optional arguments
+    parser.add_argument(
+        "-p", "--ask-for-passwords",
+        dest="ask_for_passwords",
+        default=False,
+        action="store_true",
+        help="if specified, the user will be asked for passwords (the passwords will not be read from env. variables)"
+    )
+    parser.add_argument(
+        "-s", "--summary-html",
+        dest="summary_html_file",
+        default=None,
+        help="optional name of an HTML output file the summary of the comparison is to be written to"
+    )
+    parser.add_argument(
+        "-d", "--drill-down",
+        dest="drill_down",
+        default=False,
+        action="store_true",
+        help="if specified, the key ranges (and keys) responsible for different record counts will be localized"
+    )
+
+    return parser
+
+
+def parse_cmd_line_args() -> Namespace:
+    parser = create_cmd_line_args_parser()
+    params = parser.parse_args()
+    return params
+
+
+def main() -> None:
+    cmd_line_args = parse_cmd_line_args()
+    # the comparisons (SQLAlchemy, rich) are imported once the command line has been parsed,
+    # so that the help and invalid command line arguments are reported without delay
+    from rich.console import Console
+
+    from rdbmsdiff.data.client_hashing import shutdown_client_hasher
+    from rdbmsdiff.foundation import dispose_db_engines
+    from .comparison import compare_all
+
+    try:
+        print_banner()
+        config = read_config(cmd_line_args.config_file, cmd_line_args.ask_for_passwords)
+        console = Console(record=False, highlight=False)
+        summary_console = compare_all(config, cmd_line_args.schema_diff_report, cmd_line_args.data_report, cmd_line_args.drill_down, console)
+        if cmd_line_args.summary_html_file:
+            summary_console.save_html(cmd_line_args.summary_html_file)
+    except ReadConfigurationError as e:
+        handle_configuration_error(e)
+    except Exception as e:
+        handle_general_error(e)
+    finally:
+        shutdown_client_hasher()
+        dispose_db_engines()
+
+
+if __name__ == "__main__":
+    main()
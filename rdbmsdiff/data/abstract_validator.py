@@ -18,24 +18,48 @@
 
 from abc import ABC
 from abc import abstractmethod
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor
+from random import uniform
+from threading import (
+    Event,
+    Lock,
+    Timer,
+)
+from time import sleep
 from typing import (
     Any,
+    Callable,
+    Dict,
+    Optional,
     Sequence,
+    Set,
+    Tuple,
+    TypeVar,
 )
 
-from sqlalchemy import create_engine
 from sqlalchemy import (
     Engine,
-    MetaData,
+    text,
+)
+from sqlalchemy.engine import (
+    Result,
+    Row,
 )
-from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
 
 from rdbmsdiff.foundation import (
     Configuration,
     DatabaseProperties,
     DBColumn,
-    DBTable
+    DBTable,
+    DatabaseRole,
+    Phase,
+    SQLDialect,
+    ValidationProperties,
+    get_concurrency_limiter,
+    get_db_engine,
+    get_dialect,
+    record_fetched_rows,
 )
 
 from .validation_details import (
@@ -45,25 +69,174 @@ from .validation_details import (
 )
 
 
-class AbstractValidator(ABC):
+T = TypeVar("T")
+
+# number of rows fetched at once by streamed statements
+_STREAMED_BATCH_SIZE = 10_000
+
+
+class QueryCancelledError(Exception):
+    ...
+
+
+class _QueryCancellation:
+    """
+    Allows to cancel the query running in one of the databases when the query in the other
+    database fails. The result of the validation is clear in such case, so there is no reason
+    to wait for the (potentially long running) other query.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._cancelled = False
+        self._running_queries: Dict[DatabaseRole, Tuple[SQLDialect, Engine, Any]] = {}
+        self._cancelled_roles: Set[DatabaseRole] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def was_cancelled(self, db_properties: DatabaseProperties) -> bool:
+        with self._lock:
+            return db_properties.role in self._cancelled_roles
+
+    def register(self, db_properties: DatabaseProperties, dialect: SQLDialect, engine: Engine, dbapi_connection: Any) -> None:
+        with self._lock:
+            if self._cancelled:
+                self._cancelled_roles.add(db_properties.role)
+                raise QueryCancelledError()
+            self._running_queries[db_properties.role] = (dialect, engine, dbapi_connection)
+
+    def unregister(self, db_properties: DatabaseProperties) -> None:
+        with self._lock:
+            self._running_queries.pop(db_properties.role, None)
+
+    def cancel_other_queries(self, db_properties: DatabaseProperties) -> None:
+        with self._lock:
+            self._cancelled = True
+            other_roles = [role for role in self._running_queries if role is not db_properties.role]
+            other_queries = [self._running_queries[role] for role in other_roles]
+            self._cancelled_roles.update(other_roles)
+        for dialect, engine, dbapi_connection in other_queries:
+            try:
+                dialect.cancel_query(engine, dbapi_connection)
+            except Exception:
+                # the cancellation is just an optimization, the other query can complete normally
+                pass
+
+
+def _shared(source_value: str, target_value: str) -> str:
+    return source_value if source_value == target_value else target_value
 
-    _EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+class AbstractValidator(ABC):
 
     def __init__(self, config: Configuration, table: DBTable, column: DBColumn) -> None:
         self._source_db_config = config.source_db_config
         self._target_db_config = config.target_db_config
+        self._validation_properties = config.validation_properties
         self._table = table
         self._column = column
+        self._cancellation: Optional[_QueryCancellation] = None
 
     def create_engine(self, db_properties: DatabaseProperties) -> Engine:
-        engine = create_engine(url=db_properties.url_with_password)
-        meta_data = MetaData(schema=db_properties.schema)
-        meta_data.reflect(bind=engine)
-        return engine
+        return get_db_engine(db_properties, Phase.VALIDATION)
+
+    @property
+    def validation_properties(self) -> ValidationProperties:
+        return self._validation_properties
+
+    def execute(self, db_properties: DatabaseProperties, statement: str, parameters: Optional[Dict[str, Any]] = None) -> Sequence[Row[Any]]:
+        """
+        Executes the given statement (with the given bound parameters, if any) with the statement timeout
+        configured for this validator. Statements failed because of transient errors are retried with
+        exponential backoff.
+        """
+        rows = self._execute_with_retries(db_properties, statement, lambda result: result.all(), parameters=parameters)
+        record_fetched_rows(db_properties, Phase.VALIDATION, len(rows))
+        return rows
+
+    def execute_streamed(self, db_properties: DatabaseProperties, statement: str, consume_rows: Callable[[Sequence[Row[Any]]], None], restart: Optional[Callable[[], None]] = None) -> None:
+        """
+        Executes the given statement like the execute method, but the rows are passed to the given
+        callback in batches instead of being collected, so the result-set does not have to fit in
+        memory. As failed statements are retried, the callback must tolerate rows passed repeatedly,
+        unless the optional restart callback (invoked before the rows of each attempt) resets its state.
+        """
+        def consume(result: Result[Any]) -> int:
+            if restart is not None:
+                restart()
+            row_count = 0
+            for rows in result.partitions():
+                consume_rows(rows)
+                row_count += len(rows)
+            return row_count
+
+        row_count = self._execute_with_retries(db_properties, statement, consume, {"yield_per": _STREAMED_BATCH_SIZE})
+        record_fetched_rows(db_properties, Phase.VALIDATION, row_count)
+
+    def _execute_with_retries(self, db_properties: DatabaseProperties, statement: str, consume: Callable[[Result[Any]], T], execution_options: Optional[Dict[str, Any]] = None, parameters: Optional[Dict[str, Any]] = None) -> T:
+        dialect = self.dialect(db_properties)
+        engine = self.create_engine(db_properties)
+        retry_count = 0
+        while True:
+            try:
+                with get_concurrency_limiter(db_properties).slot():
+                    return self._execute_once(db_properties, dialect, engine, statement, consume, execution_options or {}, parameters or {})
+            except Exception as e:
+                cancelled = self._cancellation is not None and self._cancellation.cancelled
+                if cancelled or retry_count >= self._validation_properties.max_retries or not dialect.is_transient_error(e):
+                    raise
+                backoff_sec = self._validation_properties.initial_retry_backoff_sec * (2 ** retry_count)
+                sleep(backoff_sec * uniform(1.0, 1.2))
+                retry_count += 1
+
+    def _execute_once(self, db_properties: DatabaseProperties, dialect: SQLDialect, engine: Engine, statement: str, consume: Callable[[Result[Any]], T], execution_options: Dict[str, Any], parameters: Dict[str, Any]) -> T:
+        timeout_sec = self._validation_properties.statement_timeout_sec(type(self).__name__)
+        statements = (statement,)
+        with Session(engine) as session:
+            connection = session.connection()
+            dbapi_connection = connection.connection.dbapi_connection
+            client_side_timeout = False
+            if timeout_sec is not None:
+                statements_with_timeout = dialect.statements_with_timeout(statement, timeout_sec)
+                if statements_with_timeout is not None:
+                    statements = statements_with_timeout
+                else:
+                    # the timeout cannot be enforced by the database server
+                    client_side_timeout = True
+            if self._cancellation is not None:
+                self._cancellation.register(db_properties, dialect, engine, dbapi_connection)
+            timer = None
+            timer_fired = Event()
+            try:
+                if client_side_timeout:
+                    def cancel_query() -> None:
+                        timer_fired.set()
+                        dialect.cancel_query(engine, dbapi_connection)
+
+                    timer = Timer(timeout_sec, cancel_query)
+                    timer.start()
+                for single_statement in statements[:-1]:
+                    session.execute(text(single_statement))
+                return consume(session.execute(text(statements[-1]), parameters, execution_options=execution_options))
+            finally:
+                if self._cancellation is not None:
+                    self._cancellation.unregister(db_properties)
+                if timer is not None:
+                    # the connection must not be returned to the pool while the timer can still cancel
+                    # a query on it; if the timer has fired, the connection is not reused at all
+                    timer.cancel()
+                    timer.join()
+                    if timer_fired.is_set():
+                        connection.invalidate()
+
+    def dialect(self, db_properties: DatabaseProperties) -> SQLDialect:
+        return get_dialect(db_properties)
 
     @property
     def limit(self) -> int:
-        return 50
+        return self._validation_properties.limit_for(self._table.name)
 
     @property
     def source_db_config(self) -> DatabaseProperties:
@@ -89,31 +262,69 @@ class AbstractValidator(ABC):
     def column_name(self) -> str:
         return self._column.name
 
+    @property
+    def key(self) -> str:
+        """
+        Identifies the validation within the table, e.g. when validation results stored in
+        snapshots are matched.
+        """
+        if self._column is None:
+            return type(self).__name__
+        return f"{type(self).__name__}:{self._column.name}"
+
     @property
     def description(self) -> str:
         if self._column is None:
             return f"{self._table.name} - {type(self).__name__}"
         return f"{self._table.name}.{self._column.name} - {type(self).__name__}"
 
-    def validate(self) -> ColumnValidationDetails:
-        source_query_future = self._EXECUTOR.submit(self._select_with_error_handling, self.source_db_config)
-        target_query_future = self._EXECUTOR.submit(self._select_with_error_handling, self.target_db_config)
+    @classmethod
+    def results_match(cls, source_result_set: str, target_result_set: str) -> bool:
+        return source_result_set == target_result_set
+
+    def validate(self, executor: Executor) -> ColumnValidationDetails:
+        self._cancellation = _QueryCancellation()
+        source_query_future = executor.submit(self._select_with_error_handling, self.source_db_config)
+        target_query_future = executor.submit(self._select_with_error_handling, self.target_db_config)
         source_query_details = source_query_future.result()
         target_query_details = target_query_future.result()
+        # the details are kept until all validations of the table are completed, so the strings equal
+        # for both databases (e.g. the result-sets of passed validations) are only kept once
+        target_query_details = ValidationQuery(
+            sql=_shared(source_query_details.sql, target_query_details.sql),
+            result_set=_shared(source_query_details.result_set, target_query_details.result_set),
+            error=target_query_details.error,
+        )
         return ColumnValidationDetails(
-            result=ValidationResult.PASSED if source_query_details.result_set == target_query_details.result_set else ValidationResult.FAILED,
+            result=ValidationResult.PASSED if self.results_match(source_query_details.result_set, target_query_details.result_set) else ValidationResult.FAILED,
             validator_description=self.description,
             source_query_details=source_query_details,
             target_query_details=target_query_details,
         )
 
+    def run_query(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        """
+        Runs the query of this validator against a single database, e.g. when a snapshot of
+        the database is created.
+        """
+        return self._select_with_error_handling(db_properties)
+
     def _select_with_error_handling(self, db_properties: DatabaseProperties) -> ValidationQuery:
         try:
             return self._select(db_properties)
         except Exception as e:
+            if self._cancellation is not None:
+                if self._cancellation.was_cancelled(db_properties):
+                    return ValidationQuery(
+                        sql="See the error details",
+                        result_set="No result-set - query cancelled because the query in the other database failed",
+                        error=True,
+                    )
+                self._cancellation.cancel_other_queries(db_properties)
             return ValidationQuery(
                 sql="See the error details",
-                result_set=f"No result-set - exception has been caught\n{str(e)}"
+                result_set=f"No result-set - exception has been caught\n{str(e)}",
+                error=True,
             )
 
     @abstractmethod
@@ -121,11 +332,7 @@ class AbstractValidator(ABC):
         ...
 
     @staticmethod
-    def format_rows(rows: Sequence[Row[Any]]) -> str:
+    def format_rows(rows: Sequence[Sequence[Any]]) -> str:
         if not rows:
             return "N/A"
-        result = ""
-        for single_row in rows:
-            result += str(single_row) + "\n"
-        result += "\n"
-        return result
+        return "".join(f"{single_row}\n" for single_row in rows) + "\n"
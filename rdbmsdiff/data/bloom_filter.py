@@ -0,0 +1,60 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from hashlib import md5
+from math import (
+    ceil,
+    log,
+)
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set of strings. A string which has not been added is reported as
+    (possibly) contained with the given false positive rate, a string which has been added is always
+    reported as contained. The number of bits and hash functions is derived from the expected number
+    of strings and the false positive rate (about 14.4 bits per string for the rate of 0.1 %).
+    """
+
+    __slots__ = ("_bits", "_bit_count", "_hash_count")
+
+    def __init__(self, expected_count: int, false_positive_rate: float) -> None:
+        expected_count = max(expected_count, 1)
+        self._bit_count = max(ceil(-expected_count * log(false_positive_rate) / (log(2) ** 2)), 8)
+        self._hash_count = max(round(self._bit_count / expected_count * log(2)), 1)
+        self._bits = bytearray((self._bit_count + 7) // 8)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+    def _positions(self, value: str) -> Iterator[int]:
+        # double hashing - the positions are derived from two 64-bit halves of a single MD5 digest
+        digest = md5(value.encode("UTF-8")).digest()
+        first_hash = int.from_bytes(digest[:8], "little")
+        second_hash = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self._hash_count):
+            yield (first_hash + index * second_hash) % self._bit_count
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
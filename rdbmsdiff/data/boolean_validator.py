@@ -16,9 +16,6 @@
 # limitations under the License.
 #
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
 from rdbmsdiff.foundation import (
     Configuration,
     DatabaseProperties,
@@ -35,11 +32,10 @@ class BooleanValidator(AbstractValidator):
         super().__init__(config, table, column)
 
     def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
-        engine = self.create_engine(db_properties)
-        with Session(engine) as session:
-            statement = f"SELECT {self.column_name}, COUNT({self.column_name}) FROM {self.table_name} GROUP BY {self.column_name} ORDER BY {self.column_name} ASC"
-            result = session.execute(text(statement)).all()
-            return ValidationQuery(
-                sql=statement,
-                result_set=self.format_rows(result)
-            )
+        value = self.dialect(db_properties).canonical_value(self.column)
+        statement = f"SELECT {value}, COUNT({self.column_name}) FROM {self.table_name} GROUP BY {value} ORDER BY {value} ASC"
+        result = self.execute(db_properties, statement)
+        return ValidationQuery(
+            sql=statement,
+            result_set=self.format_rows(result)
+        )
@@ -0,0 +1,161 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import md5
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from threading import Lock
+from typing import (
+    List,
+    Optional,
+    Sequence,
+)
+
+
+_DIGEST_SIZE = 16
+
+_OFFSET_SIZE = array("Q").itemsize
+
+# smaller batches are hashed by the calling thread, as passing them to the worker processes would
+# take longer than hashing them
+_MIN_PARALLEL_BATCH = 2_000
+
+
+def _md5_digests(values: Sequence[bytes]) -> List[bytes]:
+    return [md5(value).digest() for value in values]
+
+
+def _hash_shared_chunk(block_name: str, count: int) -> None:
+    """
+    Runs in a worker process. The shared memory block contains the offsets of the values (count + 1
+    unsigned 64-bit integers), space for the digests (count x 16 bytes), and the values (UTF-8). The
+    digests are written to the block, so neither the values nor the digests have to be pickled.
+    """
+    block = SharedMemory(name=block_name)
+    try:
+        digests_start = (count + 1) * _OFFSET_SIZE
+        values_start = digests_start + count * _DIGEST_SIZE
+        with block.buf[:digests_start] as offsets_view, offsets_view.cast("Q") as offsets:
+            for index in range(count):
+                with block.buf[values_start + offsets[index]:values_start + offsets[index + 1]] as value:
+                    digest = md5(value).digest()
+                position = digests_start + index * _DIGEST_SIZE
+                block.buf[position:position + _DIGEST_SIZE] = digest
+    finally:
+        block.close()
+
+
+class ClientHasher:
+    """
+    Computes MD5 digests of strings on the client, for databases which cannot compute them (see the
+    server_side_hashing flag of the SQL dialects). Large batches are split into chunks hashed by a
+    pool of worker processes, so the hashing is not limited by the GIL; the chunks are passed to the
+    workers in shared memory blocks. The digests are the same as those computed by the database
+    servers (MD5 of the UTF-8 encoded strings).
+    """
+
+    def __init__(self, process_count: int) -> None:
+        self._process_count = process_count
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = Lock()
+
+    @property
+    def process_count(self) -> int:
+        return self._process_count
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # the worker processes are spawned (not forked), as the parent process runs threads
+                # holding database connections
+                self._executor = ProcessPoolExecutor(max_workers=self._process_count, mp_context=get_context("spawn"))
+            return self._executor
+
+    def digests(self, values: Sequence[str]) -> List[bytes]:
+        """
+        Returns the (16-byte) MD5 digests of the given strings, in the same order.
+        """
+        encoded_values = [value.encode("UTF-8") for value in values]
+        if self._process_count < 2 or len(encoded_values) < _MIN_PARALLEL_BATCH:
+            return _md5_digests(encoded_values)
+        chunk_size = -(-len(encoded_values) // self._process_count)
+        chunks = [encoded_values[start:start + chunk_size] for start in range(0, len(encoded_values), chunk_size)]
+        blocks = []
+        try:
+            for chunk in chunks:
+                blocks.append(self._create_block(chunk))
+            executor = self._get_executor()
+            futures = [executor.submit(_hash_shared_chunk, block.name, len(chunk)) for block, chunk in zip(blocks, chunks)]
+            result: List[bytes] = []
+            for future, block, chunk in zip(futures, blocks, chunks):
+                future.result()
+                digests_start = (len(chunk) + 1) * _OFFSET_SIZE
+                digests = bytes(block.buf[digests_start:digests_start + len(chunk) * _DIGEST_SIZE])
+                result.extend(digests[offset:offset + _DIGEST_SIZE] for offset in range(0, len(digests), _DIGEST_SIZE))
+            return result
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    @staticmethod
+    def _create_block(values: Sequence[bytes]) -> SharedMemory:
+        offsets = array("Q", [0])
+        for value in values:
+            offsets.append(offsets[-1] + len(value))
+        digests_start = len(offsets) * _OFFSET_SIZE
+        values_start = digests_start + len(values) * _DIGEST_SIZE
+        block = SharedMemory(create=True, size=max(values_start + offsets[-1], 1))
+        block.buf[:digests_start] = offsets.tobytes()
+        block.buf[values_start:values_start + offsets[-1]] = b"".join(values)
+        return block
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+_HASHER: Optional[ClientHasher] = None
+
+_HASHER_LOCK = Lock()
+
+
+def get_client_hasher(process_count: Optional[int] = None) -> ClientHasher:
+    """
+    Returns the client hasher shared by all validators; the given number of worker processes (default
+    is the number of CPUs) only applies when the hasher is created.
+    """
+    global _HASHER
+    with _HASHER_LOCK:
+        if _HASHER is None:
+            _HASHER = ClientHasher(process_count or cpu_count() or 1)
+        return _HASHER
+
+
+def shutdown_client_hasher() -> None:
+    """
+    Stops the worker processes of the client hasher shared by all validators (if any have been started).
+    """
+    with _HASHER_LOCK:
+        if _HASHER is not None:
+            _HASHER.shutdown()
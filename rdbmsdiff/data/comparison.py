@@ -0,0 +1,94 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from rich.console import Console
+from rich.padding import Padding
+from rich.table import Table
+from rich.text import Text
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DBSchema,
+    Status,
+    create_query_statistics_table,
+    get_query_statistics,
+)
+
+from .report import Report, Statistics
+from .snapshot import DatabaseSnapshot
+from .validation_engine import ValidationEngine
+
+
+def validate(config: Configuration, source_db_meta_data: DBSchema, target_db_meta_data: DBSchema, report_filename: str) -> Statistics:
+    report = Report(report_filename)
+    try:
+        engine = ValidationEngine(config, source_db_meta_data, target_db_meta_data, report)
+        engine.validate()
+        return report.get_statistics()
+    finally:
+        if report is not None:
+            report.close()
+
+
+def create_summary_table(statistics: Statistics) -> Table:
+    table = Table(title="[cyan]Data Comparison Summary[/]", show_lines=True)
+
+    table.add_column(Text("Subject", justify="center"), justify="left")
+    table.add_column(Text("Overall Count", justify="center"), justify="right")
+    table.add_column(Text("Success Count", justify="center"), justify="right")
+    table.add_column(Text("Failure Count", justify="center"), justify="right")
+    table.add_column(Text("Status", justify="center"), justify="center")
+
+    table.add_row(
+        "Tables",
+        str(statistics.overall_table_count),
+        str(statistics.succsessful_table_count),
+        str(statistics.failed_table_count),
+        Status.format(Status.OK if statistics.failed_table_count == 0 else Status.ERROR),
+    )
+    table.add_row(
+        "Validations",
+        str(statistics.overall_validation_count),
+        str(statistics.successful_validation_count),
+        str(statistics.failed_validation_count),
+        Status.format(Status.OK if statistics.failed_validation_count == 0 else Status.ERROR),
+    )
+    return table
+
+
+def print_summary(config: Configuration, statistics: Statistics, summary_html_file: str) -> None:
+    console = Console(record=True, highlight=False)
+    console.print()
+    console.print(Padding(create_summary_table(statistics), (1, 2)))
+    console.print(Padding(create_query_statistics_table(get_query_statistics().snapshot()), (0, 2)))
+    console.print()
+    console.print(f"Source DB: [cyan]{config.source_db_config.url_without_password}[/], schema [cyan]{config.source_db_config.schema}[/]")
+    console.print(f"Target DB: [cyan]{config.target_db_config.url_without_password}[/], schema [cyan]{config.target_db_config.schema}[/]")
+    if summary_html_file:
+        console.save_html(summary_html_file)
+
+
+def print_snapshot_summary(source_snapshot: DatabaseSnapshot, target_snapshot: DatabaseSnapshot, report: Report, summary_html_file: str) -> None:
+    console = Console(record=True, highlight=False)
+    console.print()
+    console.print(Padding(create_summary_table(report.get_statistics()), (1, 2)))
+    console.print()
+    console.print(f"Source DB: [cyan]{source_snapshot.url}[/], schema [cyan]{source_snapshot.schema}[/], snapshot created [cyan]{source_snapshot.created}[/]")
+    console.print(f"Target DB: [cyan]{target_snapshot.url}[/], schema [cyan]{target_snapshot.schema}[/], snapshot created [cyan]{target_snapshot.created}[/]")
+    if summary_html_file:
+        console.save_html(summary_html_file)
@@ -0,0 +1,107 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    RawTextHelpFormatter,
+)
+
+from rdbmsdiff.foundation import (
+    handle_general_error,
+    print_banner,
+)
+
+
+def epilog() -> str:
+    return """
+The snapshots are created by the rdbmsdiff.data.export_snapshot tool, separately for the source and
+for the target database. The comparison of the snapshots does not need access to any database.
+
+Each snapshot derives the sampled records and the histogram buckets from the key and value ranges
+of its own database. Thus, the record and distribution validations of two snapshots only match if
+these ranges are equal in both databases.
+"""
+
+
+def create_cmd_line_args_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="RDBMS Data Snapshot Comparison Tool", formatter_class=RawTextHelpFormatter, epilog=epilog())
+
+    # positional mandatory arguments
+    parser.add_argument(
+        "source_snapshot",
+        help="the name of the snapshot file created for the source database"
+    )
+    parser.add_argument(
+        "target_snapshot",
+        help="the name of the snapshot file created for the target database"
+    )
+    parser.add_argument(
+        "report",
+        help="the name of the output text file the outcome of the comparison is to be written to"
+    )
+
+    # optional arguments
+    parser.add_argument(
+        "-s", "--summary-html",
+        dest="summary_html_file",
+        default=None,
+        help="optional name of an HTML output file the summary of the comparison is to be written to"
+    )
+
+    return parser
+
+
+def parse_cmd_line_args() -> Namespace:
+    parser = create_cmd_line_args_parser()
+    params = parser.parse_args()
+    return params
+
+
+def main() -> None:
+    cmd_line_args = parse_cmd_line_args()
+    # the comparison itself (SQLAlchemy, rich) is imported once the command line has been
+    # parsed, so that the help and invalid command line arguments are reported without delay
+    from .comparison import print_snapshot_summary
+    from .report import Report
+    from .snapshot import (
+        ReadSnapshotError,
+        diff_snapshots,
+        read_snapshot,
+    )
+
+    try:
+        print_banner()
+        source_snapshot = read_snapshot(cmd_line_args.source_snapshot)
+        target_snapshot = read_snapshot(cmd_line_args.target_snapshot)
+        report = Report(cmd_line_args.report)
+        try:
+            diff_snapshots(source_snapshot, target_snapshot, report)
+        finally:
+            report.close()
+        print_snapshot_summary(source_snapshot, target_snapshot, report, cmd_line_args.summary_html_file)
+    except ReadSnapshotError as e:
+        print()
+        print("ERROR!!!")
+        print(e)
+    except Exception as e:
+        handle_general_error(e)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import (
+    Dict,
+    Optional,
+)
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    DBColumn,
+    DBTable,
+)
+from .abstract_validator import AbstractValidator
+from .client_hashing import get_client_hasher
+from .hyperloglog import HyperLogLog
+from .validation_details import ValidationQuery
+
+
+# the estimates are considered equal if they differ by at most this multiple of the standard error
+_ERROR_BOUND_FACTOR = 3
+
+
+class DistinctCountValidator(AbstractValidator):
+    """
+    Compares the number of distinct values of a column, estimated by HyperLogLog sketches. The hashes
+    of the canonical values are computed by the database server, which just returns the minimum hash
+    of each register (at most 4096 rows). If the database cannot compute the hashes (see SQLDialect),
+    the canonical values are streamed and hashed by the client. The sketches are part of the result-set,
+    so they are stored in snapshots as well.
+
+    The estimates as well as the estimate of the union of both sets of values (the sketches are mergeable)
+    must be within the error bounds, so that values lost in one database and replaced by other values
+    are detected too (the number of distinct values does not change, but the union grows).
+    """
+
+    def __init__(self, config: Configuration, table: DBTable, column: DBColumn) -> None:
+        super().__init__(config, table, column)
+
+    def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        dialect = self.dialect(db_properties)
+        value = dialect.canonical_value(self.column)
+        sketch = HyperLogLog()
+        if dialect.server_side_hashing:
+            statement = (
+                f"SELECT SUBSTR(hash, 1, 3), MIN(SUBSTR(hash, 4, 8)) "
+                f"FROM (SELECT {dialect.md5(value)} AS hash FROM {self.table_name} WHERE {self.column_name} IS NOT NULL) hashes "
+                f"GROUP BY SUBSTR(hash, 1, 3)"
+            )
+            for register, word in self.execute(db_properties, statement):
+                sketch.update_register(int(register, 16), HyperLogLog.rank(int(word, 16)))
+        else:
+            statement = f"SELECT {value} FROM {self.table_name} WHERE {self.column_name} IS NOT NULL"
+            # adding a value repeatedly (e.g. when the statement is retried) does not change the sketch
+            hasher = get_client_hasher(self.validation_properties.hashing_processes)
+            self.execute_streamed(db_properties, statement, lambda rows: sketch.add_digests(hasher.digests([str(row[0]) for row in rows])))
+        return ValidationQuery(
+            sql=statement,
+            result_set=f"estimate: {sketch.estimate()}\nsketch: {sketch.to_text()}\n"
+        )
+
+    @staticmethod
+    def _parse_sketch(result_set: str) -> Optional[HyperLogLog]:
+        values: Dict[str, str] = dict(line.split(": ", 1) for line in result_set.splitlines() if ": " in line)
+        if "sketch" not in values:
+            return None
+        return HyperLogLog.from_text(values["sketch"])
+
+    @classmethod
+    def results_match(cls, source_result_set: str, target_result_set: str) -> bool:
+        source_sketch = cls._parse_sketch(source_result_set)
+        target_sketch = cls._parse_sketch(target_result_set)
+        if source_sketch is None or target_sketch is None:
+            return super().results_match(source_result_set, target_result_set)
+        if source_sketch == target_sketch:
+            return True
+        source_estimate = source_sketch.estimate()
+        target_estimate = target_sketch.estimate()
+        union_estimate = source_sketch.merge(target_sketch).estimate()
+        larger_estimate = max(source_estimate, target_estimate)
+        error_bound = _ERROR_BOUND_FACTOR * source_sketch.relative_error * max(larger_estimate, 1)
+        return abs(source_estimate - target_estimate) <= error_bound and union_estimate - larger_estimate <= error_bound
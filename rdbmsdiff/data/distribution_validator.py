@@ -0,0 +1,215 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+    timezone,
+)
+from math import ceil
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    DBColumn,
+    DBTable,
+    SQLDialect,
+    TypeCategory,
+)
+from .abstract_validator import AbstractValidator
+from .validation_details import ValidationQuery
+
+
+_TEMPORAL_TYPE_CATEGORIES = (TypeCategory.DATE, TypeCategory.TIME, TypeCategory.TIMESTAMP)
+
+_HISTOGRAM_TYPE_CATEGORIES = (TypeCategory.INTEGER, TypeCategory.DECIMAL, TypeCategory.FLOAT) + _TEMPORAL_TYPE_CATEGORIES
+
+_SECONDS_PER_DAY = 86400
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _temporal_to_seconds(category: TypeCategory, value: Any) -> float:
+    """
+    Converts the given value of a temporal column, as returned by the database driver (a date/time
+    object, or a string in ISO format, e.g. by SQLite), to seconds; timestamps with time zone are
+    converted to UTC, like their canonical form.
+    """
+    if isinstance(value, timedelta):
+        # e.g. MySQL drivers return the values of TIME columns as intervals
+        return value.total_seconds()
+    if category is TypeCategory.DATE:
+        if isinstance(value, str):
+            value = date.fromisoformat(value[:10])
+        return value.toordinal() * _SECONDS_PER_DAY
+    if category is TypeCategory.TIME:
+        if isinstance(value, str):
+            value = time.fromisoformat(value)
+        return value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1_000_000
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH).total_seconds()
+
+
+def _format_threshold(category: TypeCategory, value: float, bucket_width: float) -> str:
+    if category is TypeCategory.INTEGER:
+        return str(ceil(value))
+    if category in (TypeCategory.DECIMAL, TypeCategory.FLOAT):
+        return format(value, ".12g")
+    if category is TypeCategory.DATE:
+        return date.fromordinal(int(value // _SECONDS_PER_DAY)).isoformat()
+    if category is TypeCategory.TIME:
+        return (datetime.combine(date.min, time()) + timedelta(seconds=int(value))).strftime("%H:%M:%S.%f")
+    timestamp = _EPOCH + timedelta(seconds=int(value))
+    if bucket_width >= _SECONDS_PER_DAY:
+        # wide buckets are aligned to days, so that they are easier to interpret
+        timestamp = timestamp.replace(hour=0, minute=0, second=0)
+    return timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _equi_width_thresholds(column: DBColumn, min_value: Any, max_value: Any, bucket_count: int) -> Tuple[str, ...]:
+    """
+    Returns the thresholds splitting the range between the given min. and max. value into buckets
+    of equal width (the first bucket contains all values below the first threshold etc.). Temporal
+    values are expected as returned by the database driver, the thresholds are in canonical form
+    (see SQLDialect).
+    """
+    category = column.type_category
+    if category in _TEMPORAL_TYPE_CATEGORIES:
+        lower, upper = _temporal_to_seconds(category, min_value), _temporal_to_seconds(category, max_value)
+    else:
+        lower, upper = float(min_value), float(max_value)
+    if upper <= lower:
+        return ()
+    width = (upper - lower) / bucket_count
+    result: List[str] = []
+    for index in range(1, bucket_count):
+        threshold = _format_threshold(category, lower + index * width, width)
+        # rounding (e.g. to whole days) can make adjacent thresholds equal
+        if not result or result[-1] != threshold:
+            result.append(threshold)
+    return tuple(result)
+
+
+class DistributionValidator(AbstractValidator):
+    """
+    Compares the histograms of the numeric and date/time columns of a table. The histograms of all
+    columns are computed by a single aggregate query (one scan of the table), the result-set is
+    bounded by the number of buckets, regardless of the number of records. The buckets are of equal
+    width, the thresholds are derived from the value ranges in the source database (determined by a
+    separate MIN/MAX query of the raw columns, which can use indexes), so that the same buckets are
+    compared in both databases. Temporal values are bucketed in canonical form, whose lexicographic
+    order is the chronological order.
+
+    When a snapshot is created, the other database is not known, so the thresholds are derived from
+    the value ranges of the database the snapshot is created for. The bounds of the buckets are part
+    of the result-set, thus snapshots of databases whose value ranges differ do not match, even if the
+    values are distributed alike.
+    """
+
+    def __init__(self, config: Configuration, table: DBTable) -> None:
+        super().__init__(config, table, None)
+        self._thresholds_lock = Lock()
+        self._thresholds: Optional[Dict[str, Tuple[str, ...]]] = None
+
+    @property
+    def histogram_columns(self) -> Tuple[DBColumn, ...]:
+        return tuple(
+            column for column in self.table.columns
+            if column.type_category in _HISTOGRAM_TYPE_CATEGORIES
+            and self.validation_properties.is_validator_enabled(type(self).__name__, self.table.name, column.name)
+        )
+
+    @staticmethod
+    def _value(dialect: SQLDialect, column: DBColumn) -> str:
+        if column.type_category in _TEMPORAL_TYPE_CATEGORIES:
+            return dialect.canonical_value(column)
+        return column.name
+
+    @staticmethod
+    def _literal(column: DBColumn, threshold: str) -> str:
+        if column.type_category in _TEMPORAL_TYPE_CATEGORIES:
+            return f"'{threshold}'"
+        return threshold
+
+    def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        columns = self.histogram_columns
+        thresholds = self._get_thresholds(columns)
+        dialect = self.dialect(db_properties)
+        # the histograms are cumulative (the number of values below each threshold), so that each
+        # value is only compared with the thresholds, and no bucket number has to be computed
+        aggregates = []
+        for column in columns:
+            value = self._value(dialect, column)
+            aggregates.append(f"COUNT({column.name})")
+            aggregates.extend(f"COUNT(CASE WHEN {value} < {self._literal(column, threshold)} THEN 1 END)" for threshold in thresholds[column.name])
+        statement = f"SELECT {', '.join(aggregates)} FROM {self.table_name}"
+        result = self.execute(db_properties, statement)
+        return ValidationQuery(
+            sql=statement,
+            result_set=self._format_histograms(columns, thresholds, result[0])
+        )
+
+    @staticmethod
+    def _format_histograms(columns: Sequence[DBColumn], thresholds: Dict[str, Tuple[str, ...]], row: Sequence[Any]) -> str:
+        lines = []
+        index = 0
+        for column in columns:
+            column_thresholds = thresholds[column.name]
+            total = int(row[index])
+            cumulative_counts = [int(count) for count in row[index + 1:index + 1 + len(column_thresholds)]]
+            index += 1 + len(column_thresholds)
+            counts = [upper - lower for lower, upper in zip([0] + cumulative_counts, cumulative_counts + [total])]
+            bounds = ["(-inf"] + [f"[{threshold}" for threshold in column_thresholds]
+            upper_bounds = list(column_thresholds) + ["+inf"]
+            for lower_bound, upper_bound, count in zip(bounds, upper_bounds, counts):
+                lines.append(f"{column.name} {lower_bound}, {upper_bound}): {count}")
+        return "\n".join(lines) + "\n"
+
+    def _get_thresholds(self, columns: Sequence[DBColumn]) -> Dict[str, Tuple[str, ...]]:
+        with self._thresholds_lock:
+            if self._thresholds is None:
+                self._thresholds = self._compute_thresholds(columns)
+            return self._thresholds
+
+    def _compute_thresholds(self, columns: Sequence[DBColumn]) -> Dict[str, Tuple[str, ...]]:
+        # the raw values are aggregated (not their canonical form), so that indexes can be used
+        statement = f"SELECT {', '.join(f'MIN({column.name}), MAX({column.name})' for column in columns)} FROM {self.table_name}"
+        row = self.execute(self.source_db_config, statement)[0]
+        bucket_count = self.validation_properties.histogram_buckets
+        result = {}
+        for index, column in enumerate(columns):
+            min_value, max_value = row[2 * index], row[2 * index + 1]
+            # empty columns just have a single bucket
+            result[column.name] = () if min_value is None else _equi_width_thresholds(column, min_value, max_value, bucket_count)
+        return result
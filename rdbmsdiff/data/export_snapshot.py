@@ -0,0 +1,109 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    RawTextHelpFormatter,
+)
+
+from rdbmsdiff.foundation import (
+    DatabaseRole,
+    ReadConfigurationError,
+    epilog,
+    handle_configuration_error,
+    handle_general_error,
+    print_banner,
+    read_db_config,
+    read_validation_config,
+)
+
+
+def create_cmd_line_args_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="RDBMS Data Snapshot Export Tool", formatter_class=RawTextHelpFormatter, epilog=epilog())
+
+    # positional mandatory arguments
+    parser.add_argument(
+        "config_file",
+        help="the name of the configuration file containing the connection strings and usernames"
+    )
+    parser.add_argument(
+        "database",
+        choices=[role.lower() for role in DatabaseRole],
+        help="the database (source or target) the snapshot is to be created for"
+    )
+    parser.add_argument(
+        "snapshot",
+        help="the name of the output file (gzipped JSON) the snapshot is to be written to"
+    )
+
+    # optional arguments
+    parser.add_argument(
+        "-p", "--ask-for-password",
+        dest="ask_for_password",
+        default=False,
+        action="store_true",
+        help="if specified, the user will be asked for the password (the password will not be read from env. variable)"
+    )
+
+    return parser
+
+
+def parse_cmd_line_args() -> Namespace:
+    parser = create_cmd_line_args_parser()
+    params = parser.parse_args()
+    return params
+
+
+def main() -> None:
+    cmd_line_args = parse_cmd_line_args()
+    # the export itself (SQLAlchemy, rich) is imported once the command line has been parsed,
+    # so that the help and invalid command line arguments are reported without delay
+    from rich.console import Console
+
+    from rdbmsdiff.foundation import (
+        dispose_db_engines,
+        read_db_meta_data,
+    )
+    from .client_hashing import shutdown_client_hasher
+    from .snapshot import (
+        create_snapshot,
+        write_snapshot,
+    )
+
+    try:
+        print_banner()
+        db_config = read_db_config(cmd_line_args.config_file, DatabaseRole(cmd_line_args.database.upper()), cmd_line_args.ask_for_password)
+        validation_config = read_validation_config(cmd_line_args.config_file)
+        db_meta_data = read_db_meta_data(db_config)
+        snapshot = create_snapshot(db_config, db_meta_data, validation_config)
+        write_snapshot(snapshot, cmd_line_args.snapshot)
+        console = Console(record=False, highlight=False)
+        console.print()
+        console.print(f"Snapshot of [cyan]{db_config.url_without_password}[/], schema [cyan]{db_config.schema}[/] written to [cyan]{cmd_line_args.snapshot}[/]")
+    except ReadConfigurationError as e:
+        handle_configuration_error(e)
+    except Exception as e:
+        handle_general_error(e)
+    finally:
+        shutdown_client_hasher()
+        dispose_db_engines()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import (
+    Any,
+    Dict,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy.engine import Row
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    DatabaseRole,
+    DBTable,
+)
+from .abstract_validator import AbstractValidator
+from .record_validator import RecordValidator
+from .spill_store import (
+    SpillStore,
+    compare_stores,
+)
+from .validation_details import (
+    ColumnValidationDetails,
+    RecordDifference,
+    ValidationQuery,
+    ValidationResult,
+)
+
+
+class FullRecordValidator(RecordValidator):
+    """
+    Compares all records instead of a sample (used instead of the RecordValidator if the full record
+    comparison is enabled). The keys and the hashes of the records are streamed from each database
+    into a spill store, which sorts them on disk, so the memory does not depend on the size of the
+    table, and the databases do not have to sort the records. The stores are compared by their
+    digests; if they differ, they are compared record by record in a single pass, and the first
+    differing records are drilled down like by the RecordValidator.
+    """
+
+    def __init__(self, config: Configuration, table: DBTable) -> None:
+        super().__init__(config, table)
+        self._stores: Dict[DatabaseRole, SpillStore] = {}
+
+    def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        if not self.table.has_primary_key:
+            return ValidationQuery(sql="N/A", result_set="N/A")
+        dialect = self.dialect(db_properties)
+        select_columns = ", ".join(self._select_columns(dialect))
+        statement = f"SELECT {select_columns} FROM {self.table_name}"
+        spill_directory = self.validation_properties.spill_directory
+        stores: List[SpillStore] = []
+
+        def restart() -> None:
+            # the rows of a failed attempt are discarded
+            for store in stores:
+                store.close()
+            stores[:] = [SpillStore(spill_directory)]
+
+        def add_rows(rows: Sequence[Row[Any]]) -> None:
+            store = stores[0]
+            for key, row_hash in self._hash_rows(dialect, rows):
+                store.add(key, row_hash)
+
+        try:
+            self.execute_streamed(db_properties, statement, add_rows, restart)
+            store = stores[0]
+            store.finish()
+        except Exception:
+            for store in stores:
+                store.close()
+            raise
+        self._stores[db_properties.role] = store
+        return ValidationQuery(
+            sql=statement,
+            result_set=f"Number of records: {len(store)}\nDigest: {store.digest}\n"
+        )
+
+    def run_query(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        try:
+            return super().run_query(db_properties)
+        finally:
+            self._close_stores()
+
+    def validate(self, executor: Executor) -> ColumnValidationDetails:
+        self._stores = {}
+        try:
+            details = AbstractValidator.validate(self, executor)
+            if details.result is ValidationResult.PASSED or len(self._stores) < 2:
+                return details
+            missing_in_target_count, missing_in_source_count, differing_count, differences = self._compare_stores()
+            return replace(
+                details,
+                source_query_details=replace(
+                    details.source_query_details,
+                    result_set=details.source_query_details.result_set + f"Number of records missing in target DB: {missing_in_target_count}\n",
+                ),
+                target_query_details=replace(
+                    details.target_query_details,
+                    result_set=(
+                        details.target_query_details.result_set +
+                        f"Number of records missing in source DB: {missing_in_source_count}\n" +
+                        f"Number of differing records: {differing_count}\n"
+                    ),
+                ),
+                record_differences=self._drill_down(executor, differences),
+            )
+        finally:
+            self._close_stores()
+
+    def _compare_stores(self) -> Tuple[int, int, int, List[RecordDifference]]:
+        source_store = self._stores[DatabaseRole.SOURCE]
+        target_store = self._stores[DatabaseRole.TARGET]
+        drill_down_limit = self.validation_properties.drill_down_limit
+        missing_in_target_count = 0
+        missing_in_source_count = 0
+        differing_count = 0
+        differences: List[RecordDifference] = []
+        for source_record, target_record in compare_stores(source_store, target_store):
+            if target_record is None:
+                missing_in_target_count += 1
+                difference = RecordDifference(key=source_store.key(source_record[2]), missing_in_target=True)
+            elif source_record is None:
+                missing_in_source_count += 1
+                difference = RecordDifference(key=target_store.key(target_record[2]), missing_in_source=True)
+            else:
+                differing_count += 1
+                difference = RecordDifference(key=source_store.key(source_record[2]))
+            if len(differences) < drill_down_limit:
+                differences.append(difference)
+        return missing_in_target_count, missing_in_source_count, differing_count, differences
+
+    def _close_stores(self) -> None:
+        for store in self._stores.values():
+            store.close()
+        self._stores = {}
@@ -0,0 +1,121 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from base64 import (
+    b64decode,
+    b64encode,
+)
+from math import (
+    log,
+    sqrt,
+)
+from typing import (
+    Iterable,
+    Optional,
+    Tuple,
+)
+from zlib import (
+    compress,
+    decompress,
+)
+
+
+# the registers are addressed by the first 3 hex digits (12 bits) of the MD5 hash, the rank is
+# derived from the following 8 hex digits (32 bits)
+_REGISTER_HEX_DIGITS = 3
+
+_WORD_HEX_DIGITS = 8
+
+_WORD_BITS = 4 * _WORD_HEX_DIGITS
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch (Flajolet et al.) estimating the number of distinct values. The values are
+    hashed by MD5, so the registers can be computed by a database server as well (the rank of a
+    register is derived from the minimum of the hashes falling into the register, see the
+    rank method). The same values lead to the same sketch regardless of where it is computed.
+    Sketches are mergeable - the sketch of the union of two sets is the register-wise maximum.
+    """
+
+    __slots__ = ("_registers",)
+
+    REGISTER_COUNT = 16 ** _REGISTER_HEX_DIGITS
+
+    def __init__(self, registers: Optional[bytes] = None) -> None:
+        self._registers = bytearray(registers) if registers is not None else bytearray(self.REGISTER_COUNT)
+
+    @staticmethod
+    def split_hash(md5_hex: str) -> Tuple[int, int]:
+        """
+        Splits the given MD5 hash (hexadecimal string) into the register index and the word whose
+        leading zeros determine the rank.
+        """
+        register = int(md5_hex[:_REGISTER_HEX_DIGITS], 16)
+        word = int(md5_hex[_REGISTER_HEX_DIGITS:_REGISTER_HEX_DIGITS + _WORD_HEX_DIGITS], 16)
+        return register, word
+
+    @staticmethod
+    def rank(word: int) -> int:
+        # position of the leftmost 1-bit; the smaller the word, the higher the rank
+        return _WORD_BITS - word.bit_length() + 1
+
+    @property
+    def relative_error(self) -> float:
+        """
+        The standard error of the estimate relative to the actual number of distinct values.
+        """
+        return 1.04 / sqrt(self.REGISTER_COUNT)
+
+    def update_register(self, register: int, rank: int) -> None:
+        if rank > self._registers[register]:
+            self._registers[register] = rank
+
+    def add_hash(self, md5_hex: str) -> None:
+        register, word = self.split_hash(md5_hex)
+        self.update_register(register, self.rank(word))
+
+    def add_digests(self, digests: Iterable[bytes]) -> None:
+        for digest in digests:
+            self.add_hash(digest.hex())
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        return HyperLogLog(bytes(max(rank, other_rank) for rank, other_rank in zip(self._registers, other._registers)))
+
+    def estimate(self) -> int:
+        register_count = self.REGISTER_COUNT
+        alpha = 0.7213 / (1 + 1.079 / register_count)
+        raw_estimate = alpha * register_count * register_count / sum(2.0 ** -rank for rank in self._registers)
+        empty_register_count = self._registers.count(0)
+        if raw_estimate <= 2.5 * register_count and empty_register_count > 0:
+            # small cardinalities are estimated by linear counting
+            return round(register_count * log(register_count / empty_register_count))
+        return round(raw_estimate)
+
+    def to_text(self) -> str:
+        return b64encode(compress(bytes(self._registers), 9)).decode("ascii")
+
+    @classmethod
+    def from_text(cls, text: str) -> "HyperLogLog":
+        registers = decompress(b64decode(text))
+        if len(registers) != cls.REGISTER_COUNT:
+            raise ValueError(f"Invalid HyperLogLog sketch ({len(registers)} registers)")
+        return cls(registers)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, HyperLogLog) and self._registers == other._registers
@@ -0,0 +1,173 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import (
+    Any,
+    Dict,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy.engine import Row
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    DatabaseRole,
+    DBTable,
+    SQLDialect,
+)
+from .abstract_validator import AbstractValidator
+from .bloom_filter import BloomFilter
+from .validation_details import (
+    ColumnValidationDetails,
+    RecordDifference,
+    ValidationQuery,
+    ValidationResult,
+)
+
+
+_FALSE_POSITIVE_RATE = 0.001
+
+# separates the values of composite keys when the keys are added to the Bloom filters
+_KEY_SEPARATOR = "\x1f"
+
+
+class KeyPresenceValidator(AbstractValidator):
+    """
+    Finds records missing in one of the databases without transferring both sets of primary keys to
+    one place. The keys of each database are streamed into a Bloom filter; subsequently, the keys of
+    each database are streamed again and probed against the filter of the other database. A key not
+    contained in the filter is certainly missing in the other database (false positives of the filter
+    can just hide a few missing keys). The first missing keys are confirmed by indexed lookups, so
+    that records inserted or deleted in the meantime are not reported. The memory is bounded by the
+    size of the filters (about 1.8 bytes per key).
+    """
+
+    def __init__(self, config: Configuration, table: DBTable) -> None:
+        super().__init__(config, table, None)
+        self._filters: Dict[DatabaseRole, BloomFilter] = {}
+
+    @property
+    def _pk_column_names(self) -> List[str]:
+        return [column.name for column in self.table.primary_key_constraints[0].columns]
+
+    def _key_statement(self, dialect: SQLDialect) -> str:
+        columns = self.table.columns_as_dict
+        keys = ", ".join(dialect.canonical_value(columns[name]) for name in self._pk_column_names)
+        return f"SELECT {keys} FROM {self.table_name}"
+
+    @staticmethod
+    def _key_as_str(row: Sequence[Any]) -> str:
+        return _KEY_SEPARATOR.join(str(value) for value in row)
+
+    def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        if not self.table.has_primary_key:
+            return ValidationQuery(sql="N/A", result_set="N/A")
+        record_count = int(self.execute(db_properties, f"SELECT COUNT(*) FROM {self.table_name}")[0][0])
+        bloom_filter = BloomFilter(record_count, _FALSE_POSITIVE_RATE)
+
+        def add_keys(rows: Sequence[Row[Any]]) -> None:
+            for row in rows:
+                bloom_filter.add(self._key_as_str(row))
+
+        statement = self._key_statement(self.dialect(db_properties))
+        self.execute_streamed(db_properties, statement, add_keys)
+        self._filters[db_properties.role] = bloom_filter
+        return ValidationQuery(
+            sql=statement,
+            result_set=f"Number of keys: {record_count}\n"
+        )
+
+    def validate(self, executor: Executor) -> ColumnValidationDetails:
+        self._filters = {}
+        details = super().validate(executor)
+        if len(self._filters) < 2:
+            # no primary key, or the keys could not be read from one of the databases
+            return details
+        source_filter = self._filters.pop(DatabaseRole.SOURCE)
+        target_filter = self._filters.pop(DatabaseRole.TARGET)
+        missing_in_target_future = executor.submit(self._find_missing_keys, self.source_db_config, target_filter, self.target_db_config)
+        missing_in_source_future = executor.submit(self._find_missing_keys, self.target_db_config, source_filter, self.source_db_config)
+        try:
+            missing_in_target_count, missing_in_target = missing_in_target_future.result()
+            missing_in_source_count, missing_in_source = missing_in_source_future.result()
+        except Exception as e:
+            return replace(
+                details,
+                result=ValidationResult.FAILED,
+                target_query_details=ValidationQuery(sql="See the error details", result_set=f"No result-set - exception has been caught\n{str(e)}", error=True),
+            )
+        drill_down_limit = self.validation_properties.drill_down_limit
+        differences = (
+            [RecordDifference(key=key, missing_in_target=True) for key in missing_in_target[:drill_down_limit]] +
+            [RecordDifference(key=key, missing_in_source=True) for key in missing_in_source[:drill_down_limit]]
+        )
+        return replace(
+            details,
+            result=ValidationResult.PASSED if missing_in_target_count == 0 and missing_in_source_count == 0 else ValidationResult.FAILED,
+            source_query_details=replace(
+                details.source_query_details,
+                result_set=details.source_query_details.result_set + f"Number of keys missing in target DB: {missing_in_target_count}\n",
+            ),
+            target_query_details=replace(
+                details.target_query_details,
+                result_set=details.target_query_details.result_set + f"Number of keys missing in source DB: {missing_in_source_count}\n",
+            ),
+            record_differences=tuple(differences),
+        )
+
+    def _find_missing_keys(self, db_properties: DatabaseProperties, other_filter: BloomFilter, other_db_properties: DatabaseProperties) -> Tuple[int, List[Tuple[str, ...]]]:
+        """
+        Streams the keys of the given database, and returns the number of keys not contained in the
+        given filter of the other database, together with the first of them (confirmed by lookups in
+        the other database).
+        """
+        max_candidates = self.limit
+        candidates: Dict[Tuple[str, ...], None] = {}
+        missing_counter = [0]
+
+        def restart() -> None:
+            candidates.clear()
+            missing_counter[0] = 0
+
+        def probe_keys(rows: Sequence[Row[Any]]) -> None:
+            for row in rows:
+                if self._key_as_str(row) not in other_filter:
+                    missing_counter[0] += 1
+                    if len(candidates) < max_candidates:
+                        candidates[tuple(str(value) for value in row)] = None
+
+        self.execute_streamed(db_properties, self._key_statement(self.dialect(db_properties)), probe_keys, restart)
+        if not candidates:
+            return 0, []
+        found_keys = self._lookup_keys(other_db_properties, list(candidates))
+        missing_keys = [key for key in candidates if key not in found_keys]
+        return missing_counter[0] - len(found_keys), missing_keys
+
+    def _lookup_keys(self, db_properties: DatabaseProperties, keys: List[Tuple[str, ...]]) -> Set[Tuple[str, ...]]:
+        dialect = self.dialect(db_properties)
+        columns = self.table.columns_as_dict
+        pk_columns = [columns[name] for name in self._pk_column_names]
+        conditions, parameters = dialect.keys_condition(pk_columns, keys)
+        statement = f"{self._key_statement(dialect)} WHERE {conditions}"
+        return {tuple(str(value) for value in row) for row in self.execute(db_properties, statement, parameters)}
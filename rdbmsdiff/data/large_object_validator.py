@@ -0,0 +1,167 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import (
+    Any,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy.engine import Row
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    DBColumn,
+    DBTable,
+    SQLDialect,
+)
+from .abstract_validator import AbstractValidator
+from .client_hashing import get_client_hasher
+from .validation_details import (
+    ColumnValidationDetails,
+    ValidationQuery,
+    ValidationResult,
+)
+
+
+# the number of bytes (binary columns) or characters (other columns) at the beginning and at the end of
+# each value whose hashes are compared
+_EDGE_LENGTH = 1024
+
+
+class LargeObjectValidator(AbstractValidator):
+    """
+    Compares the values of a large object column (e.g. BLOB, CLOB, TEXT) without reading and hashing
+    whole multi-megabyte values in the first place. The checks are ordered by their costs:
+
+    1. the number, the total length and the max. length of the values (lengths are cheap to read)
+    2. the lengths and the hashes of the beginnings and the ends of the values of a sample of records
+       (the records with the lowest primary key values)
+    3. the hashes of the whole values of the sampled records, unless they exceed the configured limit
+
+    The hashes of the whole values are only computed if the cheaper checks have passed in both databases.
+    If the database cannot compute the hashes, the canonical values are hashed by the client.
+    """
+
+    def __init__(self, config: Configuration, table: DBTable, column: DBColumn) -> None:
+        super().__init__(config, table, column)
+
+    @property
+    def _pk_columns(self) -> List[DBColumn]:
+        columns = self.table.columns_as_dict
+        return [columns[column.name] for column in self.table.primary_key_constraints[0].columns]
+
+    def _hash(self, dialect: SQLDialect, expression: str) -> str:
+        return dialect.md5(expression) if dialect.server_side_hashing else expression
+
+    def _hash_rows(self, dialect: SQLDialect, rows: Sequence[Row[Any]], hashed_columns: int) -> List[Tuple[Any, ...]]:
+        """
+        Hashes the given number of trailing values of each row by the client if they have not been hashed
+        by the database server (NULL values are kept).
+        """
+        if dialect.server_side_hashing or not rows:
+            return [tuple(row) for row in rows]
+        first_hashed = len(rows[0]) - hashed_columns
+        values = [value for row in rows for value in row[first_hashed:] if value is not None]
+        digests = iter(get_client_hasher(self.validation_properties.hashing_processes).digests(values))
+        return [
+            tuple(row[:first_hashed]) + tuple(None if value is None else next(digests).hex().upper() for value in row[first_hashed:])
+            for row in rows
+        ]
+
+    def _create_sample_statement(self, dialect: SQLDialect, select_columns: List[str]) -> str:
+        keys = [dialect.canonical_value(column) for column in self._pk_columns]
+        order_by = ", ".join(f"{column.name} ASC" for column in self._pk_columns)
+        return (
+            f"SELECT {', '.join(keys + select_columns)} FROM {self.table_name} "
+            f"WHERE {self.column_name} IS NOT NULL ORDER BY {order_by} LIMIT {self.limit}"
+        )
+
+    def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        dialect = self.dialect(db_properties)
+        length = dialect.large_object_length(self.column)
+        aggregate_statement = f"SELECT COUNT({self.column_name}), SUM({length}), MAX({length}) FROM {self.table_name}"
+        count, total_length, max_length = self.execute(db_properties, aggregate_statement)[0]
+        result_set = f"count: {count}\ntotal length: {total_length}\nmax. length: {max_length}\n"
+        if not self.table.has_primary_key:
+            return ValidationQuery(sql=aggregate_statement, result_set=result_set)
+
+        suffix_start = f"CASE WHEN {length} > {_EDGE_LENGTH} THEN {length} - {_EDGE_LENGTH - 1} ELSE 1 END"
+        sample_statement = self._create_sample_statement(dialect, [
+            length,
+            self._hash(dialect, dialect.large_object_part(self.column, "1", _EDGE_LENGTH)),
+            self._hash(dialect, dialect.large_object_part(self.column, suffix_start, _EDGE_LENGTH)),
+        ])
+        sample = self._hash_rows(dialect, self.execute(db_properties, sample_statement), hashed_columns=2)
+        return ValidationQuery(
+            sql=f"{aggregate_statement};\n{sample_statement}",
+            result_set=result_set + self.format_rows(sample)
+        )
+
+    def _select_value_hashes(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        dialect = self.dialect(db_properties)
+        length = dialect.large_object_length(self.column)
+        hash_limit = self.validation_properties.large_object_hash_limit
+        value_hash = self._hash(dialect, dialect.canonical_value(self.column))
+        # the values exceeding the limit are not read at all (NULL instead of the hash)
+        statement = self._create_sample_statement(dialect, [f"CASE WHEN {length} <= {hash_limit} THEN {value_hash} END"])
+        value_hashes = self._hash_rows(dialect, self.execute(db_properties, statement), hashed_columns=1)
+        return ValidationQuery(sql=statement, result_set=self.format_rows(value_hashes))
+
+    @staticmethod
+    def _combine(cheap_checks: ValidationQuery, value_hashes: ValidationQuery) -> ValidationQuery:
+        return ValidationQuery(
+            sql=f"{cheap_checks.sql};\n{value_hashes.sql}",
+            result_set=f"{cheap_checks.result_set}Value hashes:\n{value_hashes.result_set}"
+        )
+
+    def validate(self, executor: Executor) -> ColumnValidationDetails:
+        details = super().validate(executor)
+        if details.result is ValidationResult.FAILED or details.source_query_details.error or details.target_query_details.error or not self.table.has_primary_key:
+            return details
+        source_future = executor.submit(self._select_value_hashes, self.source_db_config)
+        target_future = executor.submit(self._select_value_hashes, self.target_db_config)
+        try:
+            source_value_hashes = source_future.result()
+            target_value_hashes = target_future.result()
+        except Exception as e:
+            return replace(
+                details,
+                result=ValidationResult.FAILED,
+                target_query_details=ValidationQuery(sql="See the error details", result_set=f"No result-set - exception has been caught\n{str(e)}", error=True),
+            )
+        return replace(
+            details,
+            result=ValidationResult.PASSED if source_value_hashes.result_set == target_value_hashes.result_set else ValidationResult.FAILED,
+            source_query_details=self._combine(details.source_query_details, source_value_hashes),
+            target_query_details=self._combine(details.target_query_details, target_value_hashes),
+        )
+
+    def run_query(self, db_properties: DatabaseProperties) -> ValidationQuery:
+        # the other database is not known when a snapshot is created, so the value hashes are always included
+        cheap_checks = super().run_query(db_properties)
+        if not self.table.has_primary_key or cheap_checks.error:
+            return cheap_checks
+        try:
+            return self._combine(cheap_checks, self._select_value_hashes(db_properties))
+        except Exception as e:
+            return ValidationQuery(sql="See the error details", result_set=f"No result-set - exception has been caught\n{str(e)}", error=True)
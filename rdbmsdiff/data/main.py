@@ -22,27 +22,15 @@ from argparse import (
     RawTextHelpFormatter,
 )
 
-from rich.console import Console
-from rich.padding import Padding
-from rich.table import Table
-from rich.text import Text
-
 from rdbmsdiff.foundation import (
-    Configuration,
-    DBSchema,
     ReadConfigurationError,
-    Status,
     epilog,
     handle_configuration_error,
     handle_general_error,
     print_banner,
     read_config,
-    read_db_meta_data,
 )
 
-from .report import Report, Statistics
-from .validation_engine import ValidationEngine
-
 
 def create_cmd_line_args_parser() -> ArgumentParser:
     parser = ArgumentParser(description="RDBMS Data Comparison Tool", formatter_class=RawTextHelpFormatter, epilog=epilog())
@@ -81,55 +69,19 @@ def parse_cmd_line_args() -> Namespace:
     return params
 
 
-def validate(config: Configuration, source_db_meta_data: DBSchema, target_db_meta_data: DBSchema, report_filename: str) -> Statistics:
-    report = Report(report_filename)
-    try:
-        engine = ValidationEngine(config, source_db_meta_data, target_db_meta_data, report)
-        engine.validate()
-        return report.get_statistics()
-    finally:
-        if report is not None:
-            report.close()
-
-
-def print_summary(config: Configuration, statistics: Statistics, summary_html_file: str) -> None:
-    console = Console(record=True, highlight=False)
-    table = Table(title="[cyan]Data Comparison Summary[/]", show_lines=True)
-
-    table.add_column(Text("Subject", justify="center"), justify="left")
-    table.add_column(Text("Overall Count", justify="center"), justify="right")
-    table.add_column(Text("Success Count", justify="center"), justify="right")
-    table.add_column(Text("Failure Count", justify="center"), justify="right")
-    table.add_column(Text("Status", justify="center"), justify="center")
-
-    table.add_row(
-        "Tables",
-        str(statistics.overall_table_count),
-        str(statistics.succsessful_table_count),
-        str(statistics.failed_table_count),
-        Status.format(Status.OK if statistics.failed_table_count == 0 else Status.ERROR),
-    )
-    table.add_row(
-        "Validations",
-        str(statistics.overall_validation_count),
-        str(statistics.successful_validation_count),
-        str(statistics.failed_validation_count),
-        Status.format(Status.OK if statistics.failed_validation_count == 0 else Status.ERROR),
+def main() -> None:
+    cmd_line_args = parse_cmd_line_args()
+    # the comparison itself (SQLAlchemy, rich) is imported once the command line has been
+    # parsed, so that the help and invalid command line arguments are reported without delay
+    from rdbmsdiff.foundation import (
+        dispose_db_engines,
+        read_db_meta_data,
     )
+    from .client_hashing import shutdown_client_hasher
+    from .comparison import print_summary, validate
 
-    console.print()
-    console.print(Padding(table, (1, 2)))
-    console.print()
-    console.print(f"Source DB: [cyan]{config.source_db_config.url_without_password}[/], schema [cyan]{config.source_db_config.schema}[/]")
-    console.print(f"Target DB: [cyan]{config.target_db_config.url_without_password}[/], schema [cyan]{config.target_db_config.schema}[/]")
-    if summary_html_file:
-        console.save_html(summary_html_file)
-
-
-def main() -> None:
     try:
         print_banner()
-        cmd_line_args = parse_cmd_line_args()
         config = read_config(cmd_line_args.config_file, cmd_line_args.ask_for_passwords)
         source_db_meta_data = read_db_meta_data(config.source_db_config)
         target_db_meta_data = read_db_meta_data(config.target_db_config)
@@ -139,6 +91,9 @@ def main() -> None:
         handle_configuration_error(e)
     except Exception as e:
         handle_general_error(e)
+    finally:
+        shutdown_client_hasher()
+        dispose_db_engines()
 
 
 if __name__ == "__main__":
@@ -18,8 +18,6 @@
 
 from enum import Enum
 from enum import auto, unique
-from sqlalchemy import text
-from sqlalchemy.orm import Session
 
 from rdbmsdiff.foundation import (
     Configuration,
@@ -43,13 +41,15 @@ class NullValueCountValidator(AbstractValidator):
         super().__init__(config, table, column)
         self._check_type = check_type
 
+    @property
+    def key(self) -> str:
+        return f"{super().key}:{self._check_type.name}"
+
     def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
-        engine = self.create_engine(db_properties)
-        with Session(engine) as session:
-            condition = "IS NULL" if self._check_type is NullValueCheckType.IS_NULL else "IS NOT NULL"
-            statement = f"SELECT COUNT(*) FROM {self.table_name} WHERE {self.column_name} {condition}"
-            result = session.execute(text(statement)).first()
-            return ValidationQuery(
-                sql=statement,
-                result_set=str(result)
-            )
+        condition = "IS NULL" if self._check_type is NullValueCheckType.IS_NULL else "IS NOT NULL"
+        statement = f"SELECT COUNT(*) FROM {self.table_name} WHERE {self.column_name} {condition}"
+        result = self.execute(db_properties, statement)
+        return ValidationQuery(
+            sql=statement,
+            result_set=str(result[0])
+        )
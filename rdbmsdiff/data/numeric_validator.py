@@ -16,30 +16,136 @@
 # limitations under the License.
 #
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from decimal import Decimal
+from math import isclose
+from typing import (
+    Any,
+    Dict,
+    Optional,
+)
 
 from rdbmsdiff.foundation import (
     Configuration,
     DatabaseProperties,
     DBColumn,
     DBTable,
+    TypeCategory,
 )
 from .abstract_validator import AbstractValidator
 from .validation_details import ValidationQuery
 
 
+# prime modulus of the checksum of integer columns; the sum of the remainders cannot overflow
+# a 64-bit integer unless the table contains billions of records
+_CHECKSUM_MODULUS = 1_000_000_007
+
+_PERCENTILE_PREFIX = "percentile_"
+
+# aggregates of floating point columns compared with tolerance (besides the percentiles)
+_APPROXIMATE_FLOAT_AGGREGATES = ("min", "max", "sum")
+
+
 class NumericValidator(AbstractValidator):
+    """
+    Compares aggregates of a numeric column computed by a single scan. The aggregates depend on the
+    type category of the column - integer columns are compared by a modular checksum (instead of a
+    sum which might overflow), decimal columns by their exact sum, and floating point columns with
+    the configured relative tolerance, as their sums depend on the order of the additions. The
+    configured percentiles are only computed by the databases supporting them (see SQLDialect).
+    """
 
     def __init__(self, config: Configuration, table: DBTable, column: DBColumn) -> None:
         super().__init__(config, table, column)
 
+    def _aggregates(self, db_properties: DatabaseProperties) -> Dict[str, str]:
+        name = self.column_name
+        result = {
+            "count": f"COUNT({name})",
+            "min": f"MIN({name})",
+            "max": f"MAX({name})",
+        }
+        if self.column.type_category is TypeCategory.INTEGER:
+            result["checksum"] = f"SUM({name} % {_CHECKSUM_MODULUS})"
+        else:
+            result["sum"] = f"SUM({name})"
+        dialect = self.dialect(db_properties)
+        for fraction in self.validation_properties.percentiles:
+            expression = dialect.percentile(name, fraction)
+            if expression is not None:
+                result[f"{_PERCENTILE_PREFIX}{fraction}"] = expression
+        return result
+
+    def _format_decimal(self, value: Any) -> str:
+        if isinstance(value, float):
+            # SQLite provides decimals as floats, so the sum is rounded to the scale of the column
+            # in order to get rid of the rounding errors of the floating point arithmetic
+            value = Decimal(str(value))
+            scale = getattr(self.column.datatype, "scale", None)
+            if scale is not None:
+                value = value.quantize(Decimal(1).scaleb(-scale))
+        return format(Decimal(value).normalize(), "f")
+
+    def _format_value(self, aggregate: str, value: Any) -> str:
+        if value is None:
+            return "NULL"
+        if aggregate in ("count", "checksum"):
+            return str(int(value))
+        if aggregate.startswith(_PERCENTILE_PREFIX):
+            return repr(float(value))
+        category = self.column.type_category
+        if category is TypeCategory.INTEGER:
+            return str(int(value))
+        if category is TypeCategory.DECIMAL:
+            return self._format_decimal(value)
+        return repr(float(value))
+
     def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
-        engine = self.create_engine(db_properties)
-        with Session(engine) as session:
-            statement = f"SELECT MIN({self.column_name}), MAX({self.column_name}), AVG({self.column_name}), SUM({self.column_name}) FROM {self.table_name}"
-            result = session.execute(text(statement)).first()
-            return ValidationQuery(
-                sql=statement,
-                result_set=str(result)
-            )
+        aggregates = self._aggregates(db_properties)
+        statement = f"SELECT {', '.join(aggregates.values())} FROM {self.table_name}"
+        result = self.execute(db_properties, statement)
+        lines = [
+            f"category: {self.column.type_category.name}",
+            f"tolerance: {self.validation_properties.numeric_tolerance}",
+        ]
+        for aggregate, value in zip(aggregates.keys(), result[0]):
+            lines.append(f"{aggregate}: {self._format_value(aggregate, value)}")
+        return ValidationQuery(
+            sql=statement,
+            result_set="\n".join(lines) + "\n"
+        )
+
+    @staticmethod
+    def _parse_result_set(result_set: str) -> Optional[Dict[str, str]]:
+        if not result_set.startswith("category: "):
+            # no result-set (e.g. failed query), or result-set of an older version
+            return None
+        return dict(line.split(": ", 1) for line in result_set.splitlines() if ": " in line)
+
+    @staticmethod
+    def _values_close(source_value: str, target_value: str, tolerance: float) -> bool:
+        if source_value == "NULL" or target_value == "NULL":
+            return source_value == target_value
+        return isclose(float(source_value), float(target_value), rel_tol=tolerance, abs_tol=tolerance)
+
+    @classmethod
+    def results_match(cls, source_result_set: str, target_result_set: str) -> bool:
+        source_values = cls._parse_result_set(source_result_set)
+        target_values = cls._parse_result_set(target_result_set)
+        if source_values is None or target_values is None:
+            return super().results_match(source_result_set, target_result_set)
+        # the percentiles are only compared if both databases have computed them
+        source_aggregates = {key for key in source_values if not key.startswith(_PERCENTILE_PREFIX)}
+        target_aggregates = {key for key in target_values if not key.startswith(_PERCENTILE_PREFIX)}
+        if source_aggregates != target_aggregates or source_values["category"] != target_values["category"]:
+            return False
+        tolerance = max(float(source_values["tolerance"]), float(target_values["tolerance"]))
+        is_float = source_values["category"] == TypeCategory.FLOAT.name
+        for key in source_values.keys() & target_values.keys():
+            if key in ("category", "tolerance"):
+                continue
+            if key.startswith(_PERCENTILE_PREFIX) or (is_float and key in _APPROXIMATE_FLOAT_AGGREGATES):
+                if not cls._values_close(source_values[key], target_values[key], tolerance):
+                    return False
+            elif source_values[key] != target_values[key]:
+                return False
+        return True
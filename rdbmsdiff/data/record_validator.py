@@ -16,43 +16,302 @@
 # limitations under the License.
 #
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from concurrent.futures import Executor
+from dataclasses import replace
+from random import Random
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy.engine import Row
 
 from rdbmsdiff.foundation import (
     Configuration,
     DatabaseProperties,
+    DatabaseRole,
+    DBColumn,
     DBTable,
+    SQLDialect,
+    TypeCategory,
 )
 from .abstract_validator import AbstractValidator
-from .validation_details import ValidationQuery
+from .client_hashing import get_client_hasher
+from .validation_details import (
+    ColumnDifference,
+    ColumnValidationDetails,
+    RecordDifference,
+    ValidationQuery,
+    ValidationResult,
+)
 
 
 class RecordValidator(AbstractValidator):
+    """
+    Compares a sample of records. The sample consists of several windows spread over the whole key
+    space (the first records, the last records, and records from evenly spaced positions between),
+    so that recently inserted or updated records are compared as well, not only the oldest ones. Each
+    window is fetched by a keyset seek on the primary key, which is cheap regardless of the size of
+    the table. The windows are bounded (they partition the key space), so a record missing in one of
+    the databases only shifts the records of its own window. The bounds of the windows are derived
+    from the key range of the source database, so that the same records are compared in both
+    databases. When a snapshot is created, the other database is not known, so the bounds are
+    derived from the key range of the database the snapshot is created for; the samples of two
+    snapshots thus only match if the key ranges of both databases are equal.
+
+    If the samples differ, the differing records are drilled down. The samples just contain the keys
+    and the hashes of the records, so the full records are only fetched for the first few keys whose
+    hashes differ or which are sampled in one of the databases only. They are fetched from both
+    databases by their keys, in order to determine the differing columns, and to verify that a record
+    is actually missing rather than just outside the sample of the other database.
+    """
 
     def __init__(self, config: Configuration, table: DBTable) -> None:
         super().__init__(config, table, None)
+        self._window_bounds_lock = Lock()
+        self._window_bounds: Optional[Tuple[int, ...]] = None
+        # the hashes of the sampled records (16-byte digests) by their keys
+        self._sampled_hashes: Dict[DatabaseRole, Dict[Tuple[str, ...], bytes]] = {}
+
+    def validate(self, executor: Executor) -> ColumnValidationDetails:
+        self._sampled_hashes = {}
+        try:
+            details = super().validate(executor)
+            if details.result is ValidationResult.PASSED or len(self._sampled_hashes) < 2:
+                return details
+            return replace(details, record_differences=self._find_record_differences(executor))
+        finally:
+            self._sampled_hashes = {}
 
     def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
         if not self.table.has_primary_key:
             return ValidationQuery(sql="N/A", result_set="N/A")
 
-        pk_columns = ""
-        for column in self.table.primary_key_constraints[0].columns:
-            if pk_columns:
-                pk_columns += ", "
-            pk_columns += f"{column} ASC"
-        
-        select_columns = ""
-        for column in self.table.columns:
-            if select_columns:
-                select_columns += ", "
-            select_columns += f"UPPER(MD5({column.name}))" if column.is_large_object else column.name
-        engine = self.create_engine(db_properties)
-        with Session(engine) as session:
-            statement = f"SELECT {select_columns} FROM {self.table_name} ORDER BY {pk_columns} LIMIT {self.limit}"
-            result = session.execute(text(statement)).all()
-            return ValidationQuery(
-                sql=statement,
-                result_set=self.format_rows(result)
-            )
+        window_bounds = self._get_window_bounds()
+        if window_bounds is None:
+            statement = self._create_single_window_statement(db_properties)
+        else:
+            statement = self._create_multi_window_statement(db_properties, window_bounds)
+        hashed_rows = self._hash_rows(self.dialect(db_properties), self.execute(db_properties, statement))
+        self._sampled_hashes[db_properties.role] = dict(hashed_rows)
+        return ValidationQuery(
+            sql=statement,
+            result_set=self.format_rows([key + (row_hash.hex().upper(),) for key, row_hash in hashed_rows])
+        )
+
+    @property
+    def _pk_column_names(self) -> List[str]:
+        return [column.name for column in self.table.primary_key_constraints[0].columns]
+
+    @property
+    def _compared_columns(self) -> List[DBColumn]:
+        # the columns excluded by the profile of the table are neither hashed nor drilled down
+        return [
+            column for column in self.table.columns
+            if not self.validation_properties.is_column_excluded(self.table.name, column.name)
+        ]
+
+    def _select_columns(self, dialect: SQLDialect) -> List[str]:
+        # the primary key is selected in canonical form so that the failed records can be identified,
+        # the remaining columns are compared in form of a hash computed by the database server; if the
+        # database cannot compute it, the canonical fields are selected and hashed by the client
+        columns = self.table.columns_as_dict
+        result = [dialect.canonical_value(columns[name]) for name in self._pk_column_names]
+        if dialect.server_side_hashing:
+            result.append(dialect.row_hash(self._compared_columns))
+        else:
+            result.extend(dialect.canonical_field(column) for column in self._compared_columns)
+        return result
+
+    def _hash_rows(self, dialect: SQLDialect, rows: Sequence[Row[Any]]) -> List[Tuple[Tuple[str, ...], bytes]]:
+        """
+        Returns the keys and the hashes (16-byte MD5 digests) of the given records selected by the
+        columns provided by the _select_columns method.
+        """
+        key_length = len(self._pk_column_names)
+        keys = [tuple(row[:key_length]) for row in rows]
+        if dialect.server_side_hashing:
+            row_hashes = [bytes.fromhex(row[key_length]) for row in rows]
+        else:
+            hasher = get_client_hasher(self.validation_properties.hashing_processes)
+            row_hashes = hasher.digests(["".join(row[key_length:]) for row in rows])
+        return list(zip(keys, row_hashes))
+
+    def _create_single_window_statement(self, db_properties: DatabaseProperties) -> str:
+        select_columns = ", ".join(self._select_columns(self.dialect(db_properties)))
+        pk_columns = ", ".join(f"{name} ASC" for name in self._pk_column_names)
+        return f"SELECT {select_columns} FROM {self.table_name} ORDER BY {pk_columns} LIMIT {self.limit}"
+
+    def _create_multi_window_statement(self, db_properties: DatabaseProperties, window_bounds: Tuple[int, ...]) -> str:
+        pk_column_names = self._pk_column_names
+        select_columns = self._select_columns(self.dialect(db_properties))
+        value_aliases = [f"value_{index}" for index in range(len(select_columns))]
+        key_aliases = [f"key_{index}" for index in range(len(pk_column_names))]
+        inner_columns = ", ".join(
+            [f"{name} AS {alias}" for name, alias in zip(pk_column_names, key_aliases)] +
+            [f"{column} AS {alias}" for column, alias in zip(select_columns, value_aliases)]
+        )
+        rows_per_window = max(1, self.limit // (len(window_bounds) + 1))
+        ascending = ", ".join(f"{name} ASC" for name in pk_column_names)
+        descending = ", ".join(f"{name} DESC" for name in pk_column_names)
+        leading_column = pk_column_names[0]
+
+        # the windows partition the key space by the given bounds, so a missing or extra record only
+        # shifts the records of its own window, and no record is sampled twice; each window contains
+        # the records with the lowest keys within its part of the key space, except the last window,
+        # which contains the records with the highest keys
+        conditions = [f"{leading_column} < {window_bounds[0]}"] + [
+            f"{leading_column} >= {lower_bound} AND {leading_column} < {upper_bound}"
+            for lower_bound, upper_bound in zip(window_bounds, window_bounds[1:])
+        ]
+        windows = [
+            f"SELECT * FROM (SELECT {index} AS window_no, {inner_columns} FROM {self.table_name} WHERE {condition} ORDER BY {ascending} LIMIT {rows_per_window}) w{index}"
+            for index, condition in enumerate(conditions)
+        ]
+        index = len(conditions)
+        windows.append(
+            f"SELECT * FROM (SELECT {index} AS window_no, {inner_columns} FROM {self.table_name} WHERE {leading_column} >= {window_bounds[-1]} "
+            f"ORDER BY {descending} LIMIT {rows_per_window}) w{index}"
+        )
+        union = " UNION ALL ".join(windows)
+        order_by = ", ".join(["window_no ASC"] + [f"{alias} ASC" for alias in key_aliases])
+        return f"SELECT {', '.join(value_aliases)} FROM ({union}) windows ORDER BY {order_by}"
+
+    def _get_window_bounds(self) -> Optional[Tuple[int, ...]]:
+        """
+        Returns the keys separating the windows (the first key of each window except the first one),
+        or None if the records cannot be sampled by windows (the leading primary key column is not an
+        integer, or the table is empty).
+        """
+        leading_column = self.table.columns_as_dict[self._pk_column_names[0]]
+        window_count = min(self.validation_properties.record_windows, self.limit)
+        if leading_column.type_category is not TypeCategory.INTEGER or window_count < 2:
+            return None
+        with self._window_bounds_lock:
+            if self._window_bounds is None:
+                self._window_bounds = self._compute_window_bounds(leading_column.name, window_count)
+            return self._window_bounds or None
+
+    def _compute_window_bounds(self, column_name: str, window_count: int) -> Tuple[int, ...]:
+        statement = f"SELECT MIN({column_name}), MAX({column_name}) FROM {self.table_name}"
+        min_key, max_key = self.execute(self.source_db_config, statement)[0]
+        if min_key is None:
+            return ()
+        min_key, max_key = int(min_key), int(max_key)
+        # the bounds are jittered, but deterministic for the given table and key range, so that the
+        # same records are sampled in both databases, and also in repeated runs
+        random = Random(self.table.name)
+        spacing = (max_key - min_key) / window_count
+        bounds = set()
+        for index in range(1, window_count):
+            jitter = random.uniform(-spacing / 4, spacing / 4)
+            bounds.add(int(min_key + index * spacing + jitter))
+        # bounds equal after rounding (narrow key ranges) would lead to empty windows
+        return tuple(sorted(bounds))
+
+    def _find_record_differences(self, executor: Executor) -> Tuple[RecordDifference, ...]:
+        source_hashes = self._sampled_hashes[DatabaseRole.SOURCE]
+        target_hashes = self._sampled_hashes[DatabaseRole.TARGET]
+        candidates = [key for key, source_hash in source_hashes.items() if target_hashes.get(key) != source_hash]
+        candidates.extend(key for key in target_hashes if key not in source_hashes)
+        drill_down_limit = self.validation_properties.drill_down_limit
+        differences: List[RecordDifference] = []
+        # a key sampled in just one of the databases is not necessarily missing in the other one (e.g.
+        # the last window of the other database contains different keys if records are missing below
+        # the window), so the candidates are looked up in both databases before they are classified
+        for offset in range(0, len(candidates), drill_down_limit):
+            keys = candidates[offset:offset + drill_down_limit]
+            try:
+                differences.extend(self._look_up_differences(executor, keys))
+            except Exception:
+                # the drill-down is just a hint for the investigation of the failure, so the differences
+                # are derived from the samples if the records cannot be fetched
+                differences.extend(self._sampled_differences(keys))
+            if len(differences) >= drill_down_limit:
+                break
+        return tuple(differences[:drill_down_limit])
+
+    def _look_up_differences(self, executor: Executor, keys: List[Tuple[str, ...]]) -> List[RecordDifference]:
+        source_future = executor.submit(self._fetch_records, self.source_db_config, keys)
+        target_future = executor.submit(self._fetch_records, self.target_db_config, keys)
+        source_records = source_future.result()
+        target_records = target_future.result()
+        result = []
+        for key in keys:
+            source_record = source_records.get(key)
+            target_record = target_records.get(key)
+            if source_record is None and target_record is None:
+                # deleted since the samples were taken
+                continue
+            if target_record is None:
+                result.append(RecordDifference(key=key, missing_in_target=True))
+            elif source_record is None:
+                result.append(RecordDifference(key=key, missing_in_source=True))
+            else:
+                column_differences = self._column_differences(source_record, target_record)
+                if column_differences:
+                    result.append(RecordDifference(key=key, column_differences=column_differences))
+        return result
+
+    def _sampled_differences(self, keys: List[Tuple[str, ...]]) -> List[RecordDifference]:
+        source_hashes = self._sampled_hashes[DatabaseRole.SOURCE]
+        target_hashes = self._sampled_hashes[DatabaseRole.TARGET]
+        return [
+            RecordDifference(key=key, missing_in_source=key not in source_hashes, missing_in_target=key not in target_hashes)
+            for key in keys
+        ]
+
+    def _column_differences(self, source_record: Tuple[Optional[str], ...], target_record: Tuple[Optional[str], ...]) -> Tuple[ColumnDifference, ...]:
+        return tuple(
+            ColumnDifference(column_name=column.name, source_value=source_value, target_value=target_value)
+            for column, source_value, target_value in zip(self._compared_columns, source_record, target_record)
+            if source_value != target_value
+        )
+
+    def _drill_down(self, executor: Executor, differences: List[RecordDifference]) -> Tuple[RecordDifference, ...]:
+        """
+        Determines the differing columns of the given differences of records present in both databases.
+        """
+        differing_keys = [
+            difference.key for difference in differences
+            if not difference.missing_in_source and not difference.missing_in_target
+        ]
+        if not differing_keys:
+            return tuple(differences)
+
+        source_future = executor.submit(self._fetch_records, self.source_db_config, differing_keys)
+        target_future = executor.submit(self._fetch_records, self.target_db_config, differing_keys)
+        try:
+            source_records = source_future.result()
+            target_records = target_future.result()
+        except Exception:
+            # the drill-down is just a hint for the investigation of the failure, the differing
+            # keys are reported even if the records cannot be fetched
+            return tuple(differences)
+        result = []
+        for difference in differences:
+            source_record = source_records.get(difference.key)
+            target_record = target_records.get(difference.key)
+            if source_record is None or target_record is None:
+                result.append(difference)
+                continue
+            result.append(replace(difference, column_differences=self._column_differences(source_record, target_record)))
+        return tuple(result)
+
+    def _fetch_records(self, db_properties: DatabaseProperties, keys: List[Tuple[str, ...]]) -> Dict[Tuple[str, ...], Tuple[Optional[str], ...]]:
+        dialect = self.dialect(db_properties)
+        columns = self.table.columns_as_dict
+        pk_columns = [columns[name] for name in self._pk_column_names]
+        select_columns = ", ".join(
+            [dialect.canonical_value(column) for column in pk_columns] +
+            [dialect.canonical_value(column) for column in self._compared_columns]
+        )
+        conditions, parameters = dialect.keys_condition(pk_columns, keys)
+        statement = f"SELECT {select_columns} FROM {self.table_name} WHERE {conditions}"
+        key_length = len(pk_columns)
+        return {tuple(row[:key_length]): tuple(row[key_length:]) for row in self.execute(db_properties, statement, parameters)}
@@ -16,17 +16,33 @@
 # limitations under the License.
 #
 
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    replace,
+)
+from typing import Tuple
 
-from rdbmsdiff.foundation import DBTable, Status
+from rdbmsdiff.foundation import Status
 
 from .validation_details import (
     ColumnValidationDetails,
+    RecordDifference,
     TableValidationDetails,
+    ValidationQuery,
     ValidationResult,
 )
 
 
+# replaces the query details of passed validations once they have been written to the report
+_RELEASED_QUERY_DETAILS = ValidationQuery(sql="", result_set="")
+
+
+def _release_passed_payloads(details: ColumnValidationDetails) -> ColumnValidationDetails:
+    if details.result is not ValidationResult.PASSED:
+        return details
+    return replace(details, source_query_details=_RELEASED_QUERY_DETAILS, target_query_details=_RELEASED_QUERY_DETAILS)
+
+
 @dataclass(frozen=True, slots=True)
 class Statistics:
     overall_table_count: int
@@ -99,22 +115,51 @@ class Report:
         self._file.write("Result-set:\n")
         self._file.write(details.target_query_details.result_set)
         self._file.write("\n\n")
+        if details.record_differences:
+            self._write_record_differences(details.record_differences)
+
+    def _write_record_differences(self, differences: Tuple[RecordDifference, ...]) -> None:
+        self._file.write("Differing records:\n")
+        for difference in differences:
+            key = ", ".join(difference.key)
+            if difference.missing_in_source:
+                self._file.write(f"Key ({key}): missing in source DB\n")
+            elif difference.missing_in_target:
+                self._file.write(f"Key ({key}): missing in target DB\n")
+            elif not difference.column_differences:
+                self._file.write(f"Key ({key}): differing values (columns could not be determined)\n")
+            else:
+                self._file.write(f"Key ({key}): differing columns\n")
+                for column in difference.column_differences:
+                    self._file.write(f"    {column.column_name}: source = {column.source_value!r}, target = {column.target_value!r}\n")
+        self._file.write("\n")
 
-    def add_missing_table(self, table: DBTable) -> None:
+    def add_missing_table(self, table_name: str) -> None:
         self._statistics.add_missing_table()
         self._file.write(f"{90 * '='}\n")
-        self._file.write(f"= Table:  {table.name}\n")
+        self._file.write(f"= Table:  {table_name}\n")
         self._file.write(f"= Status: {Status.ERROR.name} (table missing in the target database)\n")
         self._file.write(f"{90 * '='}\n")
         self._file.write("\n")
         self._file.flush()
 
-    def add_validation_details(self, table_details: TableValidationDetails) -> None:
+    def add_validation_details(self, table_details: TableValidationDetails) -> TableValidationDetails:
+        """
+        Writes the given details to the report, and returns them without the SQL statements and the
+        result-sets of the passed validations. The report is the only consumer of these payloads, so
+        the caller is supposed to drop the given details and keep the returned ones (if any), in order
+        to release the payloads as soon as they have been written. The details of failed validations
+        are returned unchanged.
+        """
         self._statistics.add_validation_details(table_details)
         self._write_table_header(table_details)
         for column_details in table_details.column_validations_details:
             self._write_column_validation_details(column_details)
         self._file.flush()
+        return replace(
+            table_details,
+            column_validations_details=tuple(_release_passed_payloads(details) for details in table_details.column_validations_details),
+        )
 
     def get_statistics(self) -> Statistics:
         return self._statistics.get_snapshot()
@@ -0,0 +1,246 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from dataclasses import dataclass
+from datetime import datetime
+from gzip import open as gzip_open
+from json import (
+    dump,
+    load,
+)
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+    Type,
+)
+
+from rich.console import Console
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    DBSchema,
+    Stopwatch,
+    ValidationProperties,
+)
+
+from .abstract_validator import AbstractValidator
+from .boolean_validator import BooleanValidator
+from .date_time_validator import DateTimeValidator
+from .distinct_count_validator import DistinctCountValidator
+from .distribution_validator import DistributionValidator
+from .full_record_validator import FullRecordValidator
+from .key_presence_validator import KeyPresenceValidator
+from .large_object_validator import LargeObjectValidator
+from .null_value_count_validator import NullValueCountValidator
+from .numeric_validator import NumericValidator
+from .record_validator import RecordValidator
+from .report import Report
+from .validation_details import (
+    ColumnValidationDetails,
+    TableValidationDetails,
+    ValidationQuery,
+    ValidationResult,
+)
+from .validation_engine import create_validators
+from .varchar_length_validator import VarcharLengthValidator
+from .varchar_value_validator import VarcharValueValidator
+
+
+_FORMAT_VERSION = 1
+
+_VALIDATOR_CLASSES: Dict[str, Type[AbstractValidator]] = {
+    validator_class.__name__: validator_class for validator_class in (
+        BooleanValidator,
+        DateTimeValidator,
+        DistinctCountValidator,
+        DistributionValidator,
+        FullRecordValidator,
+        KeyPresenceValidator,
+        LargeObjectValidator,
+        NullValueCountValidator,
+        NumericValidator,
+        RecordValidator,
+        VarcharLengthValidator,
+        VarcharValueValidator,
+    )
+}
+
+_MISSING_VALIDATION = ValidationQuery(
+    sql="N/A",
+    result_set="No result-set - validation missing in the snapshot",
+)
+
+
+class ReadSnapshotError(Exception):
+    ...
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationSnapshot:
+    key: str
+    validator: str
+    description: str
+    query: ValidationQuery
+
+
+@dataclass(frozen=True, slots=True)
+class TableSnapshot:
+    name: str
+    validations: Tuple[ValidationSnapshot, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DatabaseSnapshot:
+    url: str
+    schema: str
+    created: str
+    tables: Tuple[TableSnapshot, ...]
+
+
+def _snapshot_to_dict(snapshot: DatabaseSnapshot) -> Dict[str, Any]:
+    return {
+        "format_version": _FORMAT_VERSION,
+        "url": snapshot.url,
+        "schema": snapshot.schema,
+        "created": snapshot.created,
+        "tables": [
+            {
+                "name": table.name,
+                "validations": [
+                    {
+                        "key": validation.key,
+                        "validator": validation.validator,
+                        "description": validation.description,
+                        "sql": validation.query.sql,
+                        "result_set": validation.query.result_set,
+                        "error": validation.query.error,
+                    } for validation in table.validations
+                ],
+            } for table in snapshot.tables
+        ],
+    }
+
+
+def _snapshot_from_dict(data: Dict[str, Any]) -> DatabaseSnapshot:
+    return DatabaseSnapshot(
+        url=data["url"],
+        schema=data["schema"],
+        created=data["created"],
+        tables=tuple(
+            TableSnapshot(
+                name=table["name"],
+                validations=tuple(
+                    ValidationSnapshot(
+                        key=validation["key"],
+                        validator=validation["validator"],
+                        description=validation["description"],
+                        query=ValidationQuery(sql=validation["sql"], result_set=validation["result_set"], error=validation.get("error", False)),
+                    ) for validation in table["validations"]
+                ),
+            ) for table in data["tables"]
+        ),
+    )
+
+
+def write_snapshot(snapshot: DatabaseSnapshot, filename: str) -> None:
+    with gzip_open(filename, "wt", encoding="UTF-8") as file:
+        dump(_snapshot_to_dict(snapshot), file, separators=(",", ":"))
+
+
+def read_snapshot(filename: str) -> DatabaseSnapshot:
+    try:
+        with gzip_open(filename, "rt", encoding="UTF-8") as file:
+            data = load(file)
+    except (OSError, ValueError) as e:
+        raise ReadSnapshotError(f"Cannot read snapshot file {filename} ({e}).")
+    if data.get("format_version") != _FORMAT_VERSION:
+        raise ReadSnapshotError(f"Cannot read snapshot file {filename} (unsupported format version {data.get('format_version')}).")
+    return _snapshot_from_dict(data)
+
+
+def create_snapshot(db_properties: DatabaseProperties, db_meta_data: DBSchema, validation_properties: ValidationProperties) -> DatabaseSnapshot:
+    """
+    Runs the queries of all validators against a single database and collects their results.
+    """
+    console = Console(record=False, highlight=False)
+    console.print()
+    console.print("[cyan]Going to create snapshot...[/]")
+
+    # validators are designed for a pair of databases; for a snapshot, the same database is used as both
+    config = Configuration(source_db_config=db_properties, target_db_config=db_properties, validation_properties=validation_properties)
+    table_count = len(db_meta_data.tables)
+    tables = []
+    overall_stopwatch = Stopwatch.start()
+    with console.status("Scanning tables..."):
+        for index, table in enumerate(db_meta_data.tables):
+            if not validation_properties.is_table_included(table.name):
+                console.print(f"{table.name} ({index + 1}/{table_count}) excluded from snapshot")
+                continue
+            stopwatch = Stopwatch.start()
+            validations = []
+            for validator in create_validators(config, table):
+                validations.append(ValidationSnapshot(
+                    key=validator.key,
+                    validator=type(validator).__name__,
+                    description=validator.description,
+                    query=validator.run_query(db_properties),
+                ))
+            tables.append(TableSnapshot(name=table.name, validations=tuple(validations)))
+            console.print(f"{table.name} ({index + 1}/{table_count}) scanned (totally {len(validations)} queries, duration = {stopwatch.elapsed_time_as_str()})")
+    console.print(f"Overall duration = {overall_stopwatch.elapsed_time_as_str()}")
+
+    return DatabaseSnapshot(
+        url=db_properties.url_without_password,
+        schema=db_properties.schema,
+        created=datetime.now().isoformat(timespec="seconds"),
+        tables=tuple(tables),
+    )
+
+
+def _compare_table_snapshots(source_table: TableSnapshot, target_table: TableSnapshot) -> TableValidationDetails:
+    target_validations = {validation.key: validation for validation in target_table.validations}
+    details = []
+    for source_validation in source_table.validations:
+        target_validation = target_validations.get(source_validation.key)
+        if target_validation is None:
+            result = ValidationResult.FAILED
+            target_query = _MISSING_VALIDATION
+        else:
+            validator_class = _VALIDATOR_CLASSES.get(source_validation.validator, AbstractValidator)
+            matching = validator_class.results_match(source_validation.query.result_set, target_validation.query.result_set)
+            result = ValidationResult.PASSED if matching else ValidationResult.FAILED
+            target_query = target_validation.query
+        details.append(ColumnValidationDetails(
+            result=result,
+            validator_description=source_validation.description,
+            source_query_details=source_validation.query,
+            target_query_details=target_query,
+        ))
+    return TableValidationDetails(source_table.name, tuple(details))
+
+
+def diff_snapshots(source_snapshot: DatabaseSnapshot, target_snapshot: DatabaseSnapshot, report: Report) -> None:
+    target_tables = {table.name: table for table in target_snapshot.tables}
+    for source_table in source_snapshot.tables:
+        target_table = target_tables.get(source_table.name)
+        if target_table is None:
+            report.add_missing_table(source_table.name)
+            continue
+        report.add_validation_details(_compare_table_snapshots(source_table, target_table))
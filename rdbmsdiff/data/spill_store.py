@@ -0,0 +1,229 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from hashlib import md5
+from heapq import merge
+from mmap import (
+    ACCESS_READ,
+    mmap,
+)
+from os import (
+    path,
+    remove,
+)
+from struct import Struct
+from tempfile import TemporaryDirectory
+from typing import (
+    BinaryIO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+
+# MD5 digest of the key, row hash (MD5 digest of the record), offset of the key in the key file;
+# big-endian, so that the records are ordered by the digest of the key when compared as bytes
+_RECORD = Struct(">16s16sQ")
+
+_KEY_LENGTH = Struct(">I")
+
+# separates the values of composite keys
+_KEY_SEPARATOR = "\x1f"
+
+# the max. number of records sorted in memory (each run takes about 40 bytes per record on disk, and
+# about twice as much in memory while it is sorted)
+_DEFAULT_RUN_LENGTH = 500_000
+
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+SpillRecord = Tuple[bytes, bytes, int]
+
+
+class SpillStore:
+    """
+    Set of keys and row hashes stored on disk, so that all records of a table can be compared in
+    bounded memory. The keys are appended to a key file, and fixed-width records (the digest of the
+    key, the row hash, and the offset of the key) are collected in a byte array. When the array is
+    full, its records are sorted by the digest of the key, and written to a sorted run file. When all
+    records have been added, the runs are merged into a single sorted file, which is memory-mapped.
+    Thus, two stores can be compared by a single sequential pass over both of them, regardless of
+    the order the records have been fetched in.
+
+    The files are created in a temporary directory (in the given directory, or in the default location
+    for temporary files), which is deleted when the store is closed.
+    """
+
+    __slots__ = ("_directory", "_run_length", "_buffer", "_run_files", "_key_file", "_key_offset", "_records", "_keys", "_count", "_digest")
+
+    def __init__(self, directory: Optional[str] = None, run_length: int = _DEFAULT_RUN_LENGTH) -> None:
+        self._directory = TemporaryDirectory(prefix="rdbmsdiff-", dir=directory)
+        self._run_length = run_length
+        self._buffer = bytearray()
+        self._run_files: List[str] = []
+        self._key_file: BinaryIO = open(self._file_path("keys"), "w+b", buffering=_WRITE_BUFFER_SIZE)
+        self._key_offset = 0
+        self._records: Optional[mmap] = None
+        self._keys: Optional[mmap] = None
+        self._count = 0
+        self._digest: Optional[str] = None
+
+    def __enter__(self) -> "SpillStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _file_path(self, name: str) -> str:
+        return path.join(self._directory.name, name)
+
+    def add(self, key: Sequence[str], row_hash: bytes) -> None:
+        """
+        Adds the given key (the values of the primary key columns in canonical form) together with
+        the given row hash (16-byte MD5 digest).
+        """
+        encoded_key = _KEY_SEPARATOR.join(key).encode("UTF-8")
+        self._key_file.write(_KEY_LENGTH.pack(len(encoded_key)))
+        self._key_file.write(encoded_key)
+        self._buffer += _RECORD.pack(md5(encoded_key).digest(), row_hash, self._key_offset)
+        self._key_offset += _KEY_LENGTH.size + len(encoded_key)
+        self._count += 1
+        if len(self._buffer) >= self._run_length * _RECORD.size:
+            self._write_run()
+
+    def _write_run(self) -> None:
+        record_size = _RECORD.size
+        records = sorted(self._buffer[offset:offset + record_size] for offset in range(0, len(self._buffer), record_size))
+        filename = self._file_path(f"run_{len(self._run_files)}")
+        with open(filename, "wb", buffering=_WRITE_BUFFER_SIZE) as run_file:
+            run_file.writelines(records)
+        self._run_files.append(filename)
+        self._buffer = bytearray()
+
+    def finish(self) -> None:
+        """
+        Merges the sorted runs into a single sorted file and maps it (and the key file) into memory.
+        No records can be added afterwards.
+        """
+        self._key_file.flush()
+        if self._count == 0:
+            self._digest = md5().hexdigest().upper()
+            return
+        if self._buffer:
+            self._write_run()
+        if len(self._run_files) == 1:
+            sorted_filename = self._run_files[0]
+        else:
+            sorted_filename = self._merge_runs()
+        with open(sorted_filename, "rb") as sorted_file:
+            self._records = mmap(sorted_file.fileno(), 0, access=ACCESS_READ)
+        self._keys = mmap(self._key_file.fileno(), 0, access=ACCESS_READ)
+        digest = md5()
+        for key_digest, row_hash, _ in self:
+            digest.update(key_digest)
+            digest.update(row_hash)
+        self._digest = digest.hexdigest().upper()
+
+    def _merge_runs(self) -> str:
+        filename = self._file_path("sorted")
+        run_maps = []
+        try:
+            for run_filename in self._run_files:
+                with open(run_filename, "rb") as run_file:
+                    run_maps.append(mmap(run_file.fileno(), 0, access=ACCESS_READ))
+            with open(filename, "wb", buffering=_WRITE_BUFFER_SIZE) as sorted_file:
+                sorted_file.writelines(merge(*(self._iterate_raw(run_map) for run_map in run_maps)))
+        finally:
+            for run_map in run_maps:
+                run_map.close()
+        for run_filename in self._run_files:
+            remove(run_filename)
+        self._run_files = []
+        return filename
+
+    @staticmethod
+    def _iterate_raw(records: mmap) -> Iterator[bytes]:
+        record_size = _RECORD.size
+        for offset in range(0, len(records), record_size):
+            yield records[offset:offset + record_size]
+
+    @property
+    def digest(self) -> str:
+        """
+        Returns the MD5 digest of all keys and row hashes. Stores containing the same records have the
+        same digest, regardless of the order the records have been added in.
+        """
+        if self._digest is None:
+            raise RuntimeError("The store has not been finished yet.")
+        return self._digest
+
+    def __iter__(self) -> Iterator[SpillRecord]:
+        """
+        Iterates over the records (the digest of the key, the row hash, and the offset of the key)
+        ordered by the digest of the key.
+        """
+        if self._records is None:
+            return
+        for offset in range(0, len(self._records), _RECORD.size):
+            yield _RECORD.unpack_from(self._records, offset)
+
+    def key(self, key_offset: int) -> Tuple[str, ...]:
+        """
+        Returns the key stored at the given offset of the key file.
+        """
+        length, = _KEY_LENGTH.unpack_from(self._keys, key_offset)
+        start = key_offset + _KEY_LENGTH.size
+        return tuple(self._keys[start:start + length].decode("UTF-8").split(_KEY_SEPARATOR))
+
+    def close(self) -> None:
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+        if self._keys is not None:
+            self._keys.close()
+            self._keys = None
+        self._key_file.close()
+        self._directory.cleanup()
+
+
+def compare_stores(source: SpillStore, target: SpillStore) -> Iterator[Tuple[Optional[SpillRecord], Optional[SpillRecord]]]:
+    """
+    Compares the given (finished) stores by a single pass over both of them. Yields the pairs of
+    differing records - a pair with the source record only (missing in the target store), with the
+    target record only (missing in the source store), or with both records (differing row hashes).
+    """
+    source_records = iter(source)
+    target_records = iter(target)
+    source_record = next(source_records, None)
+    target_record = next(target_records, None)
+    while source_record is not None or target_record is not None:
+        if target_record is None or (source_record is not None and source_record[0] < target_record[0]):
+            yield source_record, None
+            source_record = next(source_records, None)
+        elif source_record is None or target_record[0] < source_record[0]:
+            yield None, target_record
+            target_record = next(target_records, None)
+        else:
+            if source_record[1] != target_record[1]:
+                yield source_record, target_record
+            source_record = next(source_records, None)
+            target_record = next(target_records, None)
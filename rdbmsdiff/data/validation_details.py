@@ -22,7 +22,10 @@ from enum import (
     auto,
     unique,
 )
-from typing import Tuple
+from typing import (
+    Optional,
+    Tuple,
+)
 
 
 @unique
@@ -31,21 +34,44 @@ class ValidationResult(Enum):
     FAILED = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationQuery:
     sql: str
     result_set: str
+    # true if the query has failed, the result-set then describes the error
+    error: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnDifference:
+    column_name: str
+    source_value: Optional[str]
+    target_value: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class RecordDifference:
+    """
+    Describes a record whose primary key has been found in just one of the databases, or a record
+    whose values differ. For the latter, the differing columns are provided (if they could be
+    determined).
+    """
+    key: Tuple[str, ...]
+    missing_in_source: bool = False
+    missing_in_target: bool = False
+    column_differences: Tuple[ColumnDifference, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnValidationDetails:
     result: ValidationResult
     validator_description: str
     source_query_details: ValidationQuery
     target_query_details: ValidationQuery
+    record_differences: Tuple[RecordDifference, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableValidationDetails:
     table_name: str
     column_validations_details: Tuple[ColumnValidationDetails, ...]
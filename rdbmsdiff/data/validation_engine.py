@@ -16,20 +16,35 @@
 # limitations under the License.
 #
 
-from typing import Tuple
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+)
+from typing import (
+    List,
+    Tuple,
+)
 
 from rich.console import Console
 
 from rdbmsdiff.foundation import (
     Configuration,
+    DBColumn,
     DBSchema,
     DBTable,
     Stopwatch,
+    TypeCategory,
+    get_concurrency_limiter,
 )
 
 from .abstract_validator import AbstractValidator
 from .boolean_validator import BooleanValidator
 from .date_time_validator import DateTimeValidator
+from .distinct_count_validator import DistinctCountValidator
+from .distribution_validator import DistributionValidator
+from .full_record_validator import FullRecordValidator
+from .key_presence_validator import KeyPresenceValidator
+from .large_object_validator import LargeObjectValidator
 from .null_value_count_validator import (
     NullValueCheckType,
     NullValueCountValidator,
@@ -42,6 +57,60 @@ from .varchar_length_validator import VarcharLengthValidator
 from .varchar_value_validator import VarcharValueValidator
 
 
+_NUMERIC_TYPE_CATEGORIES = (TypeCategory.INTEGER, TypeCategory.DECIMAL, TypeCategory.FLOAT)
+
+
+def _create_column_validators(config: Configuration, table: DBTable, column: DBColumn) -> List[AbstractValidator]:
+    result = []
+    if column.is_large_object:
+        # the large object validator compares the lengths as well; neither the lengths nor the distinct
+        # values are compared by separate validators, as each of them would read all the (possibly
+        # multi-megabyte) values once more, and sorting all hashes of the values would dominate the
+        # validation time
+        result.append(LargeObjectValidator(config, table, column))
+    elif column.type_category in _NUMERIC_TYPE_CATEGORIES:
+        result.append(NumericValidator(config, table, column))
+    elif column.is_string:
+        result.append(VarcharLengthValidator(config, table, column))
+        result.append(VarcharValueValidator(config, table, column))
+    elif column.is_boolean:
+        result.append(BooleanValidator(config, table, column))
+    elif column.is_date_time:
+        result.append(DateTimeValidator(config, table, column))
+    distinct_count_supported = column.type_category is not TypeCategory.BOOLEAN and not column.is_large_object
+    if config.validation_properties.distinct_count_sketches and distinct_count_supported:
+        result.append(DistinctCountValidator(config, table, column))
+    if column.nullable:
+        result.append(NullValueCountValidator(config, table, column, NullValueCheckType.IS_NULL))
+        result.append(NullValueCountValidator(config, table, column, NullValueCheckType.IS_NOT_NULL))
+    return result
+
+
+def create_validators(config: Configuration, table: DBTable) -> Tuple[AbstractValidator, ...]:
+    """
+    Creates the validators for the given table, taking the validation profile of the table (if any)
+    into account.
+    """
+    validation_properties = config.validation_properties
+    result = []
+    for column in table.columns:
+        for validator in _create_column_validators(config, table, column):
+            if validation_properties.is_validator_enabled(type(validator).__name__, table.name, column.name):
+                result.append(validator)
+    if validation_properties.is_validator_enabled(DistributionValidator.__name__, table.name):
+        distribution_validator = DistributionValidator(config, table)
+        if distribution_validator.histogram_columns:
+            result.append(distribution_validator)
+    if validation_properties.is_validator_enabled(RecordValidator.__name__, table.name):
+        if validation_properties.full_record_comparison:
+            result.append(FullRecordValidator(config, table))
+        else:
+            result.append(RecordValidator(config, table))
+    if validation_properties.key_presence and table.has_primary_key and validation_properties.is_validator_enabled(KeyPresenceValidator.__name__, table.name):
+        result.append(KeyPresenceValidator(config, table))
+    return tuple(result)
+
+
 class ValidationEngine:
 
     def __init__(self, config: Configuration, source_db_meta_data: DBSchema, target_db_meta_data: DBSchema, report: Report):
@@ -51,30 +120,10 @@ class ValidationEngine:
         self._report = report
         self._console = Console(record=False, highlight=False)
 
-    def _create_validators(self, table: DBTable) -> Tuple[AbstractValidator, ...]:
-        result = []
-        for column in table.columns:
-            if column.is_numeric:
-                result.append(NumericValidator(self._config, table, column))
-            elif column.is_string:
-                result.append(VarcharLengthValidator(self._config, table, column))
-                result.append(VarcharValueValidator(self._config, table, column))
-            elif column.is_boolean:
-                result.append(BooleanValidator(self._config, table, column))
-            elif column.is_date_time:
-                result.append(DateTimeValidator(self._config, table, column))
-            if column.nullable:
-                result.append(NullValueCountValidator(self._config, table, column, NullValueCheckType.IS_NULL))
-                result.append(NullValueCountValidator(self._config, table, column, NullValueCheckType.IS_NOT_NULL))
-        result.append(RecordValidator(self._config, table))
-        return tuple(result)
-
-    def _validate_single_table(self, table: DBTable) -> TableValidationDetails:
-        validators = self._create_validators(table)
-        details = []
-        for validator in validators:
-            column_validation_details = validator.validate()
-            details.append(column_validation_details)
+    def _validate_single_table(self, table: DBTable, validator_executor: Executor, query_executor: Executor) -> TableValidationDetails:
+        validators = create_validators(self._config, table)
+        futures = [validator_executor.submit(validator.validate, query_executor) for validator in validators]
+        details = [future.result() for future in futures]
         return TableValidationDetails(table.name, tuple(details))
 
     def validate(self) -> None:
@@ -82,16 +131,28 @@ class ValidationEngine:
         self._console.print("[cyan]Going to compare tables...[/]")
         table_count = len(self._source_db_meta_data.tables)
         overall_stopwatch = Stopwatch.start()
-        with self._console.status(f"Comparing tables..."):
+        # the actual number of parallel queries is governed by the concurrency limiters, the executors
+        # just have to provide enough threads to reach the max. concurrency for both databases
+        max_concurrency = self._config.source_db_config.max_concurrency + self._config.target_db_config.max_concurrency
+        with ThreadPoolExecutor(max_workers=max_concurrency) as validator_executor, \
+                ThreadPoolExecutor(max_workers=2 * max_concurrency) as query_executor, \
+                self._console.status(f"Comparing tables..."):
             for index, table in enumerate(self._source_db_meta_data.tables):
+                if not self._config.validation_properties.is_table_included(table.name):
+                    self._console.print(f"{table.name} ({index + 1}/{table_count}) excluded from comparison")
+                    continue
                 if not self._target_db_meta_data.has_table(table):
-                    self._report.add_missing_table(table)
+                    self._report.add_missing_table(table.name)
                     self._console.print(f"{table.name} ({index + 1}/{table_count}) missing in target database")
                     continue
                 stopwatch = Stopwatch.start()
-                details = self._validate_single_table(table)
+                details = self._validate_single_table(table, validator_executor, query_executor)
                 elapsed_time = stopwatch.elapsed_time_as_str()
-                self._report.add_validation_details(details)
+                # the payloads of the passed validations are released once written to the report
+                details = self._report.add_validation_details(details)
                 self._console.print(f"{table.name} ({index + 1}/{table_count}) compared (totally {details.overall_validation_count} comparisons, duration = {elapsed_time})")
         overall_elapsed_time = overall_stopwatch.elapsed_time_as_str()
         print(f"Overall duration = {overall_elapsed_time}")
+        source_limiter = get_concurrency_limiter(self._config.source_db_config)
+        target_limiter = get_concurrency_limiter(self._config.target_db_config)
+        print(f"Final concurrency limit: source DB = {source_limiter.limit}/{source_limiter.max_limit}, target DB = {target_limiter.limit}/{target_limiter.max_limit}")
@@ -16,9 +16,6 @@
 # limitations under the License.
 #
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
 from rdbmsdiff.foundation import (
     Configuration,
     DatabaseProperties,
@@ -35,11 +32,11 @@ class VarcharLengthValidator(AbstractValidator):
         super().__init__(config, table, column)
 
     def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
-        engine = self.create_engine(db_properties)
-        with Session(engine) as session:
-            statement = f"SELECT LENGTH({self.column_name}), COUNT(LENGTH({self.column_name})) FROM {self.table_name} GROUP BY LENGTH({self.column_name}) ORDER BY LENGTH({self.column_name}) ASC"
-            result = session.execute(text(statement)).all()
-            return ValidationQuery(
-                sql=statement,
-                result_set=self.format_rows(result)
-            )
+        # the number of characters, not bytes (e.g. LENGTH returns the number of bytes in MySQL)
+        length = self.dialect(db_properties).char_length(self.column_name)
+        statement = f"SELECT {length}, COUNT({length}) FROM {self.table_name} GROUP BY {length} ORDER BY {length} ASC"
+        result = self.execute(db_properties, statement)
+        return ValidationQuery(
+            sql=statement,
+            result_set=self.format_rows(result)
+        )
@@ -16,16 +16,24 @@
 # limitations under the License.
 #
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from heapq import nsmallest
+from typing import (
+    Any,
+    List,
+    Sequence,
+)
+
+from sqlalchemy.engine import Row
 
 from rdbmsdiff.foundation import (
     Configuration,
     DatabaseProperties,
     DBColumn,
     DBTable,
+    SQLDialect,
 )
 from .abstract_validator import AbstractValidator
+from .client_hashing import get_client_hasher
 from .validation_details import ValidationQuery
 
 
@@ -35,11 +43,29 @@ class VarcharValueValidator(AbstractValidator):
         super().__init__(config, table, column)
 
     def _select(self, db_properties: DatabaseProperties) -> ValidationQuery:
-        engine = self.create_engine(db_properties)
-        with Session(engine) as session:
-            statement = f"SELECT UPPER(MD5({self.column_name})) FROM {self.table_name} WHERE {self.column_name} IS NOT NULL ORDER BY UPPER(MD5({self.column_name})) ASC LIMIT {self.limit}"
-            result = session.execute(text(statement)).all()
-            return ValidationQuery(
-                sql=statement,
-                result_set=self.format_rows(result)
-            )
+        dialect = self.dialect(db_properties)
+        if not dialect.server_side_hashing:
+            return self._select_hashed_by_client(db_properties, dialect)
+        value_hash = dialect.md5(dialect.canonical_value(self.column))
+        statement = f"SELECT {value_hash} FROM {self.table_name} WHERE {self.column_name} IS NOT NULL ORDER BY {value_hash} ASC LIMIT {self.limit}"
+        result = self.execute(db_properties, statement)
+        return ValidationQuery(
+            sql=statement,
+            result_set=self.format_rows(result)
+        )
+
+    def _select_hashed_by_client(self, db_properties: DatabaseProperties, dialect: SQLDialect) -> ValidationQuery:
+        # the database cannot compute the hashes, so all values are streamed and hashed by the client,
+        # which keeps the lowest hashes (i.e. the same hashes the other database selects)
+        statement = f"SELECT {dialect.canonical_value(self.column)} FROM {self.table_name} WHERE {self.column_name} IS NOT NULL"
+        hasher = get_client_hasher(self.validation_properties.hashing_processes)
+        lowest_digests: List[bytes] = []
+
+        def consume_rows(rows: Sequence[Row[Any]]) -> None:
+            lowest_digests[:] = nsmallest(self.limit, lowest_digests + hasher.digests([str(row[0]) for row in rows]))
+
+        self.execute_streamed(db_properties, statement, consume_rows, lowest_digests.clear)
+        return ValidationQuery(
+            sql=statement,
+            result_set=self.format_rows([(digest.hex().upper(),) for digest in lowest_digests])
+        )
@@ -16,24 +16,128 @@
 # limitations under the License.
 #
 
-from .config import (
-    Configuration,
-    DatabaseProperties,
-    DatabaseRole,
-    ReadConfigurationError,
-    epilog,
-    handle_configuration_error,
-    read_config,
-)
-from .metadata import (
-    DBColumn,
-    DBTable,
-    DBSchema,
-)
-from .metadata import read_db_meta_data
-from .stopwatch import Stopwatch
-from .util import (
-    Status,
-    handle_general_error,
-    print_banner,
+"""
+The modules of this package are imported lazily, upon the first access to one of their members.
+Some of them depend on heavy libraries (SQLAlchemy, rich), which would otherwise be imported even
+if they are not needed (e.g. when the command line help is displayed).
+"""
+
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
 )
+
+if TYPE_CHECKING:
+    from .concurrency import (
+        AdaptiveConcurrencyLimiter,
+        get_concurrency_limiter,
+    )
+    from .config import (
+        Configuration,
+        DatabaseProperties,
+        DatabaseRole,
+        ReadConfigurationError,
+        RecordCountProperties,
+        TableValidationProfile,
+        ValidationProperties,
+        epilog,
+        handle_configuration_error,
+        read_config,
+        read_db_config,
+        read_validation_config,
+        validator_key,
+    )
+    from .dialect import (
+        SQLDialect,
+        get_dialect,
+    )
+    from .engine import (
+        cancel_running_queries,
+        create_db_engine,
+        dispose_db_engines,
+        get_db_engine,
+    )
+    from .instrumentation import (
+        Phase,
+        QueryBudgetExceededError,
+        QueryCounters,
+        QueryStatistics,
+        QueryStatisticsSnapshot,
+        create_query_statistics_table,
+        get_query_statistics,
+        record_fetched_rows,
+        with_phase,
+    )
+    from .metadata import (
+        DBColumn,
+        DBTable,
+        DBSchema,
+        TypeCategory,
+    )
+    from .reflection import read_db_meta_data
+    from .stopwatch import Stopwatch
+    from .util import (
+        Status,
+        handle_general_error,
+        print_banner,
+    )
+
+
+_MEMBER_MODULES = {
+    "AdaptiveConcurrencyLimiter": "concurrency",
+    "get_concurrency_limiter": "concurrency",
+    "Configuration": "config",
+    "DatabaseProperties": "config",
+    "DatabaseRole": "config",
+    "ReadConfigurationError": "config",
+    "RecordCountProperties": "config",
+    "TableValidationProfile": "config",
+    "ValidationProperties": "config",
+    "epilog": "config",
+    "handle_configuration_error": "config",
+    "read_config": "config",
+    "read_db_config": "config",
+    "read_validation_config": "config",
+    "validator_key": "config",
+    "SQLDialect": "dialect",
+    "get_dialect": "dialect",
+    "cancel_running_queries": "engine",
+    "create_db_engine": "engine",
+    "dispose_db_engines": "engine",
+    "get_db_engine": "engine",
+    "Phase": "instrumentation",
+    "QueryBudgetExceededError": "instrumentation",
+    "QueryCounters": "instrumentation",
+    "QueryStatistics": "instrumentation",
+    "QueryStatisticsSnapshot": "instrumentation",
+    "create_query_statistics_table": "instrumentation",
+    "get_query_statistics": "instrumentation",
+    "record_fetched_rows": "instrumentation",
+    "with_phase": "instrumentation",
+    "DBColumn": "metadata",
+    "DBTable": "metadata",
+    "DBSchema": "metadata",
+    "TypeCategory": "metadata",
+    "read_db_meta_data": "reflection",
+    "Stopwatch": "stopwatch",
+    "Status": "util",
+    "handle_general_error": "util",
+    "print_banner": "util",
+}
+
+__all__ = list(_MEMBER_MODULES.keys())
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MEMBER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_MEMBER_MODULES[name]}", __name__), name)
+    # cached, so that subsequent accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return __all__
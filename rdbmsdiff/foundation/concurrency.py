@@ -0,0 +1,125 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from contextlib import contextmanager
+from threading import (
+    Condition,
+    Lock,
+)
+from time import perf_counter
+from typing import (
+    Dict,
+    Iterator,
+)
+
+from .config import (
+    DatabaseProperties,
+    DatabaseRole,
+)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of queries running in parallel against a database. The limit is adapted
+    using the AIMD (additive increase, multiplicative decrease) algorithm. Each query completed
+    in reasonable time increases the limit by 1/limit (i.e. roughly by one per "round" of queries),
+    each failed query and each query significantly slower than usual halves the limit. The limit
+    never exceeds the given hard ceiling, and it never drops below one.
+
+    A query is considered significantly slower than usual if its latency exceeds the smoothed
+    average latency of the previous queries multiplied by the tolerance. As the queries of
+    the validators are heterogeneous, the average is only a rough signal - it reacts to an
+    overloaded database (all queries slower), but it also reacts to an expensive query.
+    """
+
+    _SMOOTHING_FACTOR = 0.2
+
+    _WARM_UP_QUERY_COUNT = 5
+
+    def __init__(self, max_limit: int, initial_limit: int = 1, latency_tolerance: float = 3.0, backoff_ratio: float = 0.5) -> None:
+        self._max_limit = max_limit
+        self._limit = float(min(initial_limit, max_limit))
+        self._latency_tolerance = latency_tolerance
+        self._backoff_ratio = backoff_ratio
+        self._average_latency_sec = 0.0
+        self._completed_query_count = 0
+        self._running_query_count = 0
+        self._condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        return self._max_limit
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._running_query_count >= int(self._limit):
+                self._condition.wait()
+            self._running_query_count += 1
+
+    def release(self, latency_sec: float, failed: bool) -> None:
+        with self._condition:
+            self._running_query_count -= 1
+            self._adapt_limit(latency_sec, failed)
+            self._condition.notify_all()
+
+    def _adapt_limit(self, latency_sec: float, failed: bool) -> None:
+        warmed_up = self._completed_query_count >= self._WARM_UP_QUERY_COUNT
+        too_slow = warmed_up and latency_sec > self._latency_tolerance * self._average_latency_sec
+        if failed or too_slow:
+            self._limit = max(1.0, self._limit * self._backoff_ratio)
+        else:
+            self._limit = min(float(self._max_limit), self._limit + 1.0 / self._limit)
+        if not failed:
+            if self._completed_query_count == 0:
+                self._average_latency_sec = latency_sec
+            else:
+                self._average_latency_sec += self._SMOOTHING_FACTOR * (latency_sec - self._average_latency_sec)
+            self._completed_query_count += 1
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        Context manager wrapping a single query; it waits for a free slot, measures the latency
+        of the query and adapts the limit.
+        """
+        self.acquire()
+        start_time = perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.release(perf_counter() - start_time, failed)
+
+
+_LIMITERS: Dict[DatabaseRole, AdaptiveConcurrencyLimiter] = {}
+
+_LIMITERS_LOCK = Lock()
+
+
+def get_concurrency_limiter(db_properties: DatabaseProperties) -> AdaptiveConcurrencyLimiter:
+    with _LIMITERS_LOCK:
+        if db_properties.role not in _LIMITERS:
+            _LIMITERS[db_properties.role] = AdaptiveConcurrencyLimiter(db_properties.max_concurrency)
+        return _LIMITERS[db_properties.role]
@@ -0,0 +1,437 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from abc import ABC
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import DBAPIError
+
+from .config import DatabaseProperties
+from .metadata import (
+    DBColumn,
+    TypeCategory,
+)
+
+
+class SQLDialect(ABC):
+    """
+    Generates vendor specific SQL expressions. The most important responsibility is the
+    canonical serialization of column values - regardless of the database engine, a value
+    of a given TypeCategory is converted to the same string, so hashes computed by the
+    database servers can be compared across engines (e.g. PostgreSQL vs. MariaDB).
+
+    The canonical form is defined as follows:
+    - booleans are serialized as '1' or '0'
+    - integers are serialized as decimal numbers
+    - decimals are serialized without trailing zeros in the fractional part (1.50 => 1.5, 2.00 => 2)
+    - dates are serialized as YYYY-MM-DD, times as HH:MM:SS.ffffff, timestamps as YYYY-MM-DD HH:MM:SS.ffffff
+      (timestamps with time zone are converted to UTC)
+    - strings are serialized as UTF-8 encoded text
+    - binary values are serialized as lowercase hexadecimal strings
+    NULL values are preserved by canonical_value, canonical_field converts them to a marker.
+    """
+
+    # False if the MD5 function is not known to be available, the hashes then have to be computed by the client
+    server_side_hashing = True
+
+    def text(self, expression: str) -> str:
+        return f"CAST({expression} AS VARCHAR(4000))"
+
+    def concat(self, expressions: Sequence[str]) -> str:
+        return " || ".join(expressions)
+
+    def char_length(self, expression: str) -> str:
+        return f"CHAR_LENGTH({expression})"
+
+    def byte_length(self, expression: str) -> str:
+        return f"OCTET_LENGTH({expression})"
+
+    def substring(self, expression: str, start: str, length: int) -> str:
+        return f"SUBSTRING({expression} FROM {start} FOR {length})"
+
+    def md5(self, expression: str) -> str:
+        return f"UPPER(MD5({expression}))"
+
+    def session_timeout_statements(self, timeout_sec: float) -> Tuple[str, ...]:
+        """
+        Returns the statements limiting the duration of each statement executed by the session,
+        so the timeout is enforced by the database server. Empty tuple means not supported.
+        """
+        return ()
+
+    def statements_with_timeout(self, statement: str, timeout_sec: float) -> Optional[Tuple[str, ...]]:
+        """
+        Returns the statements to be executed (in a single transaction) in order to execute the given
+        statement with the given timeout enforced by the database server. The result-set of the last
+        statement is the result-set of the given statement. None means not supported, the timeout then
+        has to be enforced by the client (see cancel_query).
+        """
+        return None
+
+    def record_count_estimate_statement(self) -> Optional[str]:
+        """
+        Returns the statement reading the estimated number of records of a table from the statistics
+        maintained by the database server (bind parameters :schema and :table). None means there
+        are no such statistics.
+        """
+        return None
+
+    def percentile(self, expression: str, fraction: float) -> Optional[str]:
+        """
+        Returns the aggregate computing the given percentile (e.g. 0.5 for the median) of the given
+        expression, interpolated between the adjacent values. None means not supported.
+        """
+        return None
+
+    def cancel_query(self, engine: Engine, dbapi_connection: Any) -> None:
+        """
+        Cancels the query currently running on the given connection (invoked from another thread).
+        """
+        ...
+
+    def is_transient_error(self, e: Exception) -> bool:
+        """
+        Returns true if the given error is likely to disappear if the failed statement is executed
+        again (e.g. lost connection or deadlock).
+        """
+        return isinstance(e, DBAPIError) and e.connection_invalidated
+
+    def canonical_value(self, column: DBColumn) -> str:
+        category = column.type_category
+        name = column.name
+        if category is TypeCategory.BOOLEAN:
+            return self._boolean_as_text(name)
+        if category is TypeCategory.INTEGER:
+            return self.text(name)
+        if category is TypeCategory.DECIMAL:
+            return self._strip_trailing_zeros(self.text(name))
+        if category is TypeCategory.STRING:
+            return self._string_as_text(name)
+        if category is TypeCategory.DATE:
+            return self._date_as_text(name)
+        if category is TypeCategory.TIME:
+            return self._time_as_text(name)
+        if category is TypeCategory.TIMESTAMP:
+            return self._timestamp_as_text(name, column.has_time_zone)
+        if category is TypeCategory.BINARY:
+            return self._binary_as_text(name)
+        return self.text(name)
+
+    def canonical_field(self, column: DBColumn) -> str:
+        # NULL is represented by the 'N' marker, other values are prefixed by their length
+        # (e.g. 3:abc); thanks to the prefix, concatenated fields cannot be ambiguous
+        value = self.canonical_value(column)
+        length_prefixed_value = self.concat([self.text(self.char_length(value)), "':'", value])
+        return f"CASE WHEN {column.name} IS NULL THEN 'N' ELSE {length_prefixed_value} END"
+
+    def row_hash(self, columns: Sequence[DBColumn]) -> str:
+        return self.md5(self.concat([self.canonical_field(column) for column in columns]))
+
+    def large_object_length(self, column: DBColumn) -> str:
+        """
+        Returns the length of the value of the given large object column - the number of bytes for
+        binary columns, the number of characters otherwise. The length is cheap compared to a hash
+        (e.g. PostgreSQL reads it from the header of the stored value).
+        """
+        if column.type_category is TypeCategory.BINARY:
+            return self.byte_length(column.name)
+        return self.char_length(column.name)
+
+    def large_object_part(self, column: DBColumn, start: str, length: int) -> str:
+        """
+        Returns the canonical form of the given part (the start is a 1-based SQL expression) of the
+        value of the given large object column, so that just the part has to be read and hashed.
+        """
+        part = self.substring(column.name, start, length)
+        if column.type_category is TypeCategory.BINARY:
+            return self._binary_as_text(part)
+        return self._string_as_text(part)
+
+    def key_condition(self, column: DBColumn, parameter_name: str) -> str:
+        """
+        Returns the condition selecting the records whose value of the given (key) column is equal to
+        the bound parameter of the given name (see the key_parameter method).
+        """
+        # numeric and string keys are compared directly so that the primary key index can be used,
+        # other keys are compared in the canonical form (the canonical form of a timestamp, for
+        # instance, does not have to be a valid literal in all databases)
+        if column.type_category in (TypeCategory.INTEGER, TypeCategory.DECIMAL, TypeCategory.STRING):
+            return f"{column.name} = :{parameter_name}"
+        return f"{self.canonical_value(column)} = :{parameter_name}"
+
+    def key_parameter(self, column: DBColumn, canonical_value: str) -> Any:
+        """
+        Returns the value of the parameter bound to the condition returned by the key_condition method
+        for the given value (in canonical form) of the given (key) column.
+        """
+        if column.type_category is TypeCategory.INTEGER:
+            return int(canonical_value)
+        if column.type_category is TypeCategory.DECIMAL:
+            return Decimal(canonical_value)
+        return canonical_value
+
+    def keys_condition(self, columns: Sequence[DBColumn], keys: Sequence[Tuple[str, ...]]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Returns the condition selecting the records with the given keys (values of the given key
+        columns in canonical form), together with the parameters bound to the condition. The values
+        are bound, not embedded, so that they do not have to be escaped.
+        """
+        conditions = []
+        parameters: Dict[str, Any] = {}
+        for key_index, key in enumerate(keys):
+            key_conditions = []
+            for column_index, (column, value) in enumerate(zip(columns, key)):
+                parameter_name = f"key_{key_index}_{column_index}"
+                key_conditions.append(self.key_condition(column, parameter_name))
+                parameters[parameter_name] = self.key_parameter(column, value)
+            conditions.append("(" + " AND ".join(key_conditions) + ")")
+        return " OR ".join(conditions), parameters
+
+    def _boolean_as_text(self, expression: str) -> str:
+        # works for native booleans as well as for numeric columns emulating booleans
+        return f"CASE WHEN {expression} THEN '1' WHEN NOT {expression} THEN '0' END"
+
+    def _strip_trailing_zeros(self, expression: str) -> str:
+        return f"CASE WHEN POSITION('.' IN {expression}) > 0 THEN TRIM(TRAILING '.' FROM TRIM(TRAILING '0' FROM {expression})) ELSE {expression} END"
+
+    def _string_as_text(self, expression: str) -> str:
+        return expression
+
+    def _date_as_text(self, expression: str) -> str:
+        return self.text(expression)
+
+    def _time_as_text(self, expression: str) -> str:
+        return self.text(expression)
+
+    def _timestamp_as_text(self, expression: str, has_time_zone: bool) -> str:
+        return self.text(expression)
+
+    def _binary_as_text(self, expression: str) -> str:
+        return self.text(expression)
+
+
+class GenericDialect(SQLDialect):
+
+    server_side_hashing = False
+
+
+# serialization failure, deadlock, admin/crash shutdown, cannot connect now
+_POSTGRESQL_TRANSIENT_SQLSTATES = ("40001", "40P01", "57P01", "57P02", "57P03")
+
+# lock wait timeout, deadlock, server has gone away, lost connection
+_MYSQL_TRANSIENT_ERROR_CODES = (1205, 1213, 2006, 2013)
+
+
+class PostgreSQLDialect(SQLDialect):
+
+    def text(self, expression: str) -> str:
+        return f"CAST({expression} AS TEXT)"
+
+    def concat(self, expressions: Sequence[str]) -> str:
+        return f"CONCAT({', '.join(expressions)})"
+
+    def _string_as_text(self, expression: str) -> str:
+        return self.text(expression)
+
+    def _date_as_text(self, expression: str) -> str:
+        return f"TO_CHAR({expression}, 'YYYY-MM-DD')"
+
+    def _time_as_text(self, expression: str) -> str:
+        return f"TO_CHAR({expression}, 'HH24:MI:SS.US')"
+
+    def _timestamp_as_text(self, expression: str, has_time_zone: bool) -> str:
+        if has_time_zone:
+            expression = f"{expression} AT TIME ZONE 'UTC'"
+        return f"TO_CHAR({expression}, 'YYYY-MM-DD HH24:MI:SS.US')"
+
+    def _binary_as_text(self, expression: str) -> str:
+        return f"ENCODE({expression}, 'hex')"
+
+    def record_count_estimate_statement(self) -> Optional[str]:
+        return "SELECT c.reltuples::bigint FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace WHERE n.nspname = :schema AND c.relname = :table"
+
+    def percentile(self, expression: str, fraction: float) -> Optional[str]:
+        return f"PERCENTILE_CONT({fraction}) WITHIN GROUP (ORDER BY {expression})"
+
+    def session_timeout_statements(self, timeout_sec: float) -> Tuple[str, ...]:
+        return (f"SET statement_timeout = {round(timeout_sec * 1000)}",)
+
+    def statements_with_timeout(self, statement: str, timeout_sec: float) -> Optional[Tuple[str, ...]]:
+        return (f"SET LOCAL statement_timeout = {round(timeout_sec * 1000)}", statement)
+
+    def cancel_query(self, engine: Engine, dbapi_connection: Any) -> None:
+        dbapi_connection.cancel()
+
+    def is_transient_error(self, e: Exception) -> bool:
+        if super().is_transient_error(e):
+            return True
+        if not isinstance(e, DBAPIError):
+            return False
+        # psycopg (version 3) provides the SQLSTATE as sqlstate, psycopg2 as pgcode
+        sqlstate = getattr(e.orig, "sqlstate", None) or getattr(e.orig, "pgcode", None) or ""
+        return sqlstate.startswith("08") or sqlstate in _POSTGRESQL_TRANSIENT_SQLSTATES
+
+
+class MySQLDialect(SQLDialect):
+    """
+    Dialect for MySQL. Except of few details (see MariaDBDialect), it is also used for MariaDB.
+    """
+
+    def text(self, expression: str) -> str:
+        return f"CAST({expression} AS CHAR)"
+
+    def concat(self, expressions: Sequence[str]) -> str:
+        return f"CONCAT({', '.join(expressions)})"
+
+    def byte_length(self, expression: str) -> str:
+        return f"LENGTH({expression})"
+
+    def _string_as_text(self, expression: str) -> str:
+        # MD5 hashes the bytes of the column character set, so a latin1 column would
+        # lead to a different hash than the same value stored in an UTF-8 column
+        return f"CONVERT({expression} USING utf8mb4)"
+
+    def _date_as_text(self, expression: str) -> str:
+        return f"DATE_FORMAT({expression}, '%Y-%m-%d')"
+
+    def _time_as_text(self, expression: str) -> str:
+        return f"TIME_FORMAT({expression}, '%H:%i:%s.%f')"
+
+    def _timestamp_as_text(self, expression: str, has_time_zone: bool) -> str:
+        if has_time_zone:
+            # the values are returned in the time zone of the session
+            expression = f"CONVERT_TZ({expression}, @@session.time_zone, '+00:00')"
+        return f"DATE_FORMAT({expression}, '%Y-%m-%d %H:%i:%s.%f')"
+
+    def _binary_as_text(self, expression: str) -> str:
+        return f"LOWER(HEX({expression}))"
+
+    def record_count_estimate_statement(self) -> Optional[str]:
+        return "SELECT table_rows FROM information_schema.tables WHERE table_schema = :schema AND table_name = :table"
+
+    def session_timeout_statements(self, timeout_sec: float) -> Tuple[str, ...]:
+        # only applies to SELECT statements, which is sufficient for the comparison tools
+        return (f"SET SESSION max_execution_time = {round(timeout_sec * 1000)}",)
+
+    def statements_with_timeout(self, statement: str, timeout_sec: float) -> Optional[Tuple[str, ...]]:
+        if not statement.startswith("SELECT "):
+            return None
+        return (f"SELECT /*+ MAX_EXECUTION_TIME({round(timeout_sec * 1000)}) */ {statement[len('SELECT '):]}",)
+
+    def cancel_query(self, engine: Engine, dbapi_connection: Any) -> None:
+        # mysqlclient provides the thread_id method, the MariaDB connector the connection_id attribute
+        if hasattr(dbapi_connection, "thread_id"):
+            connection_id = dbapi_connection.thread_id()
+        else:
+            connection_id = dbapi_connection.connection_id
+        with engine.connect() as connection:
+            connection.exec_driver_sql(f"KILL QUERY {int(connection_id)}")
+
+    def is_transient_error(self, e: Exception) -> bool:
+        if super().is_transient_error(e):
+            return True
+        if not isinstance(e, DBAPIError):
+            return False
+        error_code = getattr(e.orig, "errno", None)
+        if error_code is None and e.orig.args and isinstance(e.orig.args[0], int):
+            error_code = e.orig.args[0]
+        return error_code in _MYSQL_TRANSIENT_ERROR_CODES
+
+
+class MariaDBDialect(MySQLDialect):
+
+    def session_timeout_statements(self, timeout_sec: float) -> Tuple[str, ...]:
+        return (f"SET SESSION max_statement_time = {timeout_sec}",)
+
+    def statements_with_timeout(self, statement: str, timeout_sec: float) -> Optional[Tuple[str, ...]]:
+        return (f"SET STATEMENT max_statement_time = {timeout_sec} FOR {statement}",)
+
+
+class SQLiteDialect(SQLDialect):
+    """
+    Dialect for SQLite. The MD5 function is not provided by SQLite, it is registered as an
+    user-defined function when a connection is established (see the engine module). Dates
+    and timestamps are expected in the format used by SQLAlchemy (ISO format, microseconds).
+    """
+
+    def text(self, expression: str) -> str:
+        return f"CAST({expression} AS TEXT)"
+
+    def char_length(self, expression: str) -> str:
+        return f"LENGTH({expression})"
+
+    def byte_length(self, expression: str) -> str:
+        # the length of a BLOB is the number of bytes
+        return f"LENGTH({expression})"
+
+    def substring(self, expression: str, start: str, length: int) -> str:
+        return f"SUBSTR({expression}, {start}, {length})"
+
+    def key_parameter(self, column: DBColumn, canonical_value: str) -> Any:
+        # the sqlite3 module cannot bind decimals, and SQLite stores them as integers or floats anyway
+        if column.type_category is TypeCategory.DECIMAL:
+            return float(canonical_value)
+        return super().key_parameter(column, canonical_value)
+
+    def cancel_query(self, engine: Engine, dbapi_connection: Any) -> None:
+        dbapi_connection.interrupt()
+
+    def _strip_trailing_zeros(self, expression: str) -> str:
+        return f"CASE WHEN INSTR({expression}, '.') > 0 THEN RTRIM(RTRIM({expression}, '0'), '.') ELSE {expression} END"
+
+    def _date_as_text(self, expression: str) -> str:
+        return f"STRFTIME('%Y-%m-%d', {expression})"
+
+    def _time_as_text(self, expression: str) -> str:
+        return f"STRFTIME('%H:%M:%S', {expression}) || '.' || {self._microseconds(expression, 9)}"
+
+    def _timestamp_as_text(self, expression: str, has_time_zone: bool) -> str:
+        # STRFTIME converts values with a time zone offset (e.g. +02:00 or Z) to UTC
+        return f"STRFTIME('%Y-%m-%d %H:%M:%S', {expression}) || '.' || {self._microseconds(expression, 20)}"
+
+    def _microseconds(self, expression: str, separator_position: int) -> str:
+        # the fractional seconds (if any) start after the decimal point at the given position, and they
+        # can be followed by a time zone offset, so just the leading digits are padded to microseconds
+        fraction = f"CASE WHEN SUBSTR({expression}, {separator_position}, 1) = '.' THEN SUBSTR({expression}, {separator_position + 1}, 6) ELSE '' END"
+        digits = f"SUBSTR({fraction}, 1, LENGTH({fraction}) - LENGTH(LTRIM({fraction}, '0123456789')))"
+        return f"SUBSTR({digits} || '000000', 1, 6)"
+
+    def _binary_as_text(self, expression: str) -> str:
+        return f"LOWER(HEX({expression}))"
+
+
+_DIALECTS: Dict[str, SQLDialect] = {
+    "postgresql": PostgreSQLDialect(),
+    "mysql": MySQLDialect(),
+    "mariadb": MariaDBDialect(),
+    "sqlite": SQLiteDialect(),
+}
+
+_GENERIC_DIALECT = GenericDialect()
+
+
+def get_dialect(db_properties: DatabaseProperties) -> SQLDialect:
+    return _DIALECTS.get(db_properties.dialect_name, _GENERIC_DIALECT)
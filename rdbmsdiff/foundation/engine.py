@@ -0,0 +1,213 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from hashlib import md5
+from sqlite3 import Connection
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import quote
+
+from sqlalchemy import (
+    Engine,
+    create_engine,
+    event,
+    make_url,
+)
+
+from .config import (
+    DatabaseProperties,
+    DatabaseRole,
+)
+from .dialect import (
+    SQLDialect,
+    get_dialect,
+)
+from .instrumentation import (
+    Phase,
+    instrument_engine,
+)
+
+
+# SQLite is only accessed for reading, so the whole database file can be memory-mapped
+_SQLITE_MMAP_SIZE = 1024 * 1024 * 1024
+
+
+def _sqlite_md5(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if not isinstance(value, bytes):
+        value = str(value).encode("UTF-8")
+    return md5(value).hexdigest()
+
+
+# functions missing in SQLite which are used by the generated SQL (see the dialect module);
+# they are implemented in Python, but the heavy lifting (e.g. hashing) is done by C code
+_SQLITE_FUNCTIONS: Tuple[Tuple[str, int, Callable[..., Any]], ...] = (
+    ("MD5", 1, _sqlite_md5),
+)
+
+
+def _on_sqlite_connect(dbapi_connection: Connection, connection_record: Any) -> None:
+    dbapi_connection.execute(f"PRAGMA mmap_size = {_SQLITE_MMAP_SIZE}")
+    for name, arg_count, function in _SQLITE_FUNCTIONS:
+        dbapi_connection.create_function(name, arg_count, function, deterministic=True)
+
+
+def _create_sqlite_engine(db_properties: DatabaseProperties, pool_size: int) -> Engine:
+    url = make_url(db_properties.url_with_password)
+    if url.database and url.database != ":memory:" and not url.database.startswith("file:"):
+        # the database file is opened in read-only mode; the immutable flag tells SQLite that the file
+        # cannot change while it is open, so there is no locking and no detection of changes
+        url = url.set(database=f"file:{quote(url.database)}", query={"mode": "ro", "immutable": "1", "uri": "true"})
+    engine = create_engine(url, pool_size=pool_size)
+    event.listen(engine, "connect", _on_sqlite_connect)
+    return engine
+
+
+def _apply_statement_timeout(engine: Engine, db_properties: DatabaseProperties) -> None:
+    statements = get_dialect(db_properties).session_timeout_statements(db_properties.statement_timeout_sec)
+
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+        # otherwise, the settings would be discarded by the rollback when the connection is returned to the pool
+        dbapi_connection.commit()
+
+    if statements:
+        event.listen(engine, "connect", on_connect)
+
+
+def create_db_engine(db_properties: DatabaseProperties, phase: Phase) -> Engine:
+    """
+    Creates an engine for the given database. All engines used by the comparison tools are
+    supposed to be created by this function, so that the interaction with the databases can
+    be monitored (see the instrumentation module).
+    """
+    # the pool keeps as many connections as there can be parallel queries (see the concurrency module)
+    pool_size = db_properties.max_concurrency
+    if db_properties.dialect_name == "sqlite":
+        engine = _create_sqlite_engine(db_properties, pool_size)
+    else:
+        engine = create_engine(url=db_properties.url_with_password, pool_size=pool_size, pool_pre_ping=True)
+    if db_properties.statement_timeout_sec is not None:
+        _apply_statement_timeout(engine, db_properties)
+    return instrument_engine(engine, db_properties.role, phase)
+
+
+_ENGINES: Dict[Tuple[DatabaseRole, Phase], Engine] = {}
+
+_ENGINES_LOCK = Lock()
+
+# the DBAPI connections currently executing a statement, and the dialect able to cancel it, by engine
+_RUNNING_QUERIES: Dict[Tuple[DatabaseRole, Phase], Tuple[SQLDialect, Set[Any]]] = {}
+
+_RUNNING_QUERIES_LOCK = Lock()
+
+
+def _track_running_queries(engine: Engine, key: Tuple[DatabaseRole, Phase], dialect: SQLDialect) -> None:
+    running_connections: Set[Any] = set()
+
+    def before_cursor_execute(connection: Any, *args: Any) -> None:
+        with _RUNNING_QUERIES_LOCK:
+            running_connections.add(connection.connection.dbapi_connection)
+
+    def after_cursor_execute(connection: Any, *args: Any) -> None:
+        with _RUNNING_QUERIES_LOCK:
+            running_connections.discard(connection.connection.dbapi_connection)
+
+    def handle_error(context: Any) -> None:
+        if context.connection is not None and not context.connection.closed:
+            with _RUNNING_QUERIES_LOCK:
+                running_connections.discard(context.connection.connection.dbapi_connection)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", handle_error)
+    with _RUNNING_QUERIES_LOCK:
+        _RUNNING_QUERIES[key] = (dialect, running_connections)
+
+
+def _warm_up(engine: Engine, connection_count: int) -> None:
+    # the connections are opened before they are needed, and they are kept in the pool; otherwise,
+    # the first queries running in parallel would have to wait for the connections to be established
+    connections = []
+    try:
+        for _ in range(connection_count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def get_db_engine(db_properties: DatabaseProperties, phase: Phase) -> Engine:
+    """
+    Returns the engine for the given database and phase. The engine (including its pool of warmed up
+    connections) is created upon the first invocation, and it is shared by all subsequent queries.
+    """
+    key = (db_properties.role, phase)
+    with _ENGINES_LOCK:
+        if key not in _ENGINES:
+            engine = create_db_engine(db_properties, phase)
+            _warm_up(engine, db_properties.max_concurrency)
+            _track_running_queries(engine, key, get_dialect(db_properties))
+            _ENGINES[key] = engine
+        return _ENGINES[key]
+
+
+def cancel_running_queries() -> None:
+    """
+    Cancels the statements currently executed by the engines created by the get_db_engine function
+    (e.g. when the user interrupts a comparison), so that the engines can be disposed.
+    """
+    with _ENGINES_LOCK:
+        engines = dict(_ENGINES)
+    with _RUNNING_QUERIES_LOCK:
+        running_queries = [(key, dialect, tuple(connections)) for key, (dialect, connections) in _RUNNING_QUERIES.items()]
+    for key, dialect, connections in running_queries:
+        engine = engines.get(key)
+        if engine is None:
+            continue
+        for dbapi_connection in connections:
+            try:
+                dialect.cancel_query(engine, dbapi_connection)
+            except Exception:
+                # the statement may have completed in the meantime
+                pass
+
+
+def dispose_db_engines() -> None:
+    """
+    Closes all connections of all engines created by the get_db_engine function.
+    """
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
+    with _RUNNING_QUERIES_LOCK:
+        _RUNNING_QUERIES.clear()
@@ -0,0 +1,200 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import (
+    StrEnum,
+    unique,
+)
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+)
+
+from rich.table import Table
+from rich.text import Text
+from sqlalchemy import (
+    Engine,
+    event,
+)
+
+from .config import (
+    DatabaseProperties,
+    DatabaseRole,
+)
+
+
+_PHASE_OPTION = "rdbmsdiff_phase"
+
+
+@unique
+class Phase(StrEnum):
+    REFLECTION = "Reflection"
+    VALIDATION = "Validation"
+    COUNTING = "Counting"
+
+
+@dataclass(frozen=True, slots=True)
+class QueryCounters:
+    statement_count: int = 0
+    round_trip_count: int = 0
+    row_count: int = 0
+
+    def __add__(self, other: QueryCounters) -> QueryCounters:
+        return QueryCounters(
+            statement_count=self.statement_count + other.statement_count,
+            round_trip_count=self.round_trip_count + other.round_trip_count,
+            row_count=self.row_count + other.row_count,
+        )
+
+
+class QueryBudgetExceededError(Exception):
+    ...
+
+
+@dataclass(frozen=True, slots=True)
+class QueryStatisticsSnapshot:
+    counters: Dict[Tuple[DatabaseRole, Phase], QueryCounters]
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.counters) == 0
+
+    def get(self, phase: Phase, role: Optional[DatabaseRole] = None) -> QueryCounters:
+        """
+        Returns the counters for the given phase, either for the given database, or summed
+        up for both databases if no role is specified.
+        """
+        result = QueryCounters()
+        for (counters_role, counters_phase), counters in self.counters.items():
+            if counters_phase is phase and (role is None or counters_role is role):
+                result += counters
+        return result
+
+    def assert_statement_budget(self, phase: Phase, table_count: int, max_statements_per_table: float) -> None:
+        """
+        Raises QueryBudgetExceededError if the number of statements executed during the given
+        phase exceeds the budget for at least one of the databases. The budget is per table and
+        per database, e.g. "at most 2 statements per table per side".
+        """
+        for role in DatabaseRole:
+            statement_count = self.get(phase, role).statement_count
+            if statement_count > max_statements_per_table * table_count:
+                message = f"{phase} phase executed {statement_count} statements in the {role} DB, the budget is {max_statements_per_table} statements per table ({table_count} tables)."
+                raise QueryBudgetExceededError(message)
+
+
+class QueryStatistics:
+    """
+    Thread-safe collector of statistics about the interaction with the databases. The statistics
+    are collected per database and per phase. Round trips include SQL statements, establishment
+    of new connections, commits and rollbacks.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counters: Dict[Tuple[DatabaseRole, Phase], QueryCounters] = {}
+
+    def _add(self, role: DatabaseRole, phase: Phase, counters: QueryCounters) -> None:
+        with self._lock:
+            self._counters[(role, phase)] = self._counters.get((role, phase), QueryCounters()) + counters
+
+    def add_statement(self, role: DatabaseRole, phase: Phase) -> None:
+        self._add(role, phase, QueryCounters(statement_count=1, round_trip_count=1))
+
+    def add_round_trip(self, role: DatabaseRole, phase: Phase) -> None:
+        self._add(role, phase, QueryCounters(round_trip_count=1))
+
+    def add_rows(self, role: DatabaseRole, phase: Phase, row_count: int) -> None:
+        self._add(role, phase, QueryCounters(row_count=row_count))
+
+    def snapshot(self) -> QueryStatisticsSnapshot:
+        with self._lock:
+            return QueryStatisticsSnapshot(dict(self._counters))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+_QUERY_STATISTICS = QueryStatistics()
+
+
+def get_query_statistics() -> QueryStatistics:
+    return _QUERY_STATISTICS
+
+
+def with_phase(engine: Engine, phase: Phase) -> Engine:
+    """
+    Returns a proxy of the given engine (sharing the connection pool with it) whose statements
+    are accounted to the given phase.
+    """
+    return engine.execution_options(**{_PHASE_OPTION: phase})
+
+
+def instrument_engine(engine: Engine, role: DatabaseRole, default_phase: Phase) -> Engine:
+    def phase_of(connection: Any) -> Phase:
+        return connection.get_execution_options().get(_PHASE_OPTION, default_phase)
+
+    def before_cursor_execute(connection, cursor, statement, parameters, context, executemany) -> None:
+        _QUERY_STATISTICS.add_statement(role, phase_of(connection))
+
+    def commit_or_rollback(connection) -> None:
+        _QUERY_STATISTICS.add_round_trip(role, phase_of(connection))
+
+    def connect(dbapi_connection, connection_record) -> None:
+        _QUERY_STATISTICS.add_round_trip(role, default_phase)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "commit", commit_or_rollback)
+    event.listen(engine, "rollback", commit_or_rollback)
+    event.listen(engine, "connect", connect)
+    return engine
+
+
+def record_fetched_rows(db_properties: DatabaseProperties, phase: Phase, row_count: int) -> None:
+    _QUERY_STATISTICS.add_rows(db_properties.role, phase, row_count)
+
+
+def create_query_statistics_table(snapshot: QueryStatisticsSnapshot) -> Table:
+    table = Table(title="[cyan]Query Statistics[/]", show_lines=True)
+
+    table.add_column(Text("Phase", justify="center"), justify="left")
+    table.add_column(Text("Database", justify="center"), justify="left")
+    table.add_column(Text("Statements", justify="center"), justify="right")
+    table.add_column(Text("Round Trips", justify="center"), justify="right")
+    table.add_column(Text("Rows", justify="center"), justify="right")
+
+    for phase in Phase:
+        for role in DatabaseRole:
+            counters = snapshot.get(phase, role)
+            if counters.round_trip_count == 0:
+                continue
+            table.add_row(
+                str(phase),
+                f"{role.name.capitalize()} DB",
+                str(counters.statement_count),
+                str(counters.round_trip_count),
+                str(counters.row_count),
+            )
+
+    return table
@@ -17,6 +17,11 @@
 #
 
 from dataclasses import dataclass
+from enum import (
+    Enum,
+    auto,
+    unique,
+)
 from typing import (
     Any,
     Dict,
@@ -24,12 +29,6 @@ from typing import (
     Tuple
 )
 
-from rich.console import Console
-from sqlalchemy import (
-    create_engine,
-    inspect,
-    MetaData,
-)
 from sqlalchemy.sql.schema import (
     CheckConstraint,
     ForeignKeyConstraint,
@@ -51,8 +50,35 @@ from sqlalchemy.sql.sqltypes import (
     TIMESTAMP,
     VARCHAR
 )
+from sqlalchemy.sql.sqltypes import (
+    _Binary,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    Numeric,
+    String,
+    Time,
+)
+
 
-from .config import DatabaseProperties
+@unique
+class TypeCategory(Enum):
+    """
+    Vendor independent category of a column datatype. Columns of the same category are
+    serialized to the same canonical form regardless of the database engine.
+    """
+    BOOLEAN = auto()
+    INTEGER = auto()
+    DECIMAL = auto()
+    FLOAT = auto()
+    STRING = auto()
+    DATE = auto()
+    TIME = auto()
+    TIMESTAMP = auto()
+    BINARY = auto()
+    OTHER = auto()
 
 
 @dataclass(frozen=True, slots=True)
@@ -106,6 +132,34 @@ class DBColumn:
             isinstance(self.datatype, TEXT)
         )
 
+    @property
+    def has_time_zone(self) -> bool:
+        return bool(getattr(self.datatype, "timezone", False))
+
+    @property
+    def type_category(self) -> TypeCategory:
+        # the generic SQLAlchemy types are used on purpose, so that vendor specific types
+        # (e.g. DOUBLE_PRECISION for PostgreSQL or DATETIME for MySQL) are covered as well
+        if isinstance(self.datatype, Boolean):
+            return TypeCategory.BOOLEAN
+        if isinstance(self.datatype, Integer):
+            return TypeCategory.INTEGER
+        if isinstance(self.datatype, Float):
+            return TypeCategory.FLOAT
+        if isinstance(self.datatype, Numeric):
+            return TypeCategory.DECIMAL
+        if isinstance(self.datatype, String):
+            return TypeCategory.STRING
+        if isinstance(self.datatype, DateTime):
+            return TypeCategory.TIMESTAMP
+        if isinstance(self.datatype, Date):
+            return TypeCategory.DATE
+        if isinstance(self.datatype, Time):
+            return TypeCategory.TIME
+        if isinstance(self.datatype, _Binary):
+            return TypeCategory.BINARY
+        return TypeCategory.OTHER
+
 
 @dataclass(frozen=True, slots=True)
 class DBTable:
@@ -180,86 +234,3 @@ class DBSchema:
             if my_table.name == table.name:
                 return True
         return False
-
-
-class _MetaDataReader:
-
-    def __init__(self, db_properties: DatabaseProperties, console: Console) -> None:
-        self._db_properties = db_properties
-        self._engine = create_engine(url=db_properties.url_with_password)
-        self._inspection = inspect(self._engine)
-        self._meta_data = MetaData(schema=db_properties.schema)
-        self._meta_data.reflect(bind=self._engine)
-        self._console = console
-
-    def read_meta_data(self) -> DBSchema:
-        return DBSchema(
-            tables=self._read_tables(),
-            sequences=self._read_sequences(),
-            views=self._read_views(),
-            materialized_views=self._read_materialized_views(),
-        )
-
-    def _read_tables(self) -> Tuple[DBTable, ...]:
-        tables = []
-        self._console.print(f"[cyan]TABLES[/cyan]")
-        for name, details in self._meta_data.tables.items():
-            if name.startswith(self._db_properties.schema):
-                tokens = name.split(".")
-                name = tokens[1]
-            table_meta_info = DBTable(
-                schema=self._db_properties.schema,
-                name=name,
-                columns=tuple(map(lambda c: DBColumn(name=c.name, datatype=c.type, nullable=c.nullable), details.columns)),
-                check_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, CheckConstraint)]),
-                unique_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, UniqueConstraint)]),
-                primary_key_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, PrimaryKeyConstraint)]),
-                foreign_key_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, ForeignKeyConstraint)]),
-                indexes=tuple([index.name for index in details.indexes])
-            )
-            tables.append(table_meta_info)
-            self._console.print(f"{name}: {table_meta_info.column_count} columns/{table_meta_info.constraint_count} constraints/{table_meta_info.index_count} indexes")
-        self._console.print(f"Totally {len(tables)} tables")
-        return tuple(tables)
-
-    def _read_sequences(self) -> Tuple[str, ...]:
-        sequences = []
-        self._console.print(f"[cyan]SEQUENCES[/cyan]")
-        try:
-            for name in self._inspection.get_sequence_names(self._db_properties.schema):
-                print(name)
-                sequences.append(name)
-        except NotImplementedError:
-            self._console.print(f"[yellow]Sequences not supported for this DB engine[/yellow]")
-        self._console.print(f"Totally {len(sequences)} sequences")
-        return tuple(sequences)
-
-    def _read_views(self) -> Tuple[str, ...]:
-        views = []
-        self._console.print(f"[cyan]VIEWS[/cyan]")
-        for name in self._inspection.get_view_names(self._db_properties.schema):
-            print(name)
-            views.append(name)
-        self._console.print(f"Totally {len(views)} views")
-        return tuple(views)
-
-    def _read_materialized_views(self) -> Tuple[str, ...]:
-        materialized_views = []
-        self._console.print(f"[cyan]MATERIALIZED VIEWS[/cyan]")
-        try:
-            for name in self._inspection.get_materialized_view_names(self._db_properties.schema):
-                print(name)
-                materialized_views.append(name)
-        except NotImplementedError:
-            self._console.print(f"[yellow]Materialized views not supported for this DB engine[/yellow]")
-        self._console.print(f"Totally {len(materialized_views)} materialized views")
-        return tuple(materialized_views)
-
-
-def read_db_meta_data(db_properties: DatabaseProperties) -> DBSchema:
-    console = Console(record=False, highlight=False)
-    console.print()
-    console.print(f"Going to read meta-info from [cyan]{db_properties.url_without_password}[/cyan], schema [cyan]{db_properties.schema}[/cyan]")
-
-    reader = _MetaDataReader(db_properties, console)
-    return reader.read_meta_data()
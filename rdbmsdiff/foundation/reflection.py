@@ -0,0 +1,122 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Tuple
+
+from rich.console import Console
+from sqlalchemy import (
+    inspect,
+    MetaData,
+)
+from sqlalchemy.sql.schema import (
+    CheckConstraint,
+    ForeignKeyConstraint,
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+)
+
+from .config import DatabaseProperties
+from .engine import create_db_engine
+from .instrumentation import Phase
+from .metadata import (
+    DBColumn,
+    DBSchema,
+    DBTable,
+)
+
+
+class _MetaDataReader:
+
+    def __init__(self, db_properties: DatabaseProperties, console: Console) -> None:
+        self._db_properties = db_properties
+        self._engine = create_db_engine(db_properties, Phase.REFLECTION)
+        self._inspection = inspect(self._engine)
+        self._meta_data = MetaData(schema=db_properties.schema)
+        self._meta_data.reflect(bind=self._engine)
+        self._console = console
+
+    def read_meta_data(self) -> DBSchema:
+        return DBSchema(
+            tables=self._read_tables(),
+            sequences=self._read_sequences(),
+            views=self._read_views(),
+            materialized_views=self._read_materialized_views(),
+        )
+
+    def _read_tables(self) -> Tuple[DBTable, ...]:
+        tables = []
+        self._console.print(f"[cyan]TABLES[/cyan]")
+        for name, details in self._meta_data.tables.items():
+            if name.startswith(f"{self._db_properties.schema}."):
+                name = name[len(self._db_properties.schema) + 1:]
+            table_meta_info = DBTable(
+                schema=self._db_properties.schema,
+                name=name,
+                columns=tuple(map(lambda c: DBColumn(name=c.name, datatype=c.type, nullable=c.nullable), details.columns)),
+                check_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, CheckConstraint)]),
+                unique_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, UniqueConstraint)]),
+                primary_key_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, PrimaryKeyConstraint)]),
+                foreign_key_constraints=tuple([constraint for constraint in details.constraints if isinstance(constraint, ForeignKeyConstraint)]),
+                indexes=tuple([index.name for index in details.indexes])
+            )
+            tables.append(table_meta_info)
+            self._console.print(f"{name}: {table_meta_info.column_count} columns/{table_meta_info.constraint_count} constraints/{table_meta_info.index_count} indexes")
+        self._console.print(f"Totally {len(tables)} tables")
+        return tuple(tables)
+
+    def _read_sequences(self) -> Tuple[str, ...]:
+        sequences = []
+        self._console.print(f"[cyan]SEQUENCES[/cyan]")
+        try:
+            for name in self._inspection.get_sequence_names(self._db_properties.schema):
+                print(name)
+                sequences.append(name)
+        except NotImplementedError:
+            self._console.print(f"[yellow]Sequences not supported for this DB engine[/yellow]")
+        self._console.print(f"Totally {len(sequences)} sequences")
+        return tuple(sequences)
+
+    def _read_views(self) -> Tuple[str, ...]:
+        views = []
+        self._console.print(f"[cyan]VIEWS[/cyan]")
+        for name in self._inspection.get_view_names(self._db_properties.schema):
+            print(name)
+            views.append(name)
+        self._console.print(f"Totally {len(views)} views")
+        return tuple(views)
+
+    def _read_materialized_views(self) -> Tuple[str, ...]:
+        materialized_views = []
+        self._console.print(f"[cyan]MATERIALIZED VIEWS[/cyan]")
+        try:
+            for name in self._inspection.get_materialized_view_names(self._db_properties.schema):
+                print(name)
+                materialized_views.append(name)
+        except NotImplementedError:
+            self._console.print(f"[yellow]Materialized views not supported for this DB engine[/yellow]")
+        self._console.print(f"Totally {len(materialized_views)} materialized views")
+        return tuple(materialized_views)
+
+
+def read_db_meta_data(db_properties: DatabaseProperties) -> DBSchema:
+    console = Console(record=False, highlight=False)
+    console.print()
+    console.print(f"Going to read meta-info from [cyan]{db_properties.url_without_password}[/cyan], schema [cyan]{db_properties.schema}[/cyan]")
+
+    reader = _MetaDataReader(db_properties, console)
+    return reader.read_meta_data()
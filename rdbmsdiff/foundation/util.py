@@ -28,10 +28,6 @@ from importlib.resources import (
 )
 from traceback import print_exc
 
-from rich.console import Console
-from rich.padding import Padding
-from rich.text import Text
-
 
 @unique
 class Status(Enum):
@@ -57,6 +53,11 @@ def _load_banner() -> str:
 
 
 def print_banner() -> None:
+    # rich is imported lazily, as this module is also used before the command line is parsed
+    from rich.console import Console
+    from rich.padding import Padding
+    from rich.text import Text
+
     console = Console(record=False, highlight=False)
     banner = _load_banner()
     console.print(Padding(Text(banner, justify="left", style="bold green"), (1, 2)))
@@ -0,0 +1,332 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import (
+    dataclass,
+    replace,
+)
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from rich.console import Console
+from rich.padding import Padding
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+from rich.table import Table
+from rich.text import Text
+from sqlalchemy import (
+    func,
+    inspect,
+    select,
+)
+from sqlalchemy import table as table_clause
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    DatabaseRole,
+    Phase,
+    Status,
+)
+from rdbmsdiff.foundation import (
+    cancel_running_queries,
+    create_query_statistics_table,
+    get_concurrency_limiter,
+    get_db_engine,
+    get_query_statistics,
+    record_fetched_rows,
+    with_phase,
+)
+
+from .drill_down import (
+    RangeDifference,
+    RecordCountDrillDown,
+)
+from .segmented_count import (
+    count_records_by_segments,
+    find_segmentation_key,
+)
+
+
+# how often the running queries are cancelled while the interrupted counts are being awaited
+_CANCELLATION_INTERVAL_SEC = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class ComparisonResult:
+    table: str
+    source_record_count: Optional[int]
+    target_record_count: Optional[int]
+    range_differences: Tuple[RangeDifference, ...] = ()
+    # the error preventing the table from being counted (in any of the databases)
+    error: Optional[str] = None
+
+    @property
+    def has_missing_record_count(self) -> bool:
+        return self.source_record_count is None or self.target_record_count is None
+
+    @property
+    def source_record_count_as_str(self) -> str:
+        return "N/A" if self.source_record_count is None else str(self.source_record_count)
+
+    @property
+    def target_record_count_as_str(self) -> str:
+        return "N/A" if self.target_record_count is None else str(self.target_record_count)
+
+    @property
+    def status(self) -> Status:
+        if self.error is not None:
+            return Status.ERROR
+        if self.has_missing_record_count:
+            return Status.WARNING
+        elif self.source_record_count == self.target_record_count:
+            return Status.OK
+        else:
+            return Status.ERROR
+
+
+def read_table_names(db_properties: DatabaseProperties) -> Set[str]:
+    engine = get_db_engine(db_properties, Phase.COUNTING)
+    return set(inspect(with_phase(engine, Phase.REFLECTION)).get_table_names(schema=db_properties.schema))
+
+
+def read_record_count(db_properties: DatabaseProperties, table_name: str) -> int:
+    engine = get_db_engine(db_properties, Phase.COUNTING)
+    statement = select(func.count()).select_from(table_clause(table_name, schema=db_properties.schema))
+    with get_concurrency_limiter(db_properties).slot():
+        with engine.connect() as connection:
+            record_count = connection.execute(statement).scalar()
+    record_fetched_rows(db_properties, Phase.COUNTING, 1)
+    return record_count
+
+
+class RecordCountComparison:
+    """
+    Counts the records of all tables in both databases. The tables are counted in parallel, and
+    the result for a table is reported as soon as the table has been counted in both databases.
+    """
+
+    def __init__(self, config: Configuration, console: Console, drill_down: bool = False, table_names: Optional[Tuple[Set[str], Set[str]]] = None) -> None:
+        """
+        The names of the source and target tables can be provided if they are already known (e.g. from
+        the meta-information read for other comparisons), otherwise they are read from the databases.
+        """
+        self._config = config
+        self._console = console
+        self._drill_down = drill_down
+        self._table_names = table_names
+        # the actual number of parallel queries is governed by the concurrency limiters
+        max_workers = config.source_db_config.max_concurrency + config.target_db_config.max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # segments of large tables are counted by a separate pool, so that the tasks waiting for
+        # their segments cannot exhaust the threads needed for the segments
+        self._segment_executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._results: List[ComparisonResult] = []
+        self._interrupted = False
+
+    @property
+    def results(self) -> Tuple[ComparisonResult, ...]:
+        return tuple(sorted(self._results, key=lambda result: result.table))
+
+    @property
+    def interrupted(self) -> bool:
+        return self._interrupted
+
+    def run(self) -> None:
+        try:
+            self._count_all_tables()
+            if self._drill_down and not self._interrupted:
+                self._drill_down_differences()
+        finally:
+            self._executor.shutdown()
+            self._segment_executor.shutdown()
+
+    def _count_all_tables(self) -> None:
+        if self._table_names is None:
+            source_tables_future = self._executor.submit(read_table_names, self._config.source_db_config)
+            target_tables_future = self._executor.submit(read_table_names, self._config.target_db_config)
+            source_tables = source_tables_future.result()
+            target_tables = target_tables_future.result()
+        else:
+            source_tables, target_tables = self._table_names
+        all_tables = sorted(source_tables.union(target_tables))
+
+        # tables missing in one of the databases are only counted in the other database
+        record_counts: Dict[str, Dict[DatabaseRole, Optional[int]]] = {name: {} for name in all_tables}
+        errors: Dict[str, str] = {}
+        futures: Dict[Future[int], Tuple[str, DatabaseRole]] = {}
+        for name in all_tables:
+            for db_properties, tables in ((self._config.source_db_config, source_tables), (self._config.target_db_config, target_tables)):
+                if name in tables:
+                    futures[self._executor.submit(self._count_records, db_properties, name)] = (name, db_properties.role)
+                else:
+                    record_counts[name][db_properties.role] = None
+
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            TextColumn("ETA"),
+            TimeRemainingColumn(),
+            console=self._console,
+        )
+        try:
+            with progress:
+                task = progress.add_task("Counting records...", total=len(all_tables))
+                for future in as_completed(futures):
+                    name, role = futures[future]
+                    try:
+                        record_counts[name][role] = future.result()
+                    except Exception as e:
+                        # the failed table is reported, the other tables are counted anyway
+                        record_counts[name][role] = None
+                        error = f"{role.name.lower()} DB: {e}"
+                        errors[name] = f"{errors[name]}; {error}" if name in errors else error
+                    if len(record_counts[name]) == 2:
+                        result = ComparisonResult(
+                            table=name,
+                            source_record_count=record_counts[name][DatabaseRole.SOURCE],
+                            target_record_count=record_counts[name][DatabaseRole.TARGET],
+                            error=errors.get(name),
+                        )
+                        self._results.append(result)
+                        progress.console.print(f"{name}: {result.source_record_count_as_str} / {result.target_record_count_as_str} {Status.format(result.status)}")
+                        if result.error is not None:
+                            progress.console.print(f"{name}: cannot count records ({result.error})")
+                        progress.advance(task)
+        except KeyboardInterrupt:
+            # the tables counted so far are reported, the counting of the remaining tables is abandoned
+            self._interrupted = True
+            self._abandon_counting(futures)
+
+    def _abandon_counting(self, futures: Dict[Future[int], Tuple[str, DatabaseRole]]) -> None:
+        """
+        Cancels the pending counts and the running queries, and waits for the interrupted counts, so that
+        the engines are not disposed (see the main module) under running queries.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._segment_executor.shutdown(wait=False, cancel_futures=True)
+        running_futures = set(futures)
+        while running_futures:
+            # a count can start another query (e.g. the next segment) after the previous one has been cancelled
+            cancel_running_queries()
+            _, running_futures = wait(running_futures, timeout=_CANCELLATION_INTERVAL_SEC)
+        cancel_running_queries()
+
+    def _drill_down_differences(self) -> None:
+        drill_down = RecordCountDrillDown(self._config, self._segment_executor)
+        with self._console.status("Localizing record count differences..."):
+            for index, result in enumerate(self._results):
+                if result.status is not Status.ERROR or result.error is not None:
+                    continue
+                range_differences = drill_down.drill_down(result.table, result.source_record_count, result.target_record_count)
+                self._results[index] = replace(result, range_differences=range_differences)
+
+    def _count_records(self, db_properties: DatabaseProperties, table_name: str) -> int:
+        properties = self._config.record_count_properties
+        key_column = find_segmentation_key(db_properties, table_name, properties)
+        if key_column is None:
+            return read_record_count(db_properties, table_name)
+        return count_records_by_segments(db_properties, table_name, key_column, properties.segment_count, self._segment_executor)
+
+
+def _format_keys(keys: Sequence[int]) -> str:
+    max_keys = 10
+    result = ", ".join(str(key) for key in keys[:max_keys])
+    if len(keys) > max_keys:
+        result += f", ... ({len(keys)} keys)"
+    return result
+
+
+def create_drill_down_table(comparison_results: Sequence[ComparisonResult]) -> Table:
+    table = Table(title="[cyan]Key Ranges with Different Record Counts[/]", show_lines=True)
+
+    table.add_column(Text("Table", justify="center"), justify="left")
+    table.add_column(Text("Key Range", justify="center"), justify="left")
+    table.add_column(Text("Source DB Record Count", justify="center"), justify="right")
+    table.add_column(Text("Target DB Record Count", justify="center"), justify="right")
+    table.add_column(Text("Missing in Source DB", justify="center"), justify="left")
+    table.add_column(Text("Missing in Target DB", justify="center"), justify="left")
+
+    for result in comparison_results:
+        for difference in result.range_differences:
+            table.add_row(
+                result.table,
+                str(difference.key_range),
+                str(difference.source_record_count),
+                str(difference.target_record_count),
+                _format_keys(difference.missing_in_source),
+                _format_keys(difference.missing_in_target),
+            )
+    return table
+
+
+def create_comparison_results_table(comparison_results: Sequence[ComparisonResult], interrupted: bool = False) -> Table:
+    title = "[cyan]Record Count Comparison Results[/]"
+    if interrupted:
+        title += " [yellow](interrupted, partial results)[/]"
+    table = Table(title=title, show_lines=True)
+
+    table.add_column(Text("Table", justify="center"), justify="left")
+    table.add_column(Text("Source DB Record Count", justify="center"), justify="right")
+    table.add_column(Text("Target DB Record Count", justify="center"), justify="right")
+    table.add_column(Text("Status", justify="center"), justify="center")
+
+    for result in comparison_results:
+        table.add_row(
+            result.table,
+            result.source_record_count_as_str,
+            result.target_record_count_as_str,
+            Status.format(result.status),
+        )
+    return table
+
+
+def print_comparison_results(config: Configuration, comparison_results: Sequence[ComparisonResult], output_html_file: str, interrupted: bool = False) -> None:
+    console = Console(record=True, highlight=False)
+    console.print()
+    console.print(Padding(create_comparison_results_table(comparison_results, interrupted), (1, 2)))
+    if any(result.range_differences for result in comparison_results):
+        console.print(Padding(create_drill_down_table(comparison_results), (0, 2, 1, 2)))
+    console.print(Padding(create_query_statistics_table(get_query_statistics().snapshot()), (0, 2)))
+    console.print()
+    console.print(f"Source DB: [cyan]{config.source_db_config.url_without_password}[/], schema [cyan]{config.source_db_config.schema}[/]")
+    console.print(f"Target DB: [cyan]{config.target_db_config.url_without_password}[/], schema [cyan]{config.target_db_config.schema}[/]")
+    if output_html_file:
+        console.save_html(output_html_file)
@@ -0,0 +1,150 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import (
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from sqlalchemy import (
+    column,
+    select,
+)
+from sqlalchemy import table as table_clause
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseProperties,
+    Phase,
+    get_concurrency_limiter,
+    get_db_engine,
+    record_fetched_rows,
+)
+
+from .segmented_count import (
+    KeyRange,
+    count_records_in_range,
+    read_integer_key_column,
+    read_key_range,
+    split_key_range,
+)
+
+
+# key ranges with at most this number of keys are not bisected any further, the keys are read instead
+_KEY_LISTING_THRESHOLD = 1000
+
+# the drill-down stops when this number of differing key ranges has been found for a table
+_MAX_DIFFERING_RANGES = 10
+
+
+@dataclass(frozen=True, slots=True)
+class RangeDifference:
+    key_range: KeyRange
+    source_record_count: int
+    target_record_count: int
+    missing_in_source: Tuple[int, ...]
+    missing_in_target: Tuple[int, ...]
+
+
+def _read_keys(db_properties: DatabaseProperties, table_name: str, key_column: str, key_range: KeyRange) -> Set[int]:
+    key = column(key_column)
+    statement = (
+        select(key)
+        .select_from(table_clause(table_name, schema=db_properties.schema))
+        .where(key >= key_range.lower, key < key_range.upper)
+    )
+    with get_concurrency_limiter(db_properties).slot():
+        with get_db_engine(db_properties, Phase.COUNTING).connect() as connection:
+            keys = connection.execute(statement).scalars().all()
+    record_fetched_rows(db_properties, Phase.COUNTING, len(keys))
+    return {int(value) for value in keys}
+
+
+class RecordCountDrillDown:
+    """
+    Localizes the records responsible for different record counts of a table. The key range of the
+    table is bisected, and only the halves with different record counts are bisected further, so
+    the cost is a logarithmic number of (indexed) range counts. Small key ranges are not bisected,
+    the keys present in just one of the databases are read instead. Differences which compensate
+    each other within a key range (e.g. one record missing and another extra record) cannot be
+    detected, as the record counts of the range are equal.
+    """
+
+    def __init__(self, config: Configuration, executor: Executor) -> None:
+        self._source_db_config = config.source_db_config
+        self._target_db_config = config.target_db_config
+        self._executor = executor
+
+    def _count_in_both_databases(self, table_name: str, key_column: str, key_range: KeyRange) -> Tuple[int, int]:
+        source_future = self._executor.submit(count_records_in_range, self._source_db_config, table_name, key_column, key_range)
+        target_future = self._executor.submit(count_records_in_range, self._target_db_config, table_name, key_column, key_range)
+        return source_future.result(), target_future.result()
+
+    def _read_full_key_range(self, table_name: str, key_column: str) -> Optional[KeyRange]:
+        source_future = self._executor.submit(read_key_range, self._source_db_config, table_name, key_column)
+        target_future = self._executor.submit(read_key_range, self._target_db_config, table_name, key_column)
+        ranges = [key_range for key_range in (source_future.result(), target_future.result()) if key_range is not None]
+        if not ranges:
+            return None
+        return KeyRange(min(key_range.lower for key_range in ranges), max(key_range.upper for key_range in ranges))
+
+    def _list_differing_keys(self, table_name: str, key_column: str, key_range: KeyRange, source_count: int, target_count: int) -> RangeDifference:
+        source_future = self._executor.submit(_read_keys, self._source_db_config, table_name, key_column, key_range)
+        target_future = self._executor.submit(_read_keys, self._target_db_config, table_name, key_column, key_range)
+        source_keys = source_future.result()
+        target_keys = target_future.result()
+        return RangeDifference(
+            key_range=key_range,
+            source_record_count=source_count,
+            target_record_count=target_count,
+            missing_in_source=tuple(sorted(target_keys - source_keys)),
+            missing_in_target=tuple(sorted(source_keys - target_keys)),
+        )
+
+    def drill_down(self, table_name: str, source_record_count: int, target_record_count: int) -> Tuple[RangeDifference, ...]:
+        """
+        Returns the key ranges with different record counts, or an empty tuple if the table has no
+        integer key the drill-down could be based on.
+        """
+        key_column = read_integer_key_column(self._source_db_config, table_name)
+        if key_column is None or read_integer_key_column(self._target_db_config, table_name) != key_column:
+            return ()
+        full_range = self._read_full_key_range(table_name, key_column)
+        if full_range is None:
+            return ()
+
+        result: List[RangeDifference] = []
+        # depth-first, so that the first differing ranges are pinpointed before the others are examined
+        pending = [(full_range, source_record_count, target_record_count)]
+        while pending and len(result) < _MAX_DIFFERING_RANGES:
+            key_range, source_count, target_count = pending.pop()
+            if source_count == target_count:
+                continue
+            if key_range.size <= _KEY_LISTING_THRESHOLD:
+                result.append(self._list_differing_keys(table_name, key_column, key_range, source_count, target_count))
+                continue
+            lower_half, upper_half = split_key_range(key_range, 2)
+            # just the lower half is counted, the counts of the upper half are the remainders
+            lower_source_count, lower_target_count = self._count_in_both_databases(table_name, key_column, lower_half)
+            pending.append((upper_half, source_count - lower_source_count, target_count - lower_target_count))
+            pending.append((lower_half, lower_source_count, lower_target_count))
+        return tuple(result)
@@ -21,34 +21,9 @@ from argparse import (
     Namespace,
     RawTextHelpFormatter,
 )
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from typing import (
-    Dict,
-    Optional,
-    Sequence,
-    Tuple,
-)
-
-from rich.console import Console
-from rich.padding import Padding
-from rich.table import Table
-from rich.text import Text
-from sqlalchemy import (
-    create_engine,
-    func,
-    select,
-)
-from sqlalchemy import MetaData
-from sqlalchemy.orm import Session
 
 from rdbmsdiff.foundation import (
-    Configuration,
-    DatabaseProperties,
     ReadConfigurationError,
-    Status,
-)
-from rdbmsdiff.foundation import (
     epilog,
     handle_configuration_error,
     handle_general_error,
@@ -57,34 +32,6 @@ from rdbmsdiff.foundation import (
 )
 
 
-@dataclass(frozen=True, slots=True)
-class ComparisonResult:
-    table: str
-    source_record_count: Optional[int]
-    target_record_count: Optional[int]
-
-    @property
-    def has_missing_record_count(self) -> bool:
-        return self.source_record_count is None or self.target_record_count is None
-
-    @property
-    def source_record_count_as_str(self) -> str:
-        return "N/A" if self.source_record_count is None else str(self.source_record_count)
-
-    @property
-    def target_record_count_as_str(self) -> str:
-        return "N/A" if self.target_record_count is None else str(self.target_record_count)
-
-    @property
-    def status(self) -> Status:
-        if self.has_missing_record_count:
-            return Status.WARNING
-        elif self.source_record_count == self.target_record_count:
-            return Status.OK
-        else:
-            return Status.ERROR
-
-
 def create_cmd_line_args_parser() -> ArgumentParser:
     parser = ArgumentParser(description="RDBMS Record Count Comparison Tool", formatter_class=RawTextHelpFormatter, epilog=epilog())
 
@@ -108,6 +55,13 @@ def create_cmd_line_args_parser() -> ArgumentParser:
         default=None,
         help="optional name of an HTML output file the outcome of the comparison is to be written to"
     )
+    parser.add_argument(
+        "-d", "--drill-down",
+        dest="drill_down",
+        default=False,
+        action="store_true",
+        help="if specified, the key ranges (and keys) responsible for different record counts will be localized"
+    )
 
     return parser
  
@@ -118,77 +72,30 @@ def parse_cmd_line_args() -> Namespace:
     return params
 
 
-def read_record_counts(db_properties: DatabaseProperties) -> Dict[str, int]:
-    engine = create_engine(url=db_properties.url_with_password)
-    meta_data = MetaData(schema=db_properties.schema)
-    meta_data.reflect(bind=engine)
-    with Session(engine) as session:
-        result = {}
-        for name, _ in meta_data.tables.items():
-            table = meta_data.tables.get(name)
-            statement = select(func.count()).select_from(table)
-            record_count = session.execute(statement).scalar()
-            if name.startswith(db_properties.schema):
-                tokens = name.split(".")
-                name = tokens[1]
-            result[name] = record_count
-        return result
-
-
-def compare_record_counts(source_record_counts: Dict[str, int], target_record_counts: Dict[str, int]) -> Tuple[ComparisonResult, ...]:
-    all_tables = set(source_record_counts.keys()).union(set(target_record_counts.keys()))
-    result = []
-    for table in sorted(all_tables):
-        result.append(ComparisonResult(
-            table=table,
-            source_record_count = source_record_counts.get(table, None),
-            target_record_count = target_record_counts.get(table, None),
-        ))
-    return tuple(result)
-
-
-def print_comparison_results(config: Configuration, comparison_results: Sequence[ComparisonResult], output_html_file: str) -> None:
-    console = Console(record=True, highlight=False)
-    table = Table(title="[cyan]Record Count Comparison Results[/]", show_lines=True)
-
-    table.add_column(Text("Table", justify="center"), justify="left")
-    table.add_column(Text("Source DB Record Count", justify="center"), justify="right")
-    table.add_column(Text("Target DB Record Count", justify="center"), justify="right")
-    table.add_column(Text("Status", justify="center"), justify="center")
-
-    for result in comparison_results:
-        table.add_row(
-            result.table,
-            result.source_record_count_as_str,
-            result.target_record_count_as_str,
-            Status.format(result.status),
-        )
-
-    console.print()
-    console.print(Padding(table, (1, 2)))
-    console.print()
-    console.print(f"Source DB: [cyan]{config.source_db_config.url_without_password}[/], schema [cyan]{config.source_db_config.schema}[/]")
-    console.print(f"Target DB: [cyan]{config.target_db_config.url_without_password}[/], schema [cyan]{config.target_db_config.schema}[/]")
-    if output_html_file:
-        console.save_html(output_html_file)
-
-
 def main() -> None:
+    cmd_line_args = parse_cmd_line_args()
+    # the comparison itself (SQLAlchemy, rich) is imported once the command line has been
+    # parsed, so that the help and invalid command line arguments are reported without delay
+    from rich.console import Console
+
+    from rdbmsdiff.foundation import dispose_db_engines
+    from .comparison import (
+        RecordCountComparison,
+        print_comparison_results,
+    )
+
     try:
         print_banner()
-        cmd_line_args = parse_cmd_line_args()
         config = read_config(cmd_line_args.config_file, cmd_line_args.ask_for_passwords)
-        executor = ThreadPoolExecutor(max_workers=2)
-        source_record_counts_future = executor.submit(read_record_counts, config.source_db_config)
-        target_record_counts_future = executor.submit(read_record_counts, config.target_db_config)
-        source_record_counts = source_record_counts_future.result()
-        target_record_counts = target_record_counts_future.result()
-        comparison_results = compare_record_counts(source_record_counts, target_record_counts)
-        print_comparison_results(config, comparison_results, cmd_line_args.output_html_file)
+        comparison = RecordCountComparison(config, Console(record=False, highlight=False), cmd_line_args.drill_down)
+        comparison.run()
+        print_comparison_results(config, comparison.results, cmd_line_args.output_html_file, comparison.interrupted)
     except ReadConfigurationError as e:
         handle_configuration_error(e)
     except Exception as e:
         handle_general_error(e)
+    finally:
+        dispose_db_engines()
 
 
 if __name__ == "__main__":
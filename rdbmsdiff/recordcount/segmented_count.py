@@ -0,0 +1,148 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from sqlalchemy import (
+    Integer,
+    column,
+    func,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy import table as table_clause
+
+from rdbmsdiff.foundation import (
+    DatabaseProperties,
+    Phase,
+    RecordCountProperties,
+    get_concurrency_limiter,
+    get_db_engine,
+    get_dialect,
+    record_fetched_rows,
+    with_phase,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class KeyRange:
+    # the lower bound is inclusive, the upper bound is exclusive
+    lower: int
+    upper: int
+
+    @property
+    def size(self) -> int:
+        return self.upper - self.lower
+
+    def __str__(self) -> str:
+        return f"[{self.lower}, {self.upper})"
+
+
+def split_key_range(key_range: KeyRange, count: int) -> Tuple[KeyRange, ...]:
+    count = max(1, min(count, key_range.size))
+    bounds = [key_range.lower + (key_range.size * index) // count for index in range(count)] + [key_range.upper]
+    return tuple(KeyRange(lower, upper) for lower, upper in zip(bounds, bounds[1:]))
+
+
+def read_integer_key_column(db_properties: DatabaseProperties, table_name: str) -> Optional[str]:
+    """
+    Returns the name of the leading primary key column of the given table if it is an integer
+    column, None otherwise.
+    """
+    inspector = inspect(with_phase(get_db_engine(db_properties, Phase.COUNTING), Phase.REFLECTION))
+    pk_columns = inspector.get_pk_constraint(table_name, schema=db_properties.schema)["constrained_columns"]
+    if not pk_columns:
+        return None
+    for column_info in inspector.get_columns(table_name, schema=db_properties.schema):
+        if column_info["name"] == pk_columns[0]:
+            return column_info["name"] if isinstance(column_info["type"], Integer) else None
+    return None
+
+
+def read_estimated_record_count(db_properties: DatabaseProperties, table_name: str) -> Optional[int]:
+    statement = get_dialect(db_properties).record_count_estimate_statement()
+    if statement is None:
+        return None
+    with get_db_engine(db_properties, Phase.COUNTING).connect() as connection:
+        estimate = connection.execute(text(statement), {"schema": db_properties.schema, "table": table_name}).scalar()
+    record_fetched_rows(db_properties, Phase.COUNTING, 1)
+    return None if estimate is None else int(estimate)
+
+
+def find_segmentation_key(db_properties: DatabaseProperties, table_name: str, properties: RecordCountProperties) -> Optional[str]:
+    """
+    Returns the key column the given table is to be segmented by, or None if the table is to be
+    counted by a single query (segmentation not enabled, small table, or no integer key).
+    """
+    if properties.segment_count < 2:
+        return None
+    estimate = read_estimated_record_count(db_properties, table_name)
+    if estimate is not None and estimate < properties.segment_threshold:
+        return None
+    return read_integer_key_column(db_properties, table_name)
+
+
+def read_key_range(db_properties: DatabaseProperties, table_name: str, key_column: str) -> Optional[KeyRange]:
+    """
+    Returns the range covering all keys of the given table, or None if the table is empty.
+    """
+    key = column(key_column)
+    statement = select(func.min(key), func.max(key)).select_from(table_clause(table_name, schema=db_properties.schema))
+    with get_concurrency_limiter(db_properties).slot():
+        with get_db_engine(db_properties, Phase.COUNTING).connect() as connection:
+            min_key, max_key = connection.execute(statement).one()
+    record_fetched_rows(db_properties, Phase.COUNTING, 1)
+    if min_key is None:
+        return None
+    return KeyRange(int(min_key), int(max_key) + 1)
+
+
+def count_records_in_range(db_properties: DatabaseProperties, table_name: str, key_column: str, key_range: KeyRange) -> int:
+    key = column(key_column)
+    statement = (
+        select(func.count())
+        .select_from(table_clause(table_name, schema=db_properties.schema))
+        .where(key >= key_range.lower, key < key_range.upper)
+    )
+    with get_concurrency_limiter(db_properties).slot():
+        with get_db_engine(db_properties, Phase.COUNTING).connect() as connection:
+            record_count = connection.execute(statement).scalar()
+    record_fetched_rows(db_properties, Phase.COUNTING, 1)
+    return record_count
+
+
+def count_records_by_segments(db_properties: DatabaseProperties, table_name: str, key_column: str, segment_count: int, executor: Executor) -> int:
+    """
+    Counts the records of the given table by counting the records of key ranges in parallel. Each
+    range count is an index range scan, so the counting can use several connections (and CPUs of
+    the database server) even if the database server does not parallelize single queries.
+    """
+    key_range = read_key_range(db_properties, table_name, key_column)
+    if key_range is None:
+        return 0
+    futures = [
+        executor.submit(count_records_in_range, db_properties, table_name, key_column, segment)
+        for segment in split_key_range(key_range, segment_count)
+    ]
+    return sum(future.result() for future in futures)
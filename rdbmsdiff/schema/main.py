@@ -21,41 +21,15 @@ from argparse import (
     Namespace,
     RawTextHelpFormatter,
 )
-from dataclasses import dataclass
-from typing import Tuple
-
-from rich.console import Console
-from rich.padding import Padding
-from rich.table import Table
-from rich.text import Text
 
 from rdbmsdiff.foundation import (
-    Configuration,
     ReadConfigurationError,
-    Status,
     epilog,
     handle_configuration_error,
     handle_general_error,
     print_banner,
     read_config,
-    read_db_meta_data,
 )
-from .diff import DBSchemaDiff
-from .report import write_report
-
-
-@dataclass(frozen=True)
-class SummaryRow:
-    label: str
-    discrepancy_count: int
-
-    @property
-    def discrepancy_count_as_str(self) -> str:
-        return str(self.discrepancy_count)
-
-    @property
-    def status(self) -> Status:
-        return Status.OK if self.discrepancy_count == 0 else Status.ERROR
 
 
 def create_cmd_line_args_parser() -> ArgumentParser:
@@ -95,51 +69,17 @@ def parse_cmd_line_args() -> Namespace:
     return params
 
 
-def create_summary_rows(db_schema_diff: DBSchemaDiff) -> Tuple[SummaryRow, ...]:
-    result = [
-        SummaryRow(label="Tables missing in source DB", discrepancy_count=db_schema_diff.number_of_tables_missing_in_source_db()),
-        SummaryRow(label="Tables missing in target DB", discrepancy_count=db_schema_diff.number_of_tables_missing_in_target_db()),
-        SummaryRow(label="Tables with distinct columns", discrepancy_count=db_schema_diff.number_of_tables_with_incompatible_columns()),
-        SummaryRow(label="Tables with distinct constraints", discrepancy_count=db_schema_diff.number_of_tables_with_incompatible_constraints()),
-        SummaryRow(label="Tables with distinct indexes", discrepancy_count=db_schema_diff.number_of_tables_with_incompatible_indexes()),
-        SummaryRow(label="Sequences missing in source DB", discrepancy_count=db_schema_diff.number_of_sequences_missing_in_source_db()),
-        SummaryRow(label="Sequences missing in target DB", discrepancy_count=db_schema_diff.number_of_sequences_missing_in_target_db()),
-        SummaryRow(label="Views missing in source DB", discrepancy_count=db_schema_diff.number_of_views_missing_in_source_db()),
-        SummaryRow(label="Views missing in target DB", discrepancy_count=db_schema_diff.number_of_views_missing_in_target_db()),
-        SummaryRow(label="Materialized views missing in source DB", discrepancy_count=db_schema_diff.number_of_materialized_views_missing_in_source_db()),
-        SummaryRow(label="Materialized views missing in target DB", discrepancy_count=db_schema_diff.number_of_materialized_views_missing_in_target_db()),
-    ]
-    return tuple(result)
-
-
-def print_summary(config: Configuration, db_schema_diff: DBSchemaDiff, summary_html_file: str) -> None:
-    console = Console(record=True, highlight=False)
-    table = Table(title="[cyan]Schema Comparison Summary[/]", show_lines=True)
-
-    table.add_column(Text("Discrepancy Type", justify="center"), justify="left")
-    table.add_column(Text("Count", justify="center"), justify="right")
-    table.add_column(Text("Status", justify="center"), justify="center")
-
-    for row in create_summary_rows(db_schema_diff):
-        table.add_row(
-            row.label,
-            row.discrepancy_count_as_str,
-            Status.format(row.status),
-        )
-
-    console.print()
-    console.print(Padding(table, (1, 2)))
-    console.print()
-    console.print(f"Source DB: [cyan]{config.source_db_config.url_without_password}[/], schema [cyan]{config.source_db_config.schema}[/]")
-    console.print(f"Target DB: [cyan]{config.target_db_config.url_without_password}[/], schema [cyan]{config.target_db_config.schema}[/]")
-    if summary_html_file:
-        console.save_html(summary_html_file)
-
-
 def main() -> None:
+    cmd_line_args = parse_cmd_line_args()
+    # the comparison itself (SQLAlchemy, rich) is imported once the command line has been
+    # parsed, so that the help and invalid command line arguments are reported without delay
+    from rdbmsdiff.foundation import read_db_meta_data
+    from .diff import DBSchemaDiff
+    from .report import write_report
+    from .summary import print_summary
+
     try:
         print_banner()
-        cmd_line_args = parse_cmd_line_args()
         config = read_config(cmd_line_args.config_file, cmd_line_args.ask_for_passwords)
         source_meta_data = read_db_meta_data(config.source_db_config)
         target_meta_data = read_db_meta_data(config.target_db_config)
@@ -0,0 +1,92 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from rich.console import Console
+from rich.padding import Padding
+from rich.table import Table
+from rich.text import Text
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    Status,
+    create_query_statistics_table,
+    get_query_statistics,
+)
+from .diff import DBSchemaDiff
+
+
+@dataclass(frozen=True)
+class SummaryRow:
+    label: str
+    discrepancy_count: int
+
+    @property
+    def discrepancy_count_as_str(self) -> str:
+        return str(self.discrepancy_count)
+
+    @property
+    def status(self) -> Status:
+        return Status.OK if self.discrepancy_count == 0 else Status.ERROR
+
+
+def create_summary_rows(db_schema_diff: DBSchemaDiff) -> Tuple[SummaryRow, ...]:
+    result = [
+        SummaryRow(label="Tables missing in source DB", discrepancy_count=db_schema_diff.number_of_tables_missing_in_source_db()),
+        SummaryRow(label="Tables missing in target DB", discrepancy_count=db_schema_diff.number_of_tables_missing_in_target_db()),
+        SummaryRow(label="Tables with distinct columns", discrepancy_count=db_schema_diff.number_of_tables_with_incompatible_columns()),
+        SummaryRow(label="Tables with distinct constraints", discrepancy_count=db_schema_diff.number_of_tables_with_incompatible_constraints()),
+        SummaryRow(label="Tables with distinct indexes", discrepancy_count=db_schema_diff.number_of_tables_with_incompatible_indexes()),
+        SummaryRow(label="Sequences missing in source DB", discrepancy_count=db_schema_diff.number_of_sequences_missing_in_source_db()),
+        SummaryRow(label="Sequences missing in target DB", discrepancy_count=db_schema_diff.number_of_sequences_missing_in_target_db()),
+        SummaryRow(label="Views missing in source DB", discrepancy_count=db_schema_diff.number_of_views_missing_in_source_db()),
+        SummaryRow(label="Views missing in target DB", discrepancy_count=db_schema_diff.number_of_views_missing_in_target_db()),
+        SummaryRow(label="Materialized views missing in source DB", discrepancy_count=db_schema_diff.number_of_materialized_views_missing_in_source_db()),
+        SummaryRow(label="Materialized views missing in target DB", discrepancy_count=db_schema_diff.number_of_materialized_views_missing_in_target_db()),
+    ]
+    return tuple(result)
+
+
+def create_summary_table(db_schema_diff: DBSchemaDiff) -> Table:
+    table = Table(title="[cyan]Schema Comparison Summary[/]", show_lines=True)
+
+    table.add_column(Text("Discrepancy Type", justify="center"), justify="left")
+    table.add_column(Text("Count", justify="center"), justify="right")
+    table.add_column(Text("Status", justify="center"), justify="center")
+
+    for row in create_summary_rows(db_schema_diff):
+        table.add_row(
+            row.label,
+            row.discrepancy_count_as_str,
+            Status.format(row.status),
+        )
+    return table
+
+
+def print_summary(config: Configuration, db_schema_diff: DBSchemaDiff, summary_html_file: str) -> None:
+    console = Console(record=True, highlight=False)
+    console.print()
+    console.print(Padding(create_summary_table(db_schema_diff), (1, 2)))
+    console.print(Padding(create_query_statistics_table(get_query_statistics().snapshot()), (0, 2)))
+    console.print()
+    console.print(f"Source DB: [cyan]{config.source_db_config.url_without_password}[/], schema [cyan]{config.source_db_config.schema}[/]")
+    console.print(f"Target DB: [cyan]{config.target_db_config.url_without_password}[/], schema [cyan]{config.target_db_config.schema}[/]")
+    if summary_html_file:
+        console.save_html(summary_html_file)
@@ -0,0 +1,141 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from argparse import (
+    ArgumentParser,
+    Namespace,
+    RawTextHelpFormatter,
+)
+from os.path import isdir
+
+from rdbmsdiff.foundation import (
+    ReadConfigurationError,
+    epilog,
+    handle_configuration_error,
+    handle_general_error,
+    print_banner,
+    read_config,
+)
+
+
+def _service_epilog() -> str:
+    return """
+The service accepts comparison jobs via HTTP. Jobs are executed one after another, each of them
+reuses the meta-information and the connection pools. The following requests are supported (the
+bodies of POST requests are JSON objects, the responses are JSON objects as well):
+
+GET  /health                                  liveness check
+POST /refresh                                 re-reads the meta-information of both databases
+POST /compare/schema   {"report": "<file>"}   schema comparison, detailed report written to the file
+POST /compare/data     {"report": "<file>"}   data comparison, detailed report written to the file
+POST /compare/recordcount {"drill_down": true}  record count comparison
+
+The names of the report files are relative to the report directory (see the --report-dir option),
+absolute paths and paths leading out of the report directory are rejected.
+
+Example:
+curl -X POST -d '{"report": "data-report.txt"}' http://localhost:8765/compare/data
+""" + epilog()
+
+
+def create_cmd_line_args_parser() -> ArgumentParser:
+    parser = ArgumentParser(description="RDBMS Diff Comparison Service", formatter_class=RawTextHelpFormatter, epilog=_service_epilog())
+
+    # positional mandatory arguments
+    parser.add_argument(
+        "config_file",
+        help="the name of the configuration file containing the connection strings and usernames"
+    )
+
+    # optional arguments
+    parser.add_argument(
+        "-p", "--ask-for-passwords",
+        dest="ask_for_passwords",
+        default=False,
+        action="store_true",
+        help="if specified, the user will be asked for passwords (the passwords will not be read from env. variables)"
+    )
+    parser.add_argument(
+        "--host",
+        dest="host",
+        default="127.0.0.1",
+        help="the address the service is to listen on (default is 127.0.0.1, i.e. local access only)"
+    )
+    parser.add_argument(
+        "--port",
+        dest="port",
+        type=int,
+        default=8765,
+        help="the port the service is to listen on (default is 8765)"
+    )
+    parser.add_argument(
+        "--report-dir",
+        dest="report_directory",
+        default=".",
+        help="the directory the reports are to be written to (default is the current directory)"
+    )
+
+    return parser
+
+
+def parse_cmd_line_args() -> Namespace:
+    parser = create_cmd_line_args_parser()
+    params = parser.parse_args()
+    return params
+
+
+def main() -> None:
+    cmd_line_args = parse_cmd_line_args()
+    # the service (SQLAlchemy, rich) is imported once the command line has been parsed, so
+    # that the help and invalid command line arguments are reported without delay
+    from rich.console import Console
+
+    from rdbmsdiff.data.client_hashing import shutdown_client_hasher
+    from rdbmsdiff.foundation import dispose_db_engines
+    from .server import (
+        ComparisonServer,
+        ComparisonService,
+    )
+
+    try:
+        print_banner()
+        config = read_config(cmd_line_args.config_file, cmd_line_args.ask_for_passwords)
+        if not isdir(cmd_line_args.report_directory):
+            raise ReadConfigurationError(f"Report directory {cmd_line_args.report_directory} does not exist.")
+        service = ComparisonService(config, cmd_line_args.report_directory)
+        server = ComparisonServer(cmd_line_args.host, cmd_line_args.port, service)
+        console = Console(record=False, highlight=False)
+        console.print()
+        console.print(f"Listening on [cyan]http://{cmd_line_args.host}:{cmd_line_args.port}[/] (press Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+    except ReadConfigurationError as e:
+        handle_configuration_error(e)
+    except Exception as e:
+        handle_general_error(e)
+    finally:
+        shutdown_client_hasher()
+        dispose_db_engines()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from dataclasses import asdict
+from http import HTTPStatus
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from json import (
+    JSONDecodeError,
+    dumps,
+    loads,
+)
+from os.path import (
+    commonpath,
+    isabs,
+    join,
+    realpath,
+)
+from pathlib import PurePath
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+)
+
+from rich.console import Console
+
+from rdbmsdiff.data.comparison import validate
+from rdbmsdiff.foundation import (
+    Configuration,
+    DatabaseRole,
+    DBSchema,
+    Phase,
+    Stopwatch,
+    get_db_engine,
+    get_query_statistics,
+    read_db_meta_data,
+)
+from rdbmsdiff.recordcount.comparison import RecordCountComparison
+from rdbmsdiff.schema.diff import DBSchemaDiff
+from rdbmsdiff.schema.report import write_report
+from rdbmsdiff.schema.summary import create_summary_rows
+
+
+class ComparisonService:
+    """
+    Keeps the meta-information of both databases and the connection pools warm, and executes
+    comparison jobs. The jobs are serialized, as they share the concurrency limiters and the
+    query statistics. The reports are written to the given directory, the names of the reports
+    specified by the clients are relative to it.
+    """
+
+    def __init__(self, config: Configuration, report_directory: str) -> None:
+        self._config = config
+        self._report_directory = realpath(report_directory)
+        self._console = Console(record=False, highlight=False)
+        self._lock = Lock()
+        self._source_db_meta_data: DBSchema
+        self._target_db_meta_data: DBSchema
+        self._read_meta_data()
+        for phase in (Phase.VALIDATION, Phase.COUNTING):
+            get_db_engine(config.source_db_config, phase)
+            get_db_engine(config.target_db_config, phase)
+
+    def _read_meta_data(self) -> None:
+        self._source_db_meta_data = read_db_meta_data(self._config.source_db_config)
+        self._target_db_meta_data = read_db_meta_data(self._config.target_db_config)
+
+    def report_path(self, report_name: str) -> str:
+        """
+        Returns the path of the report with the given name. Raises ValueError if the report would
+        not be written to the report directory (e.g. absolute paths or paths containing '..').
+        """
+        if not report_name or isabs(report_name) or ".." in PurePath(report_name).parts:
+            raise ValueError(f"report name {report_name!r} is not a relative path within the report directory")
+        path = realpath(join(self._report_directory, report_name))
+        # symbolic links could still lead out of the report directory
+        if commonpath([self._report_directory, path]) != self._report_directory:
+            raise ValueError(f"report name {report_name!r} is not a relative path within the report directory")
+        return path
+
+    def _run_job(self, job: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            get_query_statistics().reset()
+            stopwatch = Stopwatch.start()
+            result = job()
+            snapshot = get_query_statistics().snapshot()
+            result["duration"] = stopwatch.elapsed_time_as_str()
+            result["query_statistics"] = [
+                {"phase": str(phase), "database": str(role), **asdict(snapshot.get(phase, role))}
+                for phase in Phase
+                for role in DatabaseRole
+                if snapshot.get(phase, role).round_trip_count > 0
+            ]
+            return result
+
+    def refresh(self) -> Dict[str, Any]:
+        def job() -> Dict[str, Any]:
+            self._read_meta_data()
+            return {
+                "source_table_count": len(self._source_db_meta_data.tables),
+                "target_table_count": len(self._target_db_meta_data.tables),
+            }
+        return self._run_job(job)
+
+    def compare_schema(self, report_name: str) -> Dict[str, Any]:
+        report_filename = self.report_path(report_name)
+
+        def job() -> Dict[str, Any]:
+            schema_diff = DBSchemaDiff(source_schema=self._source_db_meta_data, target_schema=self._target_db_meta_data)
+            write_report(schema_diff, report_filename)
+            return {"summary": [asdict(row) for row in create_summary_rows(schema_diff)]}
+        return self._run_job(job)
+
+    def compare_data(self, report_name: str) -> Dict[str, Any]:
+        report_filename = self.report_path(report_name)
+
+        def job() -> Dict[str, Any]:
+            statistics = validate(self._config, self._source_db_meta_data, self._target_db_meta_data, report_filename)
+            return {"summary": asdict(statistics)}
+        return self._run_job(job)
+
+    def compare_record_counts(self, drill_down: bool) -> Dict[str, Any]:
+        def job() -> Dict[str, Any]:
+            comparison = RecordCountComparison(self._config, self._console, drill_down)
+            comparison.run()
+            return {
+                "results": [
+                    {
+                        "table": result.table,
+                        "source_record_count": result.source_record_count,
+                        "target_record_count": result.target_record_count,
+                        "status": result.status.name,
+                        "range_differences": [asdict(difference) for difference in result.range_differences],
+                    }
+                    for result in comparison.results
+                ]
+            }
+        return self._run_job(job)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+
+    server: "ComparisonServer"
+
+    def _send_json(self, status: HTTPStatus, body: Dict[str, Any]) -> None:
+        content = dumps(body, indent=2).encode("UTF-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        if length == 0:
+            return {}
+        body = loads(self.rfile.read(length))
+        if not isinstance(body, dict):
+            raise ValueError("JSON object expected")
+        return body
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "OK"})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown resource {self.path}"})
+
+    def do_POST(self) -> None:
+        service = self.server.service
+        try:
+            body = self._read_json()
+            if self.path == "/refresh":
+                result = service.refresh()
+            elif self.path == "/compare/schema":
+                result = service.compare_schema(str(body["report"]))
+            elif self.path == "/compare/data":
+                result = service.compare_data(str(body["report"]))
+            elif self.path == "/compare/recordcount":
+                result = service.compare_record_counts(bool(body.get("drill_down", False)))
+            else:
+                self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown resource {self.path}"})
+                return
+        except (JSONDecodeError, KeyError, ValueError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid request ({e})"})
+            return
+        except Exception as e:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+            return
+        self._send_json(HTTPStatus.OK, result)
+
+
+class ComparisonServer(ThreadingHTTPServer):
+
+    def __init__(self, host: str, port: int, service: ComparisonService) -> None:
+        super().__init__((host, port), _RequestHandler)
+        self.service = service
@@ -0,0 +1,75 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from sqlite3 import connect
+from typing import (
+    Callable,
+    Iterator,
+    Sequence,
+    Tuple,
+)
+
+from pytest import fixture
+
+from rdbmsdiff.foundation import (
+    Configuration,
+    DBTable,
+    dispose_db_engines,
+    read_config,
+    read_db_meta_data,
+)
+
+
+def _create_database(filename: str, statements: Sequence[str]) -> None:
+    connection = connect(filename)
+    try:
+        for statement in statements:
+            connection.execute(statement)
+        connection.commit()
+    finally:
+        connection.close()
+
+
+@fixture
+def sqlite_databases(tmp_path, monkeypatch) -> Iterator[Callable[..., Tuple[Configuration, DBTable]]]:
+    """
+    Provides a function creating a pair of SQLite databases by the given statements, and returning the
+    configuration of the comparison (with the given options of the Validation section, and the given
+    additional sections) together with the meta-information of the given table of the source database.
+    """
+    monkeypatch.setenv("RDBMS_DIFF_SOURCE_DB_PASSWORD", "unused")
+    monkeypatch.setenv("RDBMS_DIFF_TARGET_DB_PASSWORD", "unused")
+
+    def create(source_statements: Sequence[str], target_statements: Sequence[str], table_name: str, extra_sections: str = "", **validation_options: str) -> Tuple[Configuration, DBTable]:
+        source_filename = str(tmp_path / "source.db")
+        target_filename = str(tmp_path / "target.db")
+        _create_database(source_filename, source_statements)
+        _create_database(target_filename, target_statements)
+        config_filename = tmp_path / "config.ini"
+        config_filename.write_text(
+            f"[DB.Source]\nURL = sqlite:///{source_filename}\n"
+            f"[DB.Target]\nURL = sqlite:///{target_filename}\n"
+            "[Validation]\n" + "".join(f"{name} = {value}\n" for name, value in validation_options.items()) +
+            extra_sections
+        )
+        config = read_config(str(config_filename), False)
+        tables = {table.name: table for table in read_db_meta_data(config.source_db_config).tables}
+        return config, tables[table_name]
+
+    yield create
+    dispose_db_engines()
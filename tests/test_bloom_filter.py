@@ -0,0 +1,47 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from rdbmsdiff.data.bloom_filter import BloomFilter
+
+
+def test_added_values_are_always_contained() -> None:
+    bloom_filter = BloomFilter(expected_count=10_000, false_positive_rate=0.001)
+    values = [f"key-{index}" for index in range(10_000)]
+    for value in values:
+        bloom_filter.add(value)
+    assert all(value in bloom_filter for value in values)
+
+
+def test_false_positive_rate_is_close_to_the_configured_rate() -> None:
+    bloom_filter = BloomFilter(expected_count=10_000, false_positive_rate=0.01)
+    for index in range(10_000):
+        bloom_filter.add(f"key-{index}")
+    false_positive_count = sum(f"other-{index}" in bloom_filter for index in range(20_000))
+    # 1 % of 20,000 probes is 200 on average, the bound leaves enough room for the variance
+    assert false_positive_count < 400
+
+
+def test_empty_filter_contains_nothing() -> None:
+    bloom_filter = BloomFilter(expected_count=0, false_positive_rate=0.001)
+    assert "key" not in bloom_filter
+    assert "" not in bloom_filter
+
+
+def test_size_is_derived_from_the_expected_count_and_the_rate() -> None:
+    # about 14.4 bits per value for the rate of 0.1 %
+    assert BloomFilter(expected_count=100_000, false_positive_rate=0.001).size_in_bytes == 179_720
@@ -0,0 +1,95 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from hashlib import md5
+
+from pytest import fixture
+
+from rdbmsdiff.data import client_hashing
+from rdbmsdiff.data.client_hashing import (
+    ClientHasher,
+    get_client_hasher,
+)
+from rdbmsdiff.data.record_validator import RecordValidator
+from rdbmsdiff.data.varchar_value_validator import VarcharValueValidator
+from rdbmsdiff.foundation.dialect import SQLiteDialect
+
+
+_VALUES = [f"value-{index}-{'ž' * (index % 7)}" for index in range(5_000)] + ["", "\x1f", "'quoted'"]
+
+
+def _expected_digests(values):
+    return [md5(value.encode("UTF-8")).digest() for value in values]
+
+
+@fixture
+def client_hasher(monkeypatch):
+    # a fresh hasher shared by the validators, whose worker processes are used even for small batches
+    monkeypatch.setattr(client_hashing, "_HASHER", None)
+    monkeypatch.setattr(client_hashing, "_MIN_PARALLEL_BATCH", 10)
+    yield get_client_hasher(2)
+    get_client_hasher().shutdown()
+
+
+def test_digests_computed_by_worker_processes_equal_md5() -> None:
+    hasher = ClientHasher(3)
+    try:
+        assert hasher.digests(_VALUES) == _expected_digests(_VALUES)
+    finally:
+        hasher.shutdown()
+
+
+def test_digests_computed_by_calling_thread_equal_md5() -> None:
+    hasher = ClientHasher(1)
+    assert hasher.digests(_VALUES) == _expected_digests(_VALUES)
+    assert hasher.digests([]) == []
+
+
+def test_client_hashes_of_records_equal_server_hashes(sqlite_databases, client_hasher, monkeypatch) -> None:
+    statements = [
+        "CREATE TABLE orders (id INTEGER PRIMARY KEY, customer VARCHAR(50), amount NUMERIC(10, 2), created TIMESTAMP, note TEXT)",
+    ] + [
+        f"INSERT INTO orders VALUES ({index}, 'customer {index} ž', {index}.50, '2024-01-{index % 28 + 1:02d} 10:00:00.000000', {'NULL' if index % 3 == 0 else repr(f'note {index}')})"
+        for index in range(1, 201)
+    ]
+    config, table = sqlite_databases(statements, statements, "orders", Limit="500", RecordWindows="1")
+    server_hashes = RecordValidator(config, table).run_query(config.source_db_config)
+    monkeypatch.setattr(SQLiteDialect, "server_side_hashing", False)
+    client_hashes = RecordValidator(config, table).run_query(config.source_db_config)
+    assert not server_hashes.error and not client_hashes.error
+    assert server_hashes.sql != client_hashes.sql
+    assert client_hashes.result_set == server_hashes.result_set
+    assert client_hashes.result_set.count("('") == 200
+    # the records have been hashed by the worker processes
+    assert client_hasher._executor is not None
+
+
+def test_lowest_client_hashes_of_values_equal_server_hashes(sqlite_databases, client_hasher, monkeypatch) -> None:
+    statements = ["CREATE TABLE customers (id INTEGER PRIMARY KEY, name VARCHAR(50))"] + [
+        f"INSERT INTO customers VALUES ({index}, {'NULL' if index % 10 == 0 else repr(f'customer {index % 150} ž')})"
+        for index in range(1, 301)
+    ]
+    config, table = sqlite_databases(statements, statements, "customers", Limit="50")
+    column = table.columns_as_dict["name"]
+    server_hashes = VarcharValueValidator(config, table, column).run_query(config.source_db_config)
+    monkeypatch.setattr(SQLiteDialect, "server_side_hashing", False)
+    client_hashes = VarcharValueValidator(config, table, column).run_query(config.source_db_config)
+    assert not server_hashes.error and not client_hashes.error
+    assert server_hashes.sql != client_hashes.sql
+    assert client_hashes.result_set == server_hashes.result_set
+    assert client_hashes.result_set.count("('") == 50
@@ -0,0 +1,100 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from threading import (
+    Event,
+    Thread,
+)
+
+from pytest import raises
+
+from rdbmsdiff.foundation.concurrency import AdaptiveConcurrencyLimiter
+
+
+def _complete_queries(limiter: AdaptiveConcurrencyLimiter, count: int, latency_sec: float = 0.1, failed: bool = False) -> None:
+    for _ in range(count):
+        limiter.acquire()
+        limiter.release(latency_sec, failed)
+
+
+def test_limit_grows_additively() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=100)
+    _complete_queries(limiter, 1)
+    assert limiter.limit == 2
+    # roughly one per round of queries (the increase is 1/limit per query)
+    _complete_queries(limiter, 2)
+    assert limiter.limit == 2
+    _complete_queries(limiter, 1)
+    assert limiter.limit == 3
+    _complete_queries(limiter, 3)
+    assert limiter.limit == 4
+
+
+def test_limit_never_exceeds_the_max_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=3, initial_limit=10)
+    assert limiter.limit == 3
+    _complete_queries(limiter, 50)
+    assert limiter.limit == 3
+
+
+def test_failed_query_halves_the_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=16)
+    _complete_queries(limiter, 1, failed=True)
+    assert limiter.limit == 8
+    _complete_queries(limiter, 10, failed=True)
+    assert limiter.limit == 1
+
+
+def test_slow_query_halves_the_limit_after_warm_up() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8, latency_tolerance=3.0)
+    _complete_queries(limiter, 5, latency_sec=0.1)
+    assert limiter.limit == 8
+    _complete_queries(limiter, 1, latency_sec=1.0)
+    assert limiter.limit == 4
+
+
+def test_slow_queries_during_warm_up_do_not_reduce_the_limit() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+    _complete_queries(limiter, 1, latency_sec=0.1)
+    _complete_queries(limiter, 1, latency_sec=10.0)
+    assert limiter.limit == 8
+
+
+def test_exception_raised_in_slot_is_a_failure() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+    with raises(RuntimeError):
+        with limiter.slot():
+            raise RuntimeError("query failed")
+    assert limiter.limit == 4
+
+
+def test_acquire_waits_for_a_free_slot() -> None:
+    limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+    limiter.acquire()
+    acquired = Event()
+
+    def acquire() -> None:
+        limiter.acquire()
+        acquired.set()
+
+    thread = Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.2)
+    limiter.release(0.1, False)
+    assert acquired.wait(5)
+    thread.join()
@@ -0,0 +1,80 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from rdbmsdiff.data.validation_engine import create_validators
+
+
+_CREATE_TABLE = "CREATE TABLE fact_orders (id INTEGER PRIMARY KEY NOT NULL, amount INTEGER NOT NULL, description VARCHAR(100) NOT NULL, raw_payload VARCHAR(100) NOT NULL)"
+
+_PROFILES = """
+[Validation.Table.FACT_*]
+Limit = 500
+Validators = Record, Numeric
+Validators.description = VarcharLength
+ExcludeColumns = raw_payload
+
+[Validation.Table.fact_orders]
+Limit = 7
+
+[Validation.Table.dim_*]
+Validators = Distribution
+"""
+
+
+def _validation_properties(sqlite_databases, **validation_options: str):
+    config, table = sqlite_databases([_CREATE_TABLE], [_CREATE_TABLE], "fact_orders", _PROFILES, **validation_options)
+    return config, table, config.validation_properties
+
+
+def test_first_matching_profile_applies(sqlite_databases) -> None:
+    _, _, properties = _validation_properties(sqlite_databases, Limit="50")
+    # the patterns are case-insensitive, the profile defined first wins even if a later one is more specific
+    assert properties.table_profile("fact_orders").table_pattern == "FACT_*"
+    assert properties.limit_for("fact_orders") == 500
+    assert properties.limit_for("dim_customers") == 50
+    assert properties.limit_for("customers") == 50
+    assert properties.table_profile("customers") is None
+
+
+def test_column_validators_take_precedence_over_table_validators(sqlite_databases) -> None:
+    _, _, properties = _validation_properties(sqlite_databases)
+    assert properties.is_validator_enabled("NumericValidator", "fact_orders", "amount")
+    assert not properties.is_validator_enabled("NullValueCountValidator", "fact_orders", "amount")
+    assert properties.is_validator_enabled("VarcharLengthValidator", "fact_orders", "description")
+    assert not properties.is_validator_enabled("VarcharValueValidator", "fact_orders", "description")
+    assert not properties.is_validator_enabled("NumericValidator", "fact_orders", "description")
+    # the validator names are case-insensitive, with or without the suffix
+    assert properties.is_validator_enabled("record", "fact_orders")
+    assert not properties.is_validator_enabled("DistributionValidator", "fact_orders")
+    assert properties.is_validator_enabled("DistributionValidator", "dim_customers")
+    assert not properties.is_validator_enabled("RecordValidator", "dim_customers")
+    # tables without a profile are validated by all validators
+    assert properties.is_validator_enabled("VarcharValueValidator", "customers", "name")
+
+
+def test_excluded_columns_are_not_validated(sqlite_databases) -> None:
+    config, table, properties = _validation_properties(sqlite_databases)
+    assert properties.is_column_excluded("fact_orders", "RAW_PAYLOAD")
+    assert not properties.is_validator_enabled("VarcharLengthValidator", "fact_orders", "raw_payload")
+    validators = {(type(validator).__name__, validator.column.name if validator.column else None) for validator in create_validators(config, table)}
+    assert validators == {
+        ("NumericValidator", "id"),
+        ("NumericValidator", "amount"),
+        ("VarcharLengthValidator", "description"),
+        ("RecordValidator", None),
+    }
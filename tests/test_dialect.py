@@ -0,0 +1,187 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from decimal import Decimal
+
+from pytest import (
+    fixture,
+    mark,
+)
+from sqlalchemy import (
+    create_engine,
+    text,
+)
+from sqlalchemy.sql.sqltypes import (
+    BOOLEAN,
+    INTEGER,
+    NUMERIC,
+    TEXT,
+    TIME,
+    TIMESTAMP,
+    VARCHAR,
+)
+
+from rdbmsdiff.foundation.dialect import (
+    MariaDBDialect,
+    MySQLDialect,
+    PostgreSQLDialect,
+    SQLiteDialect,
+)
+from rdbmsdiff.foundation.metadata import DBColumn
+
+
+_BOOLEAN = DBColumn("flag", BOOLEAN(), True)
+_DECIMAL = DBColumn("amount", NUMERIC(10, 2), True)
+_TIMESTAMP = DBColumn("created", TIMESTAMP(), True)
+_TIMESTAMP_WITH_TIME_ZONE = DBColumn("created_tz", TIMESTAMP(timezone=True), True)
+_TIME = DBColumn("at_time", TIME(), True)
+_TEXT = DBColumn("note", TEXT(), True)
+_INTEGER = DBColumn("id", INTEGER(), False)
+_STRING = DBColumn("code", VARCHAR(20), False)
+
+
+@mark.parametrize("dialect, column, expected", [
+    (PostgreSQLDialect(), _BOOLEAN, "CASE WHEN flag THEN '1' WHEN NOT flag THEN '0' END"),
+    (MySQLDialect(), _BOOLEAN, "CASE WHEN flag THEN '1' WHEN NOT flag THEN '0' END"),
+    (SQLiteDialect(), _BOOLEAN, "CASE WHEN flag THEN '1' WHEN NOT flag THEN '0' END"),
+    (
+        PostgreSQLDialect(), _DECIMAL,
+        "CASE WHEN POSITION('.' IN CAST(amount AS TEXT)) > 0 THEN TRIM(TRAILING '.' FROM TRIM(TRAILING '0' FROM CAST(amount AS TEXT))) ELSE CAST(amount AS TEXT) END",
+    ),
+    (
+        MySQLDialect(), _DECIMAL,
+        "CASE WHEN POSITION('.' IN CAST(amount AS CHAR)) > 0 THEN TRIM(TRAILING '.' FROM TRIM(TRAILING '0' FROM CAST(amount AS CHAR))) ELSE CAST(amount AS CHAR) END",
+    ),
+    (
+        SQLiteDialect(), _DECIMAL,
+        "CASE WHEN INSTR(CAST(amount AS TEXT), '.') > 0 THEN RTRIM(RTRIM(CAST(amount AS TEXT), '0'), '.') ELSE CAST(amount AS TEXT) END",
+    ),
+    (PostgreSQLDialect(), _TIMESTAMP, "TO_CHAR(created, 'YYYY-MM-DD HH24:MI:SS.US')"),
+    (PostgreSQLDialect(), _TIMESTAMP_WITH_TIME_ZONE, "TO_CHAR(created_tz AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS.US')"),
+    (MySQLDialect(), _TIMESTAMP, "DATE_FORMAT(created, '%Y-%m-%d %H:%i:%s.%f')"),
+    (MySQLDialect(), _TIMESTAMP_WITH_TIME_ZONE, "DATE_FORMAT(CONVERT_TZ(created_tz, @@session.time_zone, '+00:00'), '%Y-%m-%d %H:%i:%s.%f')"),
+    (MariaDBDialect(), _TIMESTAMP_WITH_TIME_ZONE, "DATE_FORMAT(CONVERT_TZ(created_tz, @@session.time_zone, '+00:00'), '%Y-%m-%d %H:%i:%s.%f')"),
+    (PostgreSQLDialect(), _TEXT, "CAST(note AS TEXT)"),
+    (MySQLDialect(), _TEXT, "CONVERT(note USING utf8mb4)"),
+    (SQLiteDialect(), _TEXT, "note"),
+])
+def test_canonical_value_expressions(dialect, column, expected) -> None:
+    assert dialect.canonical_value(column) == expected
+
+
+@mark.parametrize("dialect, expected", [
+    (PostgreSQLDialect(), "CASE WHEN note IS NULL THEN 'N' ELSE CONCAT(CAST(CHAR_LENGTH(CAST(note AS TEXT)) AS TEXT), ':', CAST(note AS TEXT)) END"),
+    (MySQLDialect(), "CASE WHEN note IS NULL THEN 'N' ELSE CONCAT(CAST(CHAR_LENGTH(CONVERT(note USING utf8mb4)) AS CHAR), ':', CONVERT(note USING utf8mb4)) END"),
+    (SQLiteDialect(), "CASE WHEN note IS NULL THEN 'N' ELSE CAST(LENGTH(note) AS TEXT) || ':' || note END"),
+])
+def test_canonical_field_is_prefixed_by_the_number_of_characters(dialect, expected) -> None:
+    assert dialect.canonical_field(_TEXT) == expected
+
+
+@fixture
+def sqlite_connection():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(text(
+            "CREATE TABLE samples (id INTEGER PRIMARY KEY, code VARCHAR(20), flag BOOLEAN, amount NUMERIC(10, 2), "
+            "created TIMESTAMP, created_tz TIMESTAMP, at_time TIME, note TEXT)"
+        ))
+        yield connection
+    engine.dispose()
+
+
+def _insert(connection, **values) -> None:
+    columns = ", ".join(values)
+    parameters = ", ".join(f":{name}" for name in values)
+    connection.execute(text(f"INSERT INTO samples ({columns}) VALUES ({parameters})"), values)
+
+
+def _canonical_values(connection, column: DBColumn):
+    expression = SQLiteDialect().canonical_value(column)
+    return [row[0] for row in connection.execute(text(f"SELECT {expression} FROM samples ORDER BY id"))]
+
+
+def test_sqlite_boolean_values(sqlite_connection) -> None:
+    for index, flag in enumerate((True, False, None), start=1):
+        _insert(sqlite_connection, id=index, flag=flag)
+    assert _canonical_values(sqlite_connection, _BOOLEAN) == ["1", "0", None]
+
+
+def test_sqlite_decimal_values(sqlite_connection) -> None:
+    for index, amount in enumerate(("1.50", "2.00", "-0.25", "10"), start=1):
+        sqlite_connection.execute(text(f"INSERT INTO samples (id, amount) VALUES ({index}, {amount})"))
+    assert _canonical_values(sqlite_connection, _DECIMAL) == ["1.5", "2", "-0.25", "10"]
+
+
+def test_sqlite_timestamp_values(sqlite_connection) -> None:
+    for index, created in enumerate(("2024-01-02 03:04:05.123456", "2024-01-02 03:04:05", "2024-01-02T03:04:05.5"), start=1):
+        _insert(sqlite_connection, id=index, created=created)
+    assert _canonical_values(sqlite_connection, _TIMESTAMP) == ["2024-01-02 03:04:05.123456", "2024-01-02 03:04:05.000000", "2024-01-02 03:04:05.500000"]
+
+
+def test_sqlite_timestamp_with_time_zone_values_are_converted_to_utc(sqlite_connection) -> None:
+    for index, created in enumerate(("2024-01-02 03:04:05.123456+02:00", "2024-01-02 03:04:05-01:30", "2024-01-02 03:04:05.5Z"), start=1):
+        _insert(sqlite_connection, id=index, created_tz=created)
+    assert _canonical_values(sqlite_connection, _TIMESTAMP_WITH_TIME_ZONE) == ["2024-01-02 01:04:05.123456", "2024-01-02 04:34:05.000000", "2024-01-02 03:04:05.500000"]
+
+
+def test_sqlite_time_values(sqlite_connection) -> None:
+    for index, at_time in enumerate(("03:04:05.123456", "03:04:05", "03:04:05.25"), start=1):
+        _insert(sqlite_connection, id=index, at_time=at_time)
+    assert _canonical_values(sqlite_connection, _TIME) == ["03:04:05.123456", "03:04:05.000000", "03:04:05.250000"]
+
+
+def test_sqlite_text_values(sqlite_connection) -> None:
+    _insert(sqlite_connection, id=1, note="Žluťoučký kůň")
+    _insert(sqlite_connection, id=2, note=None)
+    assert _canonical_values(sqlite_connection, _TEXT) == ["Žluťoučký kůň", None]
+    field = SQLiteDialect().canonical_field(_TEXT)
+    assert [row[0] for row in sqlite_connection.execute(text(f"SELECT {field} FROM samples ORDER BY id"))] == ["13:Žluťoučký kůň", "N"]
+
+
+@mark.parametrize("dialect, expected_amount", [
+    (PostgreSQLDialect(), Decimal("2.5")),
+    (MySQLDialect(), Decimal("2.5")),
+    (SQLiteDialect(), 2.5),
+])
+def test_keys_condition_binds_the_key_values(dialect, expected_amount) -> None:
+    columns = [_INTEGER, _DECIMAL, _STRING, _TIMESTAMP]
+    keys = [("1", "2.5", "O'Brien", "2024-01-02 03:04:05.000000"), ("2", "3", "x", "2024-01-03 00:00:00.000000")]
+    condition, parameters = dialect.keys_condition(columns, keys)
+    timestamp_value = dialect.canonical_value(_TIMESTAMP)
+    assert condition == (
+        f"(id = :key_0_0 AND amount = :key_0_1 AND code = :key_0_2 AND {timestamp_value} = :key_0_3) OR "
+        f"(id = :key_1_0 AND amount = :key_1_1 AND code = :key_1_2 AND {timestamp_value} = :key_1_3)"
+    )
+    assert parameters == {
+        "key_0_0": 1, "key_0_1": expected_amount, "key_0_2": "O'Brien", "key_0_3": "2024-01-02 03:04:05.000000",
+        "key_1_0": 2, "key_1_1": 3, "key_1_2": "x", "key_1_3": "2024-01-03 00:00:00.000000",
+    }
+    # the values are bound, so they are not embedded (and do not have to be escaped)
+    assert "O'Brien" not in condition
+
+
+def test_sqlite_keys_condition_selects_the_records_with_the_given_keys(sqlite_connection) -> None:
+    _insert(sqlite_connection, id=1, amount=2.5, code="O'Brien", created="2024-01-02 03:04:05.000000")
+    _insert(sqlite_connection, id=2, amount=3, code="x", created="2024-01-03 00:00:00.000000")
+    _insert(sqlite_connection, id=3, amount=2.5, code="O'Brien", created="2024-01-03 00:00:00.000000")
+    columns = [_INTEGER, _DECIMAL, _STRING, _TIMESTAMP]
+    keys = [("1", "2.5", "O'Brien", "2024-01-02 03:04:05.000000"), ("2", "3", "x", "2024-01-03 00:00:00.000000"), ("4", "1", "y", "2024-01-01 00:00:00.000000")]
+    condition, parameters = SQLiteDialect().keys_condition(columns, keys)
+    rows = sqlite_connection.execute(text(f"SELECT id FROM samples WHERE {condition} ORDER BY id"), parameters)
+    assert [row[0] for row in rows] == [1, 2]
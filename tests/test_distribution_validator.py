@@ -0,0 +1,108 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import (
+    date,
+    datetime,
+    timedelta,
+    timezone,
+)
+
+from pytest import mark
+from sqlalchemy.sql.sqltypes import (
+    DATE,
+    FLOAT,
+    INTEGER,
+    TIME,
+    TIMESTAMP,
+)
+
+from rdbmsdiff.data.distribution_validator import (
+    DistributionValidator,
+    _equi_width_thresholds,
+)
+from rdbmsdiff.data.validation_details import ValidationResult
+from rdbmsdiff.foundation.metadata import DBColumn
+
+
+@mark.parametrize("datatype, min_value, max_value, bucket_count, expected", [
+    # integer thresholds are rounded up, so that the buckets contain the same integers in all databases
+    (INTEGER(), 0, 10, 3, ("4", "7")),
+    (FLOAT(), 0, 1, 4, ("0.25", "0.5", "0.75")),
+    (DATE(), date(2024, 1, 1), date(2024, 1, 11), 5, ("2024-01-03", "2024-01-05", "2024-01-07", "2024-01-09")),
+    # thresholds equal after rounding to whole days are merged
+    (DATE(), "2024-01-01", "2024-01-03", 10, ("2024-01-01", "2024-01-02")),
+    (TIMESTAMP(), "2024-01-01 00:00:00.000000", "2024-01-01 04:00:00.000000", 4, ("2024-01-01 01:00:00.000000", "2024-01-01 02:00:00.000000", "2024-01-01 03:00:00.000000")),
+    # wide buckets are aligned to days
+    (TIMESTAMP(), "2024-01-01 00:00:00", "2024-01-21 12:00:00", 2, ("2024-01-11 00:00:00.000000",)),
+    # timestamps with time zone are converted to UTC
+    (TIMESTAMP(timezone=True), datetime(2024, 1, 1, 2, tzinfo=timezone(timedelta(hours=2))), datetime(2024, 1, 1, 4, tzinfo=timezone.utc), 2, ("2024-01-01 02:00:00.000000",)),
+    # e.g. MySQL drivers return the values of TIME columns as intervals
+    (TIME(), timedelta(hours=1), timedelta(hours=3), 2, ("02:00:00.000000",)),
+    (TIME(), "01:00:00", "03:00:00", 2, ("02:00:00.000000",)),
+    # a single value just has a single bucket
+    (INTEGER(), 5, 5, 10, ()),
+])
+def test_equi_width_thresholds(datatype, min_value, max_value, bucket_count, expected) -> None:
+    assert _equi_width_thresholds(DBColumn("value", datatype, True), min_value, max_value, bucket_count) == expected
+
+
+_CREATE_TABLE = "CREATE TABLE events (id INTEGER PRIMARY KEY, quantity INTEGER, happened DATE, label VARCHAR(10))"
+
+
+def _statements(quantities):
+    return [_CREATE_TABLE] + [
+        f"INSERT INTO events VALUES ({index}, {quantity}, '{date(2024, 1, 1) + timedelta(days=index - 1)}', 'x')"
+        for index, quantity in enumerate(quantities, start=1)
+    ]
+
+
+def _validate(sqlite_databases, source_quantities, target_quantities):
+    config, table = sqlite_databases(_statements(source_quantities), _statements(target_quantities), "events", HistogramBuckets="4")
+    validator = DistributionValidator(config, table)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return validator, validator.validate(executor)
+
+
+def test_histograms_of_equal_columns_match(sqlite_databases) -> None:
+    validator, details = _validate(sqlite_databases, range(1, 101), range(1, 101))
+    assert details.result is ValidationResult.PASSED
+    # string columns have no histogram
+    assert [column.name for column in validator.histogram_columns] == ["id", "quantity", "happened"]
+    result_set = details.source_query_details.result_set
+    assert "quantity (-inf, 26): 25\nquantity [26, 51): 25\nquantity [51, 76): 25\nquantity [76, +inf): 25\n" in result_set
+    assert "happened (-inf, 2024-01-25): 24\n" in result_set
+
+
+def test_histograms_of_differently_distributed_columns_do_not_match(sqlite_databases) -> None:
+    # the same values are in the target database, except of one value moved to another bucket
+    _, details = _validate(sqlite_databases, range(1, 101), [90] + list(range(2, 101)))
+    assert details.result is ValidationResult.FAILED
+    assert "quantity (-inf, 26): 24\n" in details.target_query_details.result_set
+    assert "quantity [76, +inf): 26\n" in details.target_query_details.result_set
+
+
+def test_thresholds_are_derived_from_the_source_database(sqlite_databases) -> None:
+    # values outside the range of the source database fall into the outermost buckets of the target
+    # database, so the histograms match (the ranges are compared by the numeric validator)
+    _, details = _validate(sqlite_databases, range(1, 101), [-1000] + list(range(2, 100)) + [1000])
+    assert details.result is ValidationResult.PASSED
+    assert details.source_query_details.sql == details.target_query_details.sql
+    assert "quantity (-inf, 26): 25\n" in details.target_query_details.result_set
+    assert "quantity [76, +inf): 25\n" in details.target_query_details.result_set
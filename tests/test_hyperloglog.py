@@ -0,0 +1,77 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from base64 import b64encode
+from hashlib import md5
+from zlib import compress
+
+from pytest import raises
+
+from rdbmsdiff.data.hyperloglog import HyperLogLog
+
+
+def _digests(values):
+    return [md5(value.encode("UTF-8")).digest() for value in values]
+
+
+def _sketch(values) -> HyperLogLog:
+    sketch = HyperLogLog()
+    sketch.add_digests(_digests(values))
+    return sketch
+
+
+def test_estimate_is_within_the_error_bounds() -> None:
+    sketch = _sketch(f"value-{index}" for index in range(50_000))
+    # three standard errors
+    assert abs(sketch.estimate() - 50_000) <= 3 * sketch.relative_error * 50_000
+
+
+def test_small_cardinalities_are_estimated_accurately() -> None:
+    assert HyperLogLog().estimate() == 0
+    assert abs(_sketch(f"value-{index}" for index in range(100)).estimate() - 100) <= 2
+
+
+def test_duplicates_do_not_change_the_sketch() -> None:
+    values = [f"value-{index}" for index in range(1_000)]
+    assert _sketch(values) == _sketch(values * 3)
+
+
+def test_digests_and_hexadecimal_hashes_lead_to_the_same_sketch() -> None:
+    values = [f"value-{index}" for index in range(1_000)]
+    sketch = HyperLogLog()
+    for value in values:
+        # the database servers return uppercase hashes
+        sketch.add_hash(md5(value.encode("UTF-8")).hexdigest().upper())
+    assert sketch == _sketch(values)
+
+
+def test_merged_sketch_equals_the_sketch_of_the_union() -> None:
+    first_values = [f"value-{index}" for index in range(0, 3_000)]
+    second_values = [f"value-{index}" for index in range(2_000, 5_000)]
+    merged = _sketch(first_values).merge(_sketch(second_values))
+    assert merged == _sketch(first_values + second_values)
+
+
+def test_text_form_round_trip() -> None:
+    sketch = _sketch(f"value-{index}" for index in range(1_000))
+    assert HyperLogLog.from_text(sketch.to_text()) == sketch
+
+
+def test_text_form_with_wrong_number_of_registers_is_rejected() -> None:
+    with raises(ValueError):
+        HyperLogLog.from_text(b64encode(compress(bytes(10))).decode("ascii"))
@@ -0,0 +1,86 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+from rdbmsdiff.data.large_object_validator import LargeObjectValidator
+from rdbmsdiff.data.validation_details import ValidationResult
+
+
+_CREATE_TABLE = "CREATE TABLE documents (id INTEGER PRIMARY KEY, body TEXT)"
+
+_LENGTH = 10_000
+
+
+def _statements(*bodies: str):
+    return [_CREATE_TABLE] + [f"INSERT INTO documents VALUES ({index}, '{body}')" for index, body in enumerate(bodies, start=1)]
+
+
+def _body(middle: str = "m") -> str:
+    # the middle is neither covered by the hashes of the beginning nor by the hashes of the end
+    half = "a" * ((_LENGTH - len(middle)) // 2)
+    return half + middle + half
+
+
+def _validate(sqlite_databases, source_bodies, target_bodies, **validation_options: str):
+    config, table = sqlite_databases(_statements(*source_bodies), _statements(*target_bodies), "documents", **validation_options)
+    validator = LargeObjectValidator(config, table, table.columns_as_dict["body"])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return validator.validate(executor)
+
+
+def test_equal_values_pass_with_value_hashes(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, [_body(), "short"], [_body(), "short"])
+    assert details.result is ValidationResult.PASSED
+    assert "Value hashes:" in details.source_query_details.result_set
+    assert details.source_query_details.result_set == details.target_query_details.result_set
+
+
+def test_values_differing_in_the_middle_are_detected_by_value_hashes(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, [_body("x"), "short"], [_body("y"), "short"])
+    assert details.result is ValidationResult.FAILED
+    source_checks, source_hashes = details.source_query_details.result_set.split("Value hashes:")
+    target_checks, target_hashes = details.target_query_details.result_set.split("Value hashes:")
+    # the lengths and the hashes of the beginnings and the ends are equal, only the value hashes differ
+    assert source_checks == target_checks
+    assert source_hashes != target_hashes
+
+
+def test_values_exceeding_the_hash_limit_are_not_hashed(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, [_body("x"), "short"], [_body("y"), "short"], LargeObjectHashLimit=str(_LENGTH // 2))
+    assert details.result is ValidationResult.PASSED
+    assert "('1', None)" in details.source_query_details.result_set
+
+
+def test_value_hashes_are_skipped_if_the_cheap_checks_fail(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, [_body(), "short"], [_body(), "shorter"])
+    assert details.result is ValidationResult.FAILED
+    assert "Value hashes:" not in details.source_query_details.result_set
+    assert "Value hashes:" not in details.target_query_details.result_set
+
+
+def test_snapshot_query_includes_value_hashes(sqlite_databases) -> None:
+    config, table = sqlite_databases(_statements(_body()), ["CREATE TABLE documents (id INTEGER PRIMARY KEY)"], "documents")
+    validator = LargeObjectValidator(config, table, table.columns_as_dict["body"])
+    source_query = validator.run_query(config.source_db_config)
+    assert not source_query.error
+    assert "Value hashes:" in source_query.result_set
+    # the column is missing in the target database
+    target_query = validator.run_query(config.target_db_config)
+    assert target_query.error
+    assert "Value hashes:" not in target_query.result_set
@@ -0,0 +1,98 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import mark
+
+from rdbmsdiff.data.numeric_validator import NumericValidator
+from rdbmsdiff.data.validation_details import ValidationResult
+
+
+_CREATE_TABLE = "CREATE TABLE measurements (id INTEGER PRIMARY KEY, reading FLOAT, amount NUMERIC(10, 2), quantity INTEGER)"
+
+
+def _statements(*rows):
+    return [_CREATE_TABLE] + [f"INSERT INTO measurements VALUES ({index}, {reading}, {amount}, {quantity})" for index, (reading, amount, quantity) in enumerate(rows, start=1)]
+
+
+def _validate(sqlite_databases, source_rows, target_rows, column_name: str, **validation_options: str):
+    config, table = sqlite_databases(_statements(*source_rows), _statements(*target_rows), "measurements", **validation_options)
+    validator = NumericValidator(config, table, table.columns_as_dict[column_name])
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return validator.validate(executor)
+
+
+_ROWS = [(0.1, "1.10", 1), (0.2, "2.20", 2), (0.3, "3.30", 3)]
+
+
+@mark.parametrize("target_reading, expected", [
+    # differences in the last digits (e.g. different order of the additions) are tolerated
+    (0.30000000000001, ValidationResult.PASSED),
+    (0.3001, ValidationResult.FAILED),
+])
+def test_float_aggregates_are_compared_with_tolerance(sqlite_databases, target_reading, expected) -> None:
+    target_rows = _ROWS[:2] + [(target_reading, "3.30", 3)]
+    details = _validate(sqlite_databases, _ROWS, target_rows, "reading")
+    assert details.result is expected
+    assert "tolerance: 1e-09" in details.source_query_details.result_set
+
+
+def test_configured_tolerance_applies(sqlite_databases) -> None:
+    target_rows = _ROWS[:2] + [(0.3001, "3.30", 3)]
+    details = _validate(sqlite_databases, _ROWS, target_rows, "reading", NumericTolerance="0.001")
+    assert details.result is ValidationResult.PASSED
+
+
+def test_decimal_aggregates_are_compared_exactly(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, _ROWS, _ROWS, "amount")
+    assert details.result is ValidationResult.PASSED
+    # the sum is rounded to the scale of the column (SQLite provides decimals as floats)
+    assert "sum: 6.6\n" in details.source_query_details.result_set
+
+
+def test_decimal_aggregates_are_not_compared_with_tolerance(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, _ROWS, _ROWS[:2] + [(0.3, "3.31", 3)], "amount", NumericTolerance="0.1")
+    assert details.result is ValidationResult.FAILED
+
+
+def test_integer_aggregates_are_compared_exactly(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, _ROWS, _ROWS[:2] + [(0.3, "3.30", 4)], "quantity", NumericTolerance="0.5")
+    assert details.result is ValidationResult.FAILED
+    assert "checksum: 6\n" in details.source_query_details.result_set
+
+
+def test_null_aggregates_only_match_null(sqlite_databases) -> None:
+    details = _validate(sqlite_databases, [("NULL", "NULL", "NULL")], [(0.0, "NULL", "NULL")], "reading", NumericTolerance="0.5")
+    assert details.result is ValidationResult.FAILED
+
+
+def test_results_match() -> None:
+    def result_set(tolerance: str, sum_: str, percentile: str = "") -> str:
+        return f"category: FLOAT\ntolerance: {tolerance}\ncount: 3\nmin: 0.1\nmax: 0.3\nsum: {sum_}\n{percentile}"
+
+    assert NumericValidator.results_match(result_set("1e-09", "0.6"), result_set("1e-09", "0.6000000000000001"))
+    assert not NumericValidator.results_match(result_set("1e-09", "0.6"), result_set("1e-09", "0.61"))
+    # the larger of both tolerances applies
+    assert NumericValidator.results_match(result_set("1e-09", "0.6"), result_set("0.1", "0.61"))
+    # the percentiles are only compared if both databases have computed them
+    assert NumericValidator.results_match(result_set("1e-09", "0.6", "percentile_0.5: 0.2\n"), result_set("1e-09", "0.6"))
+    assert not NumericValidator.results_match(result_set("1e-09", "0.6", "percentile_0.5: 0.2\n"), result_set("1e-09", "0.6", "percentile_0.5: 0.25\n"))
+    # result-sets which cannot be parsed (e.g. failed queries) are compared as strings
+    assert NumericValidator.results_match("error", "error")
+    assert not NumericValidator.results_match("error", result_set("1e-09", "0.6"))
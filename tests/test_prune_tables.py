@@ -0,0 +1,68 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from rich.console import Console
+
+from rdbmsdiff.compareall.comparison import prune_tables
+from rdbmsdiff.foundation import read_db_meta_data
+from rdbmsdiff.recordcount.comparison import RecordCountComparison
+
+
+_SOURCE_STATEMENTS = [
+    "CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR(20), quantity INTEGER, note TEXT)",
+    "INSERT INTO items VALUES (1, 'apple', 3, 'fresh')",
+    "CREATE TABLE empty_in_both (id INTEGER PRIMARY KEY)",
+    "CREATE TABLE empty_in_source (id INTEGER PRIMARY KEY)",
+    "CREATE TABLE incomparable (code VARCHAR(10))",
+    "INSERT INTO incomparable VALUES ('a')",
+    "CREATE TABLE only_in_source (id INTEGER PRIMARY KEY)",
+]
+
+_TARGET_STATEMENTS = [
+    # the note column is missing, the quantity column is a string column
+    "CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR(50), quantity VARCHAR(10))",
+    "INSERT INTO items VALUES (1, 'apple', '3')",
+    "CREATE TABLE empty_in_both (id INTEGER PRIMARY KEY)",
+    "CREATE TABLE empty_in_source (id INTEGER PRIMARY KEY)",
+    "INSERT INTO empty_in_source VALUES (1)",
+    "CREATE TABLE incomparable (code INTEGER)",
+    "INSERT INTO incomparable VALUES (1)",
+]
+
+
+def test_prune_tables(sqlite_databases) -> None:
+    config, _ = sqlite_databases(_SOURCE_STATEMENTS, _TARGET_STATEMENTS, "items")
+    source_db_meta_data = read_db_meta_data(config.source_db_config)
+    target_db_meta_data = read_db_meta_data(config.target_db_config)
+    record_count_comparison = RecordCountComparison(config, Console(quiet=True))
+    record_count_comparison.run()
+
+    pruned_db_meta_data, skipped_tables = prune_tables(source_db_meta_data, target_db_meta_data, record_count_comparison.results)
+
+    assert skipped_tables == {
+        "empty_in_both": "empty in both databases",
+        "incomparable": "no comparable columns",
+    }
+    pruned_tables = {table.name: table for table in pruned_db_meta_data.tables}
+    # tables missing in the target database are kept, so that they are reported by the data comparison
+    assert sorted(pruned_tables) == ["empty_in_source", "items", "only_in_source"]
+    # columns missing in the target database or of another type category are not validated, columns of
+    # the same category (e.g. strings of different lengths) are
+    assert [column.name for column in pruned_tables["items"].columns] == ["id", "name"]
+    assert pruned_tables["empty_in_source"] == next(table for table in source_db_meta_data.tables if table.name == "empty_in_source")
+    assert pruned_db_meta_data.views == source_db_meta_data.views
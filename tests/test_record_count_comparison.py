@@ -0,0 +1,98 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from pytest import raises
+from rich.console import Console
+
+from rdbmsdiff.foundation import (
+    DatabaseRole,
+    Status,
+)
+from rdbmsdiff.recordcount import comparison as comparison_module
+from rdbmsdiff.recordcount.comparison import RecordCountComparison
+
+
+_CREATE_TABLE = "CREATE TABLE items (id INTEGER PRIMARY KEY)"
+
+
+def _statements(ids):
+    return [_CREATE_TABLE] + [f"INSERT INTO items VALUES ({id})" for id in ids]
+
+
+def _create_comparison(sqlite_databases, source_ids, target_ids, drill_down: bool = False, source_statements=(), target_statements=()) -> RecordCountComparison:
+    config, _ = sqlite_databases(_statements(source_ids) + list(source_statements), _statements(target_ids) + list(target_statements), "items")
+    return RecordCountComparison(config, Console(quiet=True), drill_down)
+
+
+def test_all_tables_are_counted_in_both_databases(sqlite_databases) -> None:
+    comparison = _create_comparison(
+        sqlite_databases,
+        range(1, 11),
+        range(1, 10),
+        source_statements=["CREATE TABLE only_source (id INTEGER)", "CREATE TABLE other (id INTEGER)", "INSERT INTO other VALUES (1)"],
+        target_statements=["CREATE TABLE only_target (id INTEGER)", "CREATE TABLE other (id INTEGER)", "INSERT INTO other VALUES (1)"],
+    )
+    comparison.run()
+    assert not comparison.interrupted
+    # the results are sorted by the table names, tables missing in one of the databases are only counted in the other one
+    assert [(result.table, result.source_record_count, result.target_record_count, result.status) for result in comparison.results] == [
+        ("items", 10, 9, Status.ERROR),
+        ("only_source", 0, None, Status.WARNING),
+        ("only_target", None, 0, Status.WARNING),
+        ("other", 1, 1, Status.OK),
+    ]
+    assert all(result.error is None for result in comparison.results)
+
+
+def test_tables_which_cannot_be_counted_are_reported(sqlite_databases, monkeypatch) -> None:
+    comparison = _create_comparison(
+        sqlite_databases,
+        range(1, 4),
+        range(1, 4),
+        source_statements=["CREATE TABLE broken (id INTEGER)"],
+        target_statements=["CREATE TABLE broken (id INTEGER)"],
+    )
+
+    def read_record_count(db_properties, table_name: str) -> int:
+        if table_name == "broken" and db_properties.role is DatabaseRole.TARGET:
+            raise RuntimeError("connection lost")
+        return original_read_record_count(db_properties, table_name)
+
+    original_read_record_count = comparison_module.read_record_count
+    monkeypatch.setattr(comparison_module, "read_record_count", read_record_count)
+    comparison.run()
+    # the failed table is reported, the other tables are counted anyway
+    results = {result.table: result for result in comparison.results}
+    assert results["items"].status is Status.OK
+    assert (results["broken"].source_record_count, results["broken"].target_record_count) == (0, None)
+    assert results["broken"].error == "target DB: connection lost"
+
+
+def test_executors_are_shut_down_if_the_drill_down_fails(sqlite_databases, monkeypatch) -> None:
+    comparison = _create_comparison(sqlite_databases, range(1, 11), range(1, 10), drill_down=True)
+
+    def fail() -> None:
+        raise RuntimeError("drill-down failed")
+
+    monkeypatch.setattr(comparison, "_drill_down_differences", fail)
+    with raises(RuntimeError):
+        comparison.run()
+    # an executor which has been shut down rejects new tasks
+    for executor in (comparison._executor, comparison._segment_executor):
+        with raises(RuntimeError, match="after shutdown"):
+            executor.submit(print)
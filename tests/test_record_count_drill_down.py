@@ -0,0 +1,97 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.console import Console
+
+from rdbmsdiff.recordcount.comparison import (
+    RecordCountComparison,
+    read_record_count,
+)
+from rdbmsdiff.recordcount.drill_down import RecordCountDrillDown
+
+
+_CREATE_TABLE = "CREATE TABLE items (id INTEGER PRIMARY KEY)"
+
+# larger than the threshold of key ranges whose keys are read instead of being bisected
+_RECORD_COUNT = 5000
+
+
+def _statements(*changes: str):
+    return [
+        _CREATE_TABLE,
+        f"INSERT INTO items WITH RECURSIVE seq(id) AS (SELECT 1 UNION ALL SELECT id + 1 FROM seq WHERE id < {_RECORD_COUNT}) SELECT id FROM seq",
+    ] + list(changes)
+
+
+def _drill_down(sqlite_databases, source_changes, target_changes):
+    config, _ = sqlite_databases(_statements(*source_changes), _statements(*target_changes), "items")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        drill_down = RecordCountDrillDown(config, executor)
+        source_count = read_record_count(config.source_db_config, "items")
+        target_count = read_record_count(config.target_db_config, "items")
+        return drill_down.drill_down("items", source_count, target_count)
+
+
+def test_differing_keys_are_localized_by_bisection(sqlite_databases) -> None:
+    differences = _drill_down(
+        sqlite_databases,
+        ["DELETE FROM items WHERE id = 4200"],
+        ["DELETE FROM items WHERE id IN (10, 1800)"],
+    )
+    assert [(difference.missing_in_source, difference.missing_in_target) for difference in differences] == [
+        ((), (10,)),
+        ((), (1800,)),
+        ((4200,), ()),
+    ]
+    for difference in differences:
+        # the ranges are small enough to read their keys, and they contain the differing keys
+        assert difference.key_range.size <= 1000
+        for key in difference.missing_in_source + difference.missing_in_target:
+            assert difference.key_range.lower <= key < difference.key_range.upper
+        expected_difference = len(difference.missing_in_target) - len(difference.missing_in_source)
+        assert difference.source_record_count - difference.target_record_count == expected_difference
+
+
+def test_differences_in_upper_halves_are_found_by_remainders(sqlite_databases) -> None:
+    # just the lower halves are counted, the counts of the upper halves are derived from the counts of the whole ranges
+    differences = _drill_down(sqlite_databases, [], ["DELETE FROM items WHERE id = 5000"])
+    assert [(difference.key_range.upper, difference.source_record_count - difference.target_record_count, difference.missing_in_target) for difference in differences] == [(5001, 1, (5000,))]
+
+
+def test_compensating_differences_within_a_range_are_not_detected(sqlite_databases) -> None:
+    differences = _drill_down(sqlite_databases, ["DELETE FROM items WHERE id = 20"], ["DELETE FROM items WHERE id IN (21, 4000)"])
+    # keys 20 and 21 are in the same range whose record counts are equal, just key 4000 is localized
+    assert [difference.missing_in_target for difference in differences] == [(4000,)]
+    assert differences[0].missing_in_source == ()
+
+
+def test_comparison_drills_down_differing_tables(sqlite_databases) -> None:
+    config, _ = sqlite_databases(_statements(), _statements("DELETE FROM items WHERE id = 1234"), "items")
+    comparison = RecordCountComparison(config, Console(quiet=True), drill_down=True)
+    comparison.run()
+    [result] = comparison.results
+    assert [difference.missing_in_target for difference in result.range_differences] == [(1234,)]
+
+
+def test_tables_without_integer_key_are_not_drilled_down(sqlite_databases) -> None:
+    create_table = "CREATE TABLE items (id VARCHAR(10) PRIMARY KEY)"
+    config, _ = sqlite_databases([create_table, "INSERT INTO items VALUES ('a')"], [create_table], "items")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert RecordCountDrillDown(config, executor).drill_down("items", 1, 0) == ()
@@ -0,0 +1,87 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+from rdbmsdiff.data.record_validator import RecordValidator
+from rdbmsdiff.data.validation_details import ValidationResult
+
+
+_CREATE_TABLE = "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"
+
+
+def _statements(ids):
+    return [_CREATE_TABLE] + [f"INSERT INTO items VALUES ({id}, 'item {id}')" for id in ids]
+
+
+def _validate(sqlite_databases, source_ids, target_ids, **validation_options: str):
+    config, table = sqlite_databases(_statements(source_ids), _statements(target_ids), "items", **validation_options)
+    validator = RecordValidator(config, table)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return validator, validator.validate(executor)
+
+
+def _sampled_keys(result_set: str):
+    return [line.split("'")[1] for line in result_set.splitlines() if line.startswith("('")]
+
+
+def test_windows_do_not_overlap(sqlite_databases) -> None:
+    ids = range(1, 101)
+    _, details = _validate(sqlite_databases, ids, ids, Limit="10", RecordWindows="5")
+    assert details.result is ValidationResult.PASSED
+    sampled_keys = _sampled_keys(details.source_query_details.result_set)
+    assert len(sampled_keys) == 10
+    assert len(set(sampled_keys)) == len(sampled_keys)
+    # the first and the last records are always sampled
+    assert "1" in sampled_keys and "100" in sampled_keys
+
+
+def test_missing_record_only_affects_its_own_window(sqlite_databases) -> None:
+    source_ids = list(range(1, 101))
+    target_ids = [id for id in source_ids if id != 2]
+    validator, details = _validate(sqlite_databases, source_ids, target_ids, Limit="10", RecordWindows="5")
+    assert details.result is ValidationResult.FAILED
+    source_keys = _sampled_keys(details.source_query_details.result_set)
+    target_keys = _sampled_keys(details.target_query_details.result_set)
+    first_bound = validator._get_window_bounds()[0]
+    # the samples of all windows except the first one are equal
+    assert [key for key in source_keys if int(key) >= first_bound] == [key for key in target_keys if int(key) >= first_bound]
+    assert any(difference.key == ("2",) and difference.missing_in_target for difference in details.record_differences)
+
+
+def test_keys_sampled_in_one_database_only_are_looked_up_in_the_other_one(sqlite_databases) -> None:
+    source_ids = list(range(1, 101))
+    target_ids = [id for id in source_ids if id != 3]
+    # the target sample contains record 11 which is not part of the source sample, but exists in the source
+    _, details = _validate(sqlite_databases, source_ids, target_ids, Limit="10", RecordWindows="1")
+    assert details.result is ValidationResult.FAILED
+    assert "'11'" in details.target_query_details.result_set
+    assert "'11'" not in details.source_query_details.result_set
+    assert [(difference.key, difference.missing_in_source, difference.missing_in_target) for difference in details.record_differences] == [(("3",), False, True)]
+
+
+def test_differing_columns_are_drilled_down(sqlite_databases) -> None:
+    ids = range(1, 101)
+    target_statements = _statements(ids) + ["UPDATE items SET name = 'changed' WHERE id = 5"]
+    config, table = sqlite_databases(_statements(ids), target_statements, "items", Limit="10", RecordWindows="1")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        details = RecordValidator(config, table).validate(executor)
+    assert details.result is ValidationResult.FAILED
+    [difference] = details.record_differences
+    assert difference.key == ("5",)
+    assert [(column.column_name, column.source_value, column.target_value) for column in difference.column_differences] == [("name", "item 5", "changed")]
@@ -0,0 +1,61 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from rdbmsdiff.data.report import Report
+from rdbmsdiff.data.validation_details import (
+    ColumnValidationDetails,
+    RecordDifference,
+    TableValidationDetails,
+    ValidationQuery,
+    ValidationResult,
+)
+
+
+def _details(result: ValidationResult, description: str, source_rows: str, target_rows: str, **kwargs) -> ColumnValidationDetails:
+    return ColumnValidationDetails(
+        result=result,
+        validator_description=description,
+        source_query_details=ValidationQuery(sql=f"SELECT {description}", result_set=source_rows),
+        target_query_details=ValidationQuery(sql=f"SELECT {description}", result_set=target_rows),
+        **kwargs,
+    )
+
+
+def test_payloads_of_passed_validations_are_released_once_written(tmp_path) -> None:
+    passed = _details(ValidationResult.PASSED, "passed validation", "passed rows", "passed rows")
+    failed = _details(ValidationResult.FAILED, "failed validation", "source rows", "target rows", record_differences=(RecordDifference(key=("1",), missing_in_target=True),))
+    report_file = tmp_path / "report.txt"
+    report = Report(str(report_file))
+    try:
+        retained = report.add_validation_details(TableValidationDetails("items", (passed, failed)))
+    finally:
+        report.close()
+
+    # the report contains the payloads of all validations
+    content = report_file.read_text()
+    for expected in ("SELECT passed validation", "passed rows", "source rows", "target rows", "Key (1): missing in target DB"):
+        assert expected in content
+
+    released, unchanged = retained.column_validations_details
+    assert released.result is ValidationResult.PASSED
+    assert released.validator_description == passed.validator_description
+    assert released.source_query_details.result_set == "" and released.target_query_details.result_set == ""
+    assert released.source_query_details.sql == "" and released.target_query_details.sql == ""
+    assert unchanged is failed
+    assert (retained.overall_validation_count, retained.failed_validation_count) == (2, 1)
+    assert report.get_statistics().failed_validation_count == 1
@@ -0,0 +1,86 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import mark
+from rich.console import Console
+
+from rdbmsdiff.recordcount.comparison import RecordCountComparison
+from rdbmsdiff.recordcount.segmented_count import (
+    KeyRange,
+    count_records_by_segments,
+    find_segmentation_key,
+    read_key_range,
+    split_key_range,
+)
+
+
+_SEGMENTATION = "[RecordCount]\nSegments = 4\nSegmentThreshold = 0\n"
+
+
+@mark.parametrize("key_range, count, expected", [
+    (KeyRange(0, 8), 4, [(0, 2), (2, 4), (4, 6), (6, 8)]),
+    # the remainder is spread over the segments
+    (KeyRange(0, 10), 4, [(0, 2), (2, 5), (5, 7), (7, 10)]),
+    (KeyRange(-5, 5), 2, [(-5, 0), (0, 5)]),
+    # a range is never split into more segments than it has keys
+    (KeyRange(7, 10), 5, [(7, 8), (8, 9), (9, 10)]),
+    (KeyRange(3, 4), 4, [(3, 4)]),
+    (KeyRange(0, 100), 1, [(0, 100)]),
+])
+def test_split_key_range(key_range, count, expected) -> None:
+    segments = split_key_range(key_range, count)
+    assert [(segment.lower, segment.upper) for segment in segments] == expected
+    assert sum(segment.size for segment in segments) == key_range.size
+
+
+def _statements(ids, create_table: str = "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"):
+    return [create_table] + [f"INSERT INTO items (id) VALUES ({id})" for id in ids]
+
+
+def test_records_are_counted_by_segments(sqlite_databases) -> None:
+    ids = [-7, -3, 0, 1, 2, 50, 51, 99, 1000]
+    config, _ = sqlite_databases(_statements(ids), _statements([]), "items", _SEGMENTATION)
+    db_properties = config.source_db_config
+    key_column = find_segmentation_key(db_properties, "items", config.record_count_properties)
+    assert key_column == "id"
+    # the upper bound of the key range is exclusive
+    assert read_key_range(db_properties, "items", key_column) == KeyRange(-7, 1001)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert count_records_by_segments(db_properties, "items", key_column, 4, executor) == len(ids)
+        assert count_records_by_segments(config.target_db_config, "items", key_column, 4, executor) == 0
+
+
+def test_tables_without_integer_key_are_not_segmented(sqlite_databases) -> None:
+    create_table = "CREATE TABLE items (id VARCHAR(10) PRIMARY KEY, name TEXT)"
+    config, _ = sqlite_databases(_statements([], create_table), _statements([], create_table), "items", _SEGMENTATION)
+    assert find_segmentation_key(config.source_db_config, "items", config.record_count_properties) is None
+
+
+def test_segmentation_can_be_disabled(sqlite_databases) -> None:
+    config, _ = sqlite_databases(_statements([1]), _statements([1]), "items", "[RecordCount]\nSegments = 1\n")
+    assert find_segmentation_key(config.source_db_config, "items", config.record_count_properties) is None
+
+
+def test_comparison_counts_segmented_tables(sqlite_databases) -> None:
+    config, _ = sqlite_databases(_statements(range(1, 101)), _statements(range(2, 100, 2)), "items", _SEGMENTATION)
+    comparison = RecordCountComparison(config, Console(quiet=True))
+    comparison.run()
+    [result] = comparison.results
+    assert (result.source_record_count, result.target_record_count) == (100, 49)
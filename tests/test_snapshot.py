@@ -0,0 +1,123 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from gzip import open as gzip_open
+
+from pytest import raises
+
+from rdbmsdiff.data.report import Report
+from rdbmsdiff.data.snapshot import (
+    DatabaseSnapshot,
+    ReadSnapshotError,
+    TableSnapshot,
+    ValidationSnapshot,
+    create_snapshot,
+    diff_snapshots,
+    read_snapshot,
+    write_snapshot,
+)
+from rdbmsdiff.data.validation_details import ValidationQuery
+from rdbmsdiff.foundation import read_db_meta_data
+
+
+_CREATE_TABLE = "CREATE TABLE items (id INTEGER PRIMARY KEY NOT NULL, name VARCHAR(20) NOT NULL, price FLOAT NOT NULL)"
+
+
+def _statements(*rows):
+    return [_CREATE_TABLE] + [f"INSERT INTO items VALUES ({id}, '{name}', {price})" for id, name, price in rows]
+
+
+_ROWS = [(1, "apple", 1.5), (2, "pear", 2.25), (3, "plum", 0.75)]
+
+
+def _create_snapshots(sqlite_databases, source_rows, target_rows):
+    config, _ = sqlite_databases(_statements(*source_rows), _statements(*target_rows), "items")
+    return tuple(
+        create_snapshot(db_properties, read_db_meta_data(db_properties), config.validation_properties)
+        for db_properties in (config.source_db_config, config.target_db_config)
+    )
+
+
+def _diff(tmp_path, source_snapshot: DatabaseSnapshot, target_snapshot: DatabaseSnapshot):
+    report = Report(str(tmp_path / "report.txt"))
+    try:
+        diff_snapshots(source_snapshot, target_snapshot, report)
+    finally:
+        report.close()
+    return report.get_statistics(), (tmp_path / "report.txt").read_text()
+
+
+def test_snapshot_survives_round_trip(sqlite_databases, tmp_path) -> None:
+    snapshot, _ = _create_snapshots(sqlite_databases, _ROWS, _ROWS)
+    assert [validation.validator for validation in snapshot.tables[0].validations].count("RecordValidator") == 1
+    filename = str(tmp_path / "snapshot.json.gz")
+    write_snapshot(snapshot, filename)
+    assert read_snapshot(filename) == snapshot
+
+
+def test_snapshots_of_equal_databases_match(sqlite_databases, tmp_path) -> None:
+    source_snapshot, target_snapshot = _create_snapshots(sqlite_databases, _ROWS, _ROWS)
+    statistics, _ = _diff(tmp_path, source_snapshot, target_snapshot)
+    assert statistics.overall_validation_count == len(source_snapshot.tables[0].validations)
+    assert statistics.failed_validation_count == 0
+
+
+def test_snapshots_of_differing_databases_do_not_match(sqlite_databases, tmp_path) -> None:
+    target_rows = [(1, "apple", 1.5), (2, "peach", 2.25), (3, "plum", 0.75)]
+    source_snapshot, target_snapshot = _create_snapshots(sqlite_databases, _ROWS, target_rows)
+    statistics, content = _diff(tmp_path, source_snapshot, target_snapshot)
+    assert statistics.failed_validation_count > 0
+    assert "items - RecordValidator" in content
+
+
+def _snapshot(*validations: ValidationSnapshot) -> DatabaseSnapshot:
+    return DatabaseSnapshot(url="sqlite://", schema="main", created="2025-01-01T00:00:00", tables=(TableSnapshot(name="items", validations=validations),))
+
+
+def _numeric_validation(price_sum: str) -> ValidationSnapshot:
+    result_set = f"category: FLOAT\ntolerance: 1e-09\ncount: 3\nmin: 0.75\nmax: 2.25\nsum: {price_sum}\n"
+    return ValidationSnapshot(key="price", validator="NumericValidator", description="items.price - NumericValidator", query=ValidationQuery(sql="SELECT ...", result_set=result_set))
+
+
+def test_snapshots_are_compared_by_the_results_match_of_the_validator(tmp_path) -> None:
+    # the sums of floating point columns are compared with tolerance, not as strings
+    statistics, _ = _diff(tmp_path, _snapshot(_numeric_validation("4.5")), _snapshot(_numeric_validation("4.500000000000001")))
+    assert statistics.failed_validation_count == 0
+    statistics, _ = _diff(tmp_path, _snapshot(_numeric_validation("4.5")), _snapshot(_numeric_validation("4.6")))
+    assert statistics.failed_validation_count == 1
+
+
+def test_validation_missing_in_target_snapshot_fails(tmp_path) -> None:
+    statistics, content = _diff(tmp_path, _snapshot(_numeric_validation("4.5")), _snapshot())
+    assert statistics.failed_validation_count == 1
+    assert "validation missing in the snapshot" in content
+
+
+def test_table_missing_in_target_snapshot_is_reported(tmp_path) -> None:
+    target_snapshot = DatabaseSnapshot(url="sqlite://", schema="main", created="2025-01-01T00:00:00", tables=())
+    statistics, content = _diff(tmp_path, _snapshot(_numeric_validation("4.5")), target_snapshot)
+    assert statistics.failed_table_count == 1
+    assert "table missing in the target database" in content
+
+
+def test_snapshot_of_unsupported_format_version_is_rejected(tmp_path) -> None:
+    filename = str(tmp_path / "snapshot.json.gz")
+    with gzip_open(filename, "wt", encoding="UTF-8") as file:
+        file.write('{"format_version": 0}')
+    with raises(ReadSnapshotError, match="unsupported format version"):
+        read_snapshot(filename)
@@ -0,0 +1,90 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from hashlib import md5
+from random import Random
+
+from rdbmsdiff.data.spill_store import (
+    SpillStore,
+    compare_stores,
+)
+
+
+def _row_hash(value: str) -> bytes:
+    return md5(value.encode("UTF-8")).digest()
+
+
+def _fill(store: SpillStore, records) -> SpillStore:
+    for key, value in records:
+        store.add(key, _row_hash(value))
+    store.finish()
+    return store
+
+
+def test_records_are_sorted_across_several_runs(tmp_path) -> None:
+    records = [((str(index),), f"value-{index}") for index in range(1_000)]
+    Random(42).shuffle(records)
+    # 1,000 records in runs of 64 records need 16 runs to be merged
+    with _fill(SpillStore(str(tmp_path), run_length=64), records) as store:
+        stored = list(store)
+        assert len(store) == len(stored) == 1_000
+        assert [record[0] for record in stored] == sorted(record[0] for record in stored)
+        assert {store.key(record[2]) for record in stored} == {key for key, _ in records}
+
+
+def test_digest_does_not_depend_on_the_order_of_the_records(tmp_path) -> None:
+    records = [((str(index), "x"), f"value-{index}") for index in range(500)]
+    shuffled_records = list(records)
+    Random(7).shuffle(shuffled_records)
+    with _fill(SpillStore(str(tmp_path), run_length=50), records) as first_store:
+        with _fill(SpillStore(str(tmp_path), run_length=1_000), shuffled_records) as second_store:
+            assert first_store.digest == second_store.digest
+            assert list(compare_stores(first_store, second_store)) == []
+
+
+def test_comparison_yields_missing_and_differing_records(tmp_path) -> None:
+    source_records = [((str(index),), f"value-{index}") for index in range(300)]
+    target_records = [((str(index),), "changed" if index == 150 else f"value-{index}") for index in range(1, 301)]
+    Random(3).shuffle(target_records)
+    with _fill(SpillStore(str(tmp_path), run_length=32), source_records) as source_store:
+        with _fill(SpillStore(str(tmp_path), run_length=32), target_records) as target_store:
+            missing_in_target, missing_in_source, differing = [], [], []
+            for source_record, target_record in compare_stores(source_store, target_store):
+                if target_record is None:
+                    missing_in_target.append(source_store.key(source_record[2]))
+                elif source_record is None:
+                    missing_in_source.append(target_store.key(target_record[2]))
+                else:
+                    differing.append(source_store.key(source_record[2]))
+            assert missing_in_target == [("0",)]
+            assert missing_in_source == [("300",)]
+            assert differing == [("150",)]
+            assert source_store.digest != target_store.digest
+
+
+def test_empty_stores_are_equal(tmp_path) -> None:
+    with _fill(SpillStore(str(tmp_path)), []) as first_store, _fill(SpillStore(str(tmp_path)), []) as second_store:
+        assert len(first_store) == 0
+        assert first_store.digest == second_store.digest
+        assert list(compare_stores(first_store, second_store)) == []
+
+
+def test_files_are_deleted_when_the_store_is_closed(tmp_path) -> None:
+    with _fill(SpillStore(str(tmp_path), run_length=10), [((str(index),), "value") for index in range(100)]):
+        assert len(list(tmp_path.iterdir())) == 1
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,37 @@
+#
+# Copyright 2025 Jaroslav Chmurny
+#
+# This file is part of RDBMS Diff.
+#
+# RDBMS Diff is free software licensed under the Apache License,
+# Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License. You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from rdbmsdiff.data.validation_engine import create_validators
+
+
+_CREATE_TABLE = "CREATE TABLE documents (id INTEGER PRIMARY KEY NOT NULL, title VARCHAR(100) NOT NULL, body TEXT NOT NULL)"
+
+
+def _column_validators(sqlite_databases, **validation_options: str):
+    config, table = sqlite_databases([_CREATE_TABLE], [_CREATE_TABLE], "documents", **validation_options)
+    result = {}
+    for validator in create_validators(config, table):
+        if validator.column is not None:
+            result.setdefault(validator.column.name, set()).add(type(validator).__name__)
+    return result
+
+
+def test_large_objects_are_only_compared_by_the_large_object_validator(sqlite_databases) -> None:
+    validators = _column_validators(sqlite_databases, DistinctCountSketches="yes")
+    assert validators["body"] == {"LargeObjectValidator"}
+    assert validators["title"] == {"VarcharLengthValidator", "VarcharValueValidator", "DistinctCountValidator"}